@@ -0,0 +1,101 @@
+# benchmarks/api_throughput.py
+"""REST API saniyedeki istek sayısı (cache isabeti, 304 ve cache'siz senaryolar)
+
+API ayrı bir süreçte başlatılır; istemci aynı makinede eşzamanlı bağlantılarla
+belirtilen süre boyunca istek gönderir. Kullanım:
+
+    python benchmarks/api_throughput.py [--db data/football_data.db] [--seconds 5] [--concurrency 64]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_PATH = os.path.join(ROOT, 'src', 'api', 'server.py')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(base_url, timeout=30):
+    deadline = time.perf_counter() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.perf_counter() < deadline:
+            try:
+                async with session.get(f'{base_url}/health') as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.1)
+    raise RuntimeError("API başlatılamadı")
+
+
+async def load(base_url, paths, seconds, concurrency, conditional):
+    """Süre boyunca istek gönder; (istek sayısı, durum kodları) döndür"""
+    counts = {}
+    etags = {}
+    deadline = time.perf_counter() + seconds
+
+    async def worker(session, offset):
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            headers = {'If-None-Match': etags[path]} if conditional and path in etags else {}
+            async with session.get(base_url + path, headers=headers) as response:
+                await response.read()
+                counts[response.status] = counts.get(response.status, 0) + 1
+                etags[path] = response.headers.get('ETag', '')
+            i += 1
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(*(worker(session, i) for i in range(concurrency)))
+    return counts
+
+
+def run_scenario(name, db_path, paths, seconds, concurrency, conditional=False, cache_size=1024):
+    port = free_port()
+    server = subprocess.Popen([sys.executable, SERVER_PATH, '--db', db_path, '--port', str(port),
+                               '--cache-size', str(cache_size)],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        asyncio.run(wait_ready(base_url))
+        counts = asyncio.run(load(base_url, paths, seconds, concurrency, conditional))
+    finally:
+        server.terminate()
+        server.wait()
+
+    total = sum(counts.values())
+    print(f"  {name:24s} {total / seconds:10,.0f} istek/sn  {counts}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=os.path.join(ROOT, 'data', 'football_data.db'))
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--concurrency', type=int, default=64)
+    args = parser.parse_args()
+
+    import sqlite3
+    conn = sqlite3.connect(args.db)
+    season_ids = [row[0] for row in conn.execute("SELECT season_id FROM seasons")]
+    conn.close()
+
+    paths = ['/seasons'] + [f'/seasons/{sid}/{endpoint}' for sid in season_ids
+                            for endpoint in ('standings', 'matches', 'team-stats')]
+
+    print(f"\n⏱️ API verimi ({args.seconds:.0f} sn, {args.concurrency} eşzamanlı bağlantı, {len(paths)} farklı yol):")
+    run_scenario("cache isabeti", args.db, paths, args.seconds, args.concurrency)
+    run_scenario("If-None-Match (304)", args.db, paths, args.seconds, args.concurrency, conditional=True)
+    run_scenario("cache kapalı", args.db, paths, args.seconds, args.concurrency, cache_size=0)
@@ -0,0 +1,116 @@
+# benchmarks/cli_startup.py
+"""football-etl açılış süresi (-X importtime ve duvar saati)
+
+Her komut ayrı bir süreçte `python -X importtime -m src.cli ...` olarak
+çalıştırılır. Yorumlayıcının kendi açılışı (site ve .pth dosyaları) çıkarılarak
+projenin yüklediği modüllerin süresi ve boş bir yorumlayıcıya göre duvar saati
+farkı raporlanır; fark bütçeyi aşarsa çıkış kodu 1 olur. inspect ve run --status
+sentetik ham dosyaların olduğu geçici bir veri klasöründe çalışır.
+
+Kullanım:
+
+    python benchmarks/cli_startup.py [--repeat 7] [--budget-ms 100]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from src.extractors.mock_server import synthetic_payloads
+
+# Hafif komutlar: yardım metinleri, checkpoint durumu ve cache'ten şema raporu
+COMMANDS = [
+    ['--help'],
+    ['extract', '--help'],
+    ['transform', '--help'],
+    ['load', '--help'],
+    ['run', '--help'],
+    ['inspect', '--help'],
+    ['run', '--status'],
+    ['inspect'],
+]
+
+
+def parse_importtime(stderr):
+    """site'tan sonra yüklenen üst düzey modüller: [(modül, kümülatif µs)]"""
+    modules, after_site = [], False
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name.startswith('  '):
+            continue  # Üst düzey olmayan (başka bir modülün içinden yüklenen) modül
+        if name.strip() == 'site':
+            after_site = True
+        elif after_site:
+            modules.append((name.strip(), int(cumulative)))
+    return modules
+
+
+def measure(args, data_dir, repeat):
+    """Medyan duvar saati (ms), importtime toplamı (ms) ve en ağır üst düzey modül"""
+    command = [sys.executable, '-X', 'importtime', '-m', 'src.cli', '--data-dir', data_dir, *args]
+    walls, imports = [], []
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=ROOT, capture_output=True, text=True)
+        walls.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)}: {result.stderr.strip().splitlines()[-1]}")
+        modules = parse_importtime(result.stderr)
+        imports.append(sum(us for _, us in modules) / 1000)
+    # İlk çalıştırma .pyc dosyalarını yazar; ölçüme katılmaz
+    heaviest = max(modules, key=lambda m: m[1])[0] if modules else '-'
+    return statistics.median(walls[1:]), statistics.median(imports[1:]), heaviest
+
+
+def bare_interpreter(repeat):
+    walls = []
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], capture_output=True)
+        walls.append((time.perf_counter() - start) * 1000)
+    return statistics.median(walls[1:])
+
+
+def make_data_dir(data_dir):
+    raw_path = os.path.join(data_dir, 'raw')
+    os.makedirs(raw_path)
+    for code, season in [('PL', 2022), ('PL', 2023), ('PD', 2023)]:
+        for kind, data in synthetic_payloads(code, season).items():
+            with open(os.path.join(raw_path, f"{code}_{kind}_{season}_20240101_000000.json"), 'w',
+                      encoding='utf-8') as f:
+                json.dump(data, f)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=7)
+    parser.add_argument('--budget-ms', type=float, default=100, help="Boş yorumlayıcıya göre izin verilen fark")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        make_data_dir(data_dir)
+        bare = bare_interpreter(args.repeat)
+        print(f"\n⏱️ football-etl açılışı, medyan / {args.repeat} tekrar "
+              f"(boş yorumlayıcı: {bare:.0f} ms, bütçe: +{args.budget_ms:.0f} ms)")
+        print(f"  {'komut':24s}{'importlar':>12s}{'duvar':>10s}{'fark':>10s}   en ağır modül")
+
+        over_budget = []
+        for command in COMMANDS:
+            wall, imports, heaviest = measure(command, data_dir, args.repeat)
+            status = '✅' if wall - bare < args.budget_ms else '❌'
+            if status == '❌':
+                over_budget.append(' '.join(command))
+            print(f"  {' '.join(command):24s}{imports:9.1f} ms{wall:7.0f} ms{wall - bare:+7.0f} ms {status} {heaviest}")
+
+    if over_budget:
+        print(f"❌ Hata: bütçeyi aşan komutlar: {', '.join(over_budget)}")
+        sys.exit(1)
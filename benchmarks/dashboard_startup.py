@@ -0,0 +1,83 @@
+# benchmarks/dashboard_startup.py
+"""Dashboard ilk açılış (first paint) ve yeniden çalıştırma (rerun) süreleri
+
+Her ölçüm yeni bir Python sürecinde yapılır; böylece import maliyeti ve
+Streamlit cache'lerinin boş olduğu soğuk başlangıç ölçülür. Kullanım:
+
+    python benchmarks/dashboard_startup.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, 'dashboard', 'app.py')
+
+# Alt süreçte çalışan ölçüm kodu
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+# Sayfa başlığının (<h1>) üretildiği an = first paint. Sunucuda Streamlit zaten
+# yüklü olduğu için süre, script'in çalışmaya başladığı andan ölçülür
+marks = {}
+_markdown = st.markdown
+def markdown(body, *args, **kwargs):
+    if '<h1' in str(body):
+        marks.setdefault('first_paint', time.perf_counter() - run_start)
+    return _markdown(body, *args, **kwargs)
+st.markdown = markdown
+
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+run_start = time.perf_counter()
+at.run()
+assert not at.exception, [e.value for e in at.exception]
+
+pages = at.sidebar.radio[0].options
+timings = {'first_paint': marks['first_paint'], 'first_run': time.perf_counter() - run_start}
+
+# Her sayfayı bir kez aç (soğuk), sonra ana sayfaya dönüp tekrar aç (sıcak rerun)
+for page in pages:
+    t = time.perf_counter()
+    at.sidebar.radio[0].set_value(page).run()
+    timings[f'cold:{page}'] = time.perf_counter() - t
+
+for page in pages:
+    t = time.perf_counter()
+    at.sidebar.radio[0].set_value(page).run()
+    timings[f'rerun:{page}'] = time.perf_counter() - t
+
+print(json.dumps(timings))
+'''
+
+
+def measure(runs, app_path=APP_PATH):
+    """Her çalıştırma için ayrı süreç başlat ve süreleri topla"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, '-c', PROBE, app_path], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout
+        timings = json.loads(output.strip().splitlines()[-1])
+        timings['process_total'] = time.perf_counter() - start
+        samples.append(timings)
+    return samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--app', default=APP_PATH, help="Ölçülecek Streamlit dosyası")
+    args = parser.parse_args()
+
+    samples = measure(args.runs, args.app)
+
+    print(f"\n⏱️ Dashboard süreleri (medyan, {args.runs} çalıştırma, ms):")
+    for key in samples[0]:
+        print(f"  {key:40s} {statistics.median(s[key] for s in samples) * 1000:8.1f}")
@@ -0,0 +1,67 @@
+# benchmarks/extractor_backoff.py
+"""Backfill'in kota ve hata altındaki davranışı (yerel mock football-data sunucusuyla)
+
+Her senaryoda mock sunucu aynı süreçte başlatılır ve backfill geçici bir
+klasöre indirip yükler. Kota penceresi kısaltılır (--window), böylece dakikalık
+kota saniyeler içinde test edilir. Kullanım:
+
+    python benchmarks/extractor_backoff.py [--competitions PL PD SA] [--seasons 2021-2023] [--quota 10] [--window 2]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from src.extractors.football_data_extractor import FootballDataExtractor
+from src.extractors.mock_server import MockFootballDataServer
+from src.pipeline.backfill import Backfill, CheckpointStore, parse_seasons
+
+
+def run_scenario(name, competitions, seasons, request_delay, **server_options):
+    with tempfile.TemporaryDirectory() as tmp, MockFootballDataServer(**server_options) as server:
+        extractor = FootballDataExtractor(base_url=server.base_url, api_key='benchmark',
+                                          raw_path=os.path.join(tmp, 'raw'), request_delay=0)
+        backfill = Backfill(competitions, seasons, db_path=os.path.join(tmp, 'football_data.db'),
+                            checkpoint_path=os.path.join(tmp, 'checkpoint.db'), request_delay=request_delay,
+                            extractor=extractor, snapshot_dir=os.path.join(tmp, 'snapshot'))
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            backfill.run()
+        elapsed = time.perf_counter() - start
+
+        store = CheckpointStore(os.path.join(tmp, 'checkpoint.db'))
+        summary = store.summary()
+        store.close()
+
+    requests_sent = sum(server.stats.values())
+    print(f"  {name:28s} {elapsed:6.1f} sn  {requests_sent:4d} istek  {dict(sorted(server.stats.items()))}  {summary}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--competitions', nargs='+', default=['PL', 'PD', 'SA'])
+    parser.add_argument('--seasons', nargs='+', default=['2021-2023'])
+    parser.add_argument('--quota', type=int, default=10, help="Pencere başına istek hakkı")
+    parser.add_argument('--window', type=float, default=2.0, help="Kota penceresi (saniye)")
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--error-rate', type=float, default=0.1)
+    args = parser.parse_args()
+
+    seasons = parse_seasons(args.seasons)
+    units = len(args.competitions) * len(seasons) * 4
+    # Pencere sınırındaki zamanlama farkları için %10 pay
+    paced = args.window / args.quota * 1.1
+    print(f"\n⏱️ Backfill: {units} birim, kota {args.quota} istek / {args.window:g} sn, gecikme {args.latency * 1000:.0f} ms:")
+
+    common = dict(quota_per_minute=args.quota, window=args.window, latency=args.latency, seed=1)
+    run_scenario(f"kotaya uygun ({paced:.2f} sn ara)", args.competitions, seasons, paced, **common)
+    run_scenario("beklemesiz (429 + Reset)", args.competitions, seasons, 0, **common)
+    run_scenario(f"kotaya uygun + %{args.error_rate * 100:.0f} 5xx", args.competitions, seasons, paced,
+                 error_rate=args.error_rate, **common)
@@ -0,0 +1,135 @@
+# benchmarks/handoff.py
+"""Dönüştürücüden yükleyiciye aktarım: CSV dosyaları ile bellekte (tipli DataFrame) karşılaştırması
+
+Sentetik lig-sezonların (src/extractors/mock_server.py) ham JSON'ları geçici bir
+klasöre yazılır ve üç yoldan yüklenir; her yol temiz bir süreçte çalışır:
+
+- CSV: transform_batch ile CSV yaz, load_all ile geri oku ve yükle
+- bellekte: transform_frames -> load_batches, dosya yazılmaz
+- bellekte + Parquet checkpoint: aynı, tablolar ayrıca Parquet olarak yazılır
+
+Ayrıca aynı tablolar üzerinde yalnızca metin gidiş-dönüşü (CSV yazma + tipleri
+geri çözerek okuma) ve Parquet yazma/okuma süresi ölçülür.
+
+Kullanım:
+
+    python benchmarks/handoff.py [--competitions PL PD SA BL1 FL1] [--seasons 2000-2023] [--engine pandas]
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from src.extractors.mock_server import synthetic_payloads
+from src.pipeline.backfill import parse_seasons
+
+
+def make_raw_files(competitions, seasons, raw_path):
+    for code in competitions:
+        for season in seasons:
+            for kind, data in synthetic_payloads(code, season).items():
+                with open(os.path.join(raw_path, f"{code}_{kind}_{season}_20240101_000000.json"), 'w',
+                          encoding='utf-8') as f:
+                    json.dump(data, f)
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def folder_mb(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path)) / 2 ** 20
+
+
+def run_scenario(scenario, engine, raw_path, work_path):
+    """Senaryoyu çalıştır: (süre, import sonrası tepe bellek artışı MB, yazılan dosyalar MB)"""
+    from src.loaders.database_loader import load_all, load_batches
+    from src.transformers.football_data_transformer import FootballDataTransformer, find_latest_raw_files
+
+    base_rss = peak_rss_mb()
+    processed_path = os.path.join(work_path, 'processed')
+    db_path = os.path.join(work_path, 'football_data.db')
+    transformer = FootballDataTransformer(engine=engine, processed_path=processed_path)
+    groups = find_latest_raw_files(raw_path)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if scenario == 'CSV':
+            transformer.transform_batch(groups, fmt='csv')
+            load_all(processed_path, db_path, snapshot_dir=None)
+        else:
+            checkpoint_path = processed_path if scenario == 'bellekte + Parquet' else None
+            load_batches(transformer.transform_frames(groups, checkpoint_path), db_path, snapshot_dir=None)
+    return time.perf_counter() - start, peak_rss_mb() - base_rss, folder_mb(processed_path)
+
+
+def measure_round_trip(engine, raw_path, work_path):
+    """Aynı tablolarda yalnızca serileştirme / geri okuma süreleri (sn)"""
+    from src.loaders.database_loader import read_processed_file
+    from src.transformers.football_data_transformer import FootballDataTransformer, find_latest_raw_files
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        transformer = FootballDataTransformer(engine=engine, processed_path=work_path)
+        tables = [(kind, df) for _, frames, _ in transformer.transform_frames(find_latest_raw_files(raw_path))
+                  for kind, df in frames.items()]
+
+    times = {}
+    for fmt in ('csv', 'parquet'):
+        paths = [os.path.join(work_path, f"{i}_{kind}.{fmt}") for i, (kind, _) in enumerate(tables)]
+        start = time.perf_counter()
+        for (_, df), path in zip(tables, paths):
+            df.to_csv(path, index=False) if fmt == 'csv' else df.to_parquet(path, index=False)
+        times[f'{fmt} yazma'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for (kind, _), path in zip(tables, paths):
+            read_processed_file(path, kind)
+        times[f'{fmt} okuma'] = time.perf_counter() - start
+    return len(tables), times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--competitions', nargs='+', default=['PL', 'PD', 'SA', 'BL1', 'FL1'])
+    parser.add_argument('--seasons', nargs='+', default=['2000-2023'])
+    parser.add_argument('--engine', default='pandas', choices=['pandas', 'polars'])
+    args = parser.parse_args()
+
+    seasons = parse_seasons(args.seasons)
+    # Her senaryo import edilmemiş, temiz bir süreçte ölçülür (tepe bellek karışmasın)
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'raw')
+        os.makedirs(raw_path)
+        make_raw_files(args.competitions, seasons, raw_path)
+        n_groups = len(args.competitions) * len(seasons)
+
+        print(f"\n⏱️ Aktarım: {n_groups} lig-sezon, motor: {args.engine}")
+        print(f"  {'yol':22s}{'süre':>10s}{'tepe bellek':>14s}{'dosyalar':>12s}")
+        results = {}
+        for scenario in ['CSV', 'bellekte', 'bellekte + Parquet']:
+            work_path = os.path.join(tmp, scenario.replace(' ', '_'))
+            os.makedirs(work_path)
+            with context.Pool(1) as pool:
+                results[scenario] = pool.apply(run_scenario, (scenario, args.engine, raw_path, work_path))
+            seconds, rss, files = results[scenario]
+            print(f"  {scenario:22s}{seconds:8.2f} s{rss:+10.0f} MB{files:9.1f} MB")
+
+        saved = results['CSV'][0] - results['bellekte'][0]
+        print(f"  CSV'siz yol {saved:.2f} sn ({saved / results['CSV'][0]:.0%}) daha kısa")
+
+        work_path = os.path.join(tmp, 'round_trip')
+        os.makedirs(work_path)
+        with context.Pool(1) as pool:
+            n_tables, times = pool.apply(measure_round_trip, (args.engine, raw_path, work_path))
+        print(f"\n📦 Yalnızca serileştirme ({n_tables} tablo): "
+              + ', '.join(f"{name} {seconds:.2f} sn" for name, seconds in times.items()))
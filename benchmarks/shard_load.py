@@ -0,0 +1,151 @@
+# benchmarks/shard_load.py
+"""Tek dosya ile lig başına shard düzeninin karşılaştırması: yükleme süresi ve sorgu gecikmesi
+
+Sentetik lig-sezonlar (src/extractors/mock_server.py) geçici bir klasörde
+işlenmiş CSV'lere dönüştürülür, sonra iki düzene de yüklenir. Tek dosya tek
+süreçte, shard'lar --workers süreçte paralel yüklenir. Ardından dashboard
+sorguları iki düzende de ölçülür. Kullanım:
+
+    python benchmarks/shard_load.py [--competitions PL PD SA BL1 FL1] [--seasons 2014-2023] [--workers 4]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from src.database.queries import run_query
+from src.database.shards import connect_shards
+from src.extractors.mock_server import synthetic_payloads
+from src.loaders.database_loader import DatabaseLoader, find_processed_files, load_processed_group, load_shard
+from src.pipeline.backfill import parse_seasons
+from src.transformers.football_data_transformer import FootballDataTransformer
+from src.utils.data_version import read_only_uri
+
+
+def make_processed_files(competitions, seasons, processed_path):
+    """Sentetik ham verileri işlenmiş CSV'lere dönüştür"""
+    transformer = FootballDataTransformer()
+    raw_path = os.path.join(processed_path, 'raw')
+    os.makedirs(raw_path)
+
+    for code in competitions:
+        for season in seasons:
+            payloads = synthetic_payloads(code, season)
+            files = {}
+            for kind, data in payloads.items():
+                files[kind] = os.path.join(raw_path, f"{code}_{kind}_{season}.json")
+                with open(files[kind], 'w', encoding='utf-8') as f:
+                    json.dump(data, f)
+
+            prefix = os.path.join(processed_path, f"{code}_{season}")
+            transformer.transform_standings(files['standings']).to_csv(f"{prefix}_standings.csv", index=False)
+            transformer.transform_matches(files['matches']).to_csv(f"{prefix}_matches.csv", index=False)
+            transformer.transform_match_officials(files['matches']).to_csv(f"{prefix}_officials.csv", index=False)
+            transformer.transform_squads(files['squads']).to_csv(f"{prefix}_squads.csv", index=False)
+            transformer.transform_scorers(files['scorers']).to_csv(f"{prefix}_scorers.csv", index=False)
+
+
+def _quiet():
+    sys.stdout = io.StringIO()
+
+
+def load_single(groups, db_path):
+    loader = DatabaseLoader(db_path, staging=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        loader.connect()
+        loader.create_tables()
+        for (code, season), files in groups.items():
+            load_processed_group(loader, code, season, files)
+        loader.publish(snapshot_dir=None)
+        loader.disconnect()
+
+
+def load_sharded(groups, shard_dir, workers):
+    by_competition = {}
+    for (code, season), files in groups.items():
+        by_competition.setdefault(code, {})[season] = files
+    with ProcessPoolExecutor(max_workers=workers, initializer=_quiet) as pool:
+        list(pool.map(load_shard, by_competition, by_competition.values(), [shard_dir] * len(by_competition)))
+
+
+def timed(conn, query, params_list, repeat=3):
+    """Adlandırılmış sorgunun parametre listesi üzerindeki medyan süresi (ms)"""
+    samples = []
+    for _ in range(repeat):
+        for params in params_list:
+            start = time.perf_counter()
+            run_query(conn, query, **params)
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def query_params(conn, n=20):
+    """Düzenden bağımsız örnek parametreler: rastgele sezonlar ve aynı sezondaki iki takım"""
+    rng = random.Random(0)
+    seasons = rng.sample([row[0] for row in run_query(conn, 'seasons')[1]], n)
+    pairs = [conn.execute("SELECT home_team_id, away_team_id FROM matches WHERE season_id = ? LIMIT 1",
+                          (season_id,)).fetchone() for season_id in seasons]
+    return seasons, pairs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--competitions', nargs='+', default=['PL', 'PD', 'SA', 'BL1', 'FL1'])
+    parser.add_argument('--seasons', nargs='+', default=['2014-2023'])
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    seasons = parse_seasons(args.seasons)
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            make_processed_files(args.competitions, seasons, tmp)
+        groups = find_processed_files(tmp)
+
+        print(f"\n⏱️ Yükleme: {len(args.competitions)} lig x {len(seasons)} sezon ({os.cpu_count()} CPU)")
+        start = time.perf_counter()
+        load_single(groups, os.path.join(tmp, 'single.db'))
+        single_time = time.perf_counter() - start
+        print(f"  {'tek dosya (1 süreç)':32s} {single_time:6.2f} sn")
+
+        start = time.perf_counter()
+        load_sharded(groups, os.path.join(tmp, 'shards'), args.workers)
+        sharded_time = time.perf_counter() - start
+        print(f"  {f'shard ({args.workers} süreç)':32s} {sharded_time:6.2f} sn  ({single_time / sharded_time:.2f}x)")
+
+        start = time.perf_counter()
+        shard_conn = connect_shards(os.path.join(tmp, 'shards'))
+        print(f"  {'shard bağlantısı (ATTACH)':32s} {(time.perf_counter() - start) * 1000:6.1f} ms")
+
+        layouts = {
+            'tek dosya': sqlite3.connect(read_only_uri(os.path.join(tmp, 'single.db')), uri=True),
+            'shard (ATTACH)': shard_conn,
+        }
+        print("\n⏱️ Sorgu gecikmesi (medyan ms):")
+        print(f"  {'sorgu':28s}" + ''.join(f"{name:>16s}" for name in layouts))
+        results = {}
+        for name, conn in layouts.items():
+            season_ids, pairs = query_params(conn)
+            per_season = [{'season_id': season_id} for season_id in season_ids]
+            results[name] = {
+                'sezon listesi': timed(conn, 'seasons', [{}]),
+                'puan durumu': timed(conn, 'standings', per_season),
+                'maçlar': timed(conn, 'matches', per_season),
+                'takım istatistikleri': timed(conn, 'team_stats', per_season),
+                'sezon hakemleri': timed(conn, 'referee_season_stats', per_season),
+                'tüm hakemler (ligler arası)': timed(conn, 'referee_all_stats', [{}]),
+                'h2h (ligler arası)': timed(conn, 'h2h', [{'team_a': a, 'team_b': b} for a, b in pairs]),
+            }
+            conn.close()
+        for query in results['tek dosya']:
+            print(f"  {query:28s}" + ''.join(f"{results[name][query]:16.2f}" for name in layouts))
@@ -0,0 +1,73 @@
+# benchmarks/snapshot_load.py
+"""Dashboard veri yükleme süresi: SQLite sorguları vs memory-map Arrow snapshot
+
+Her ölçüm yeni bir Python sürecinde yapılır ve import süreleri hariç tutulur;
+yalnızca bağlantı/snapshot açılışı ve bir sezonun puan durumu, maçları ve takım
+istatistiklerinin DataFrame olarak hazırlanması ölçülür. Kullanım:
+
+    python benchmarks/snapshot_load.py [--db data/football_data.db] [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Alt süreçte çalışan ölçüm kodu
+PROBE = r'''
+import json, sqlite3, sys, time
+sys.path.insert(0, sys.argv[1])
+import pandas as pd
+from src.database.queries import read_query
+from src.loaders.snapshot import open_snapshot
+from src.utils.data_version import get_data_version
+
+db_path, snapshot_dir, mode = sys.argv[2], sys.argv[3], sys.argv[4]
+season_ids = [row[0] for row in sqlite3.connect(db_path).execute("SELECT season_id FROM seasons")]
+
+start = time.perf_counter()
+if mode == 'sql':
+    conn = sqlite3.connect(db_path)
+    for season_id in season_ids:
+        for name in ('standings', 'matches', 'team_stats'):
+            read_query(conn, name, season_id=season_id)
+        if season_id == season_ids[0]:
+            first = time.perf_counter() - start
+else:
+    snapshot = open_snapshot(snapshot_dir, get_data_version(db_path))
+    assert snapshot is not None, "snapshot yok ya da eski"
+    for season_id in season_ids:
+        for name in ('standings', 'matches', 'team_stats'):
+            snapshot.season_frame(name, season_id)
+        if season_id == season_ids[0]:
+            first = time.perf_counter() - start
+
+print(json.dumps({'first_season': first, 'all_seasons': time.perf_counter() - start}))
+'''
+
+
+def measure(mode, db_path, snapshot_dir, runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', PROBE, ROOT, db_path, snapshot_dir, mode],
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=os.path.join(ROOT, 'data', 'football_data.db'))
+    parser.add_argument('--snapshot', help="Snapshot klasörü (varsayılan: veritabanının yanındaki snapshot/)")
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    snapshot_dir = args.snapshot or os.path.join(os.path.dirname(os.path.abspath(args.db)), 'snapshot')
+
+    print(f"\n⏱️ Veri yükleme süreleri (medyan, {args.runs} çalıştırma, ms):")
+    for mode in ('sql', 'snapshot'):
+        result = measure(mode, args.db, snapshot_dir, args.runs)
+        print(f"  {mode:10s} ilk sezon {result['first_season'] * 1000:8.2f}   tüm sezonlar {result['all_seasons'] * 1000:8.2f}")
@@ -0,0 +1,92 @@
+# benchmarks/transform_engines.py
+"""pandas ve Polars dönüştürme motorlarının karşılaştırması (çok sezonluk batch)
+
+Sentetik lig-sezonların (src/extractors/mock_server.py) ham JSON'ları geçici
+bir klasöre yazılır, sonra her motorla dönüştürülür:
+
+- batch (CSV / Parquet): transform_batch, tablolar motorun kendi tipinde yazılır;
+  Polars'ta tüm lig-sezonların planları tek collect_all ile paralel çalışır
+- tek tek: transform_* metodları, yükleyiciye verilen pandas DataFrame'ler
+
+Kullanım:
+
+    python benchmarks/transform_engines.py [--competitions PL PD SA BL1 FL1] [--seasons 2000-2023] [--repeat 3]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from src.extractors.mock_server import synthetic_payloads
+from src.pipeline.backfill import parse_seasons
+from src.transformers.engines import ENGINES
+from src.transformers.football_data_transformer import FootballDataTransformer, find_latest_raw_files
+
+
+def make_raw_files(competitions, seasons, raw_path):
+    for code in competitions:
+        for season in seasons:
+            for kind, data in synthetic_payloads(code, season).items():
+                with open(os.path.join(raw_path, f"{code}_{kind}_{season}_20240101_000000.json"), 'w',
+                          encoding='utf-8') as f:
+                    json.dump(data, f)
+
+
+def transform_one_by_one(transformer, groups):
+    for files in groups.values():
+        transformer.transform_standings(files['standings'])
+        transformer.transform_matches(files['matches'])
+        transformer.transform_match_officials(files['matches'])
+        transformer.transform_squads(files['squads'])
+        transformer.transform_scorers(files['scorers'])
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--competitions', nargs='+', default=['PL', 'PD', 'SA', 'BL1', 'FL1'])
+    parser.add_argument('--seasons', nargs='+', default=['2000-2023'])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    seasons = parse_seasons(args.seasons)
+    with tempfile.TemporaryDirectory() as tmp:
+        raw_path = os.path.join(tmp, 'raw')
+        os.makedirs(raw_path)
+        make_raw_files(args.competitions, seasons, raw_path)
+        groups = find_latest_raw_files(raw_path)
+
+        import polars
+        print(f"\n⏱️ Dönüştürme: {len(groups)} lig-sezon, {os.cpu_count()} CPU "
+              f"(Polars thread havuzu: {polars.thread_pool_size()}), medyan / {args.repeat} tekrar")
+        print(f"  {'senaryo':24s}" + ''.join(f"{name:>12s}" for name in ENGINES) + f"{'fark':>10s}")
+
+        transformers = {name: FootballDataTransformer(engine=name) for name in ENGINES}
+        scenarios = {
+            'batch (CSV)': lambda t, name: t.transform_batch(groups, os.path.join(tmp, name, 'csv'), fmt='csv'),
+            'batch (Parquet)': lambda t, name: t.transform_batch(groups, os.path.join(tmp, name, 'parquet'),
+                                                                 fmt='parquet'),
+            'tek tek (pandas DF)': lambda t, name: transform_one_by_one(t, groups),
+        }
+        for scenario, run in scenarios.items():
+            times = {name: timed(lambda: run(transformer, name), args.repeat)
+                     for name, transformer in transformers.items()}
+            print(f"  {scenario:24s}" + ''.join(f"{times[name]:10.2f} s" for name in ENGINES)
+                  + f"{times['pandas'] / times['polars']:9.2f}x")
@@ -1,26 +1,99 @@
 # configs/config.py
 import os
-from dotenv import load_dotenv
 
-# .env dosyasını yükle
-load_dotenv()
+# Proje kök dizini (configs/ klasörünün bir üstü)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# API Ayarları
-FOOTBALL_DATA_API_KEY = os.getenv('FOOTBALL_DATA_API_KEY')
+# API Ayarları (API anahtarı .env'den okunur, bkz. configure)
 API_BASE_URL = 'https://api.football-data.org/v4'
 
+# Veri türü -> /competitions/{lig}/ altındaki uç nokta
+ENDPOINTS = {
+    'standings': 'standings',
+    'matches': 'matches',
+    'squads': 'teams',
+    'scorers': 'scorers',
+}
+
+# Veri türü -> her istekte gönderilen ek parametreler (API gol krallığında varsayılan olarak 10 oyuncu döner)
+ENDPOINT_PARAMS = {
+    'scorers': {'limit': 100},
+}
+
+# API'nin döndürdüğü maç durumları
+MATCH_STATUSES = {'SCHEDULED', 'TIMED', 'IN_PLAY', 'PAUSED', 'EXTRA_TIME', 'PENALTY_SHOOTOUT',
+                  'FINISHED', 'SUSPENDED', 'POSTPONED', 'CANCELLED', 'AWARDED', 'LIVE'}
+
+# Henüz oynanmamış ve tarihi belli maçlar (tahmin edilecek fikstür)
+UPCOMING_STATUSES = sorted(MATCH_STATUSES & {'SCHEDULED', 'TIMED'})
+
 # Desteklenen ligler
 LEAGUES = {
     'PL': 'Premier League',
-    'PD': 'La Liga', 
+    'PD': 'La Liga',
     'SA': 'Serie A',
     'BL1': 'Bundesliga',
     'FL1': 'Ligue 1'
 }
 
-# Veri klasörleri
-RAW_DATA_PATH = 'data/raw'
-PROCESSED_DATA_PATH = 'data/processed'
+# Çekilecek sezonlar (başlangıç yılı)
+SEASONS = [2023]
+
+# Veri klasörü altındaki dosyalar. Mutlak yollar import anında değil, ilk
+# kullanıldıklarında bir kez çözülür (bkz. configure); modüller bunları yine
+# `from configs.config import DATABASE_PATH` şeklinde alır.
+DATA_FILES = {
+    'RAW_DATA_PATH': 'raw',
+    'PROCESSED_DATA_PATH': 'processed',
+    'DATABASE_PATH': 'football_data.db',
+    'SHARD_PATH': 'shards',  # Lig başına veritabanı dosyaları (yükleyicinin --sharded modu)
+    'SNAPSHOT_PATH': 'snapshot',  # Dashboard için kolon bazlı (Arrow) snapshot
+    'CHECKPOINT_PATH': 'backfill_checkpoint.db',  # Geçmiş veri doldurma ilerlemesi
+    'CHANGE_OFFSETS_PATH': 'change_offsets.db',  # change_log tüketicilerinin kaldığı yer
+    'INSPECTOR_CACHE_PATH': 'inspector_cache.db',  # Ham dosya şema profilleri (dosya hash'ine göre)
+}
+
+# Dönüştürme motoru: 'pandas' (tek thread) ya da 'polars' (lazy, çok çekirdek); bkz. src/transformers/engines.py
+TRANSFORM_ENGINE = 'pandas'
 
 # Rate limiting
-REQUEST_DELAY = 6  # saniye (dakikada 10 istek için)
\ No newline at end of file
+REQUEST_DELAY = 6  # saniye (dakikada 10 istek için)
+
+_settings = None
+
+
+def configure(data_dir=None, env_file=None):
+    """Ayarları bir kez çöz: .env'i oku, veri klasörünü ve API anahtarını belirle
+
+    Veri klasörü önceliği: data_dir > FOOTBALL_DATA_DIR ortam değişkeni > proje
+    kökündeki data/ (depodan ya da editable kurulumdan çalışırken) > çalışılan
+    klasördeki data/. Modüller yollarını import anında aldığı için CLI bunu
+    alt komutun modüllerini yüklemeden önce çağırır.
+    """
+    global _settings
+    from dotenv import load_dotenv, find_dotenv
+
+    load_dotenv(env_file or find_dotenv(usecwd=True) or os.path.join(PROJECT_ROOT, '.env'))
+
+    data_dir = data_dir or os.getenv('FOOTBALL_DATA_DIR')
+    if not data_dir:
+        in_checkout = os.path.exists(os.path.join(PROJECT_ROOT, 'pyproject.toml'))
+        data_dir = os.path.join(PROJECT_ROOT if in_checkout else os.getcwd(), 'data')
+    data_dir = os.path.abspath(data_dir)
+
+    _settings = {'DATA_DIR': data_dir, 'FOOTBALL_DATA_API_KEY': os.getenv('FOOTBALL_DATA_API_KEY')}
+    for name, relative in DATA_FILES.items():
+        _settings[name] = os.path.join(data_dir, relative)
+    return _settings
+
+
+def get_settings():
+    """Çözülmüş ayarlar; configure çağrılmadıysa varsayılanlarla çözülür"""
+    return _settings if _settings is not None else configure()
+
+
+def __getattr__(name):
+    # Veri yolları ve API anahtarı ilk erişildiklerinde çözülür (PEP 562)
+    if name in DATA_FILES or name in ('DATA_DIR', 'FOOTBALL_DATA_API_KEY'):
+        return get_settings()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,15 @@
 # dashboard/app.py
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import sqlite3
-from datetime import datetime
-import os
-import sys
 
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Plotly yalnızca dashboard.figures içinde, bir grafik ilk kez çizildiğinde yüklenir
+from dashboard.data import (current_data_version, load_seasons, load_standings, load_matches,
+                            count_remaining_matches, load_season_probabilities, find_team_id, prepare_export,
+                            load_referee_stats)
+from dashboard import figures
 
 # Sayfa ayarları
 st.set_page_config(
-    page_title="Premier League Analiz Dashboard",
+    page_title="Futbol Analiz Dashboard",
     page_icon="⚽",
     layout="wide",
     initial_sidebar_state="expanded"
@@ -37,173 +33,133 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_resource
-def get_connection():
-    """Veritabanı bağlantısı"""
-    # Dashboard klasöründen çalıştığımız için bir üst klasöre çıkmalıyız
-    db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'football_data.db')
-    
-    if not os.path.exists(db_path):
-        st.error(f"Veritabanı dosyası bulunamadı: {db_path}")
-        st.info("Lütfen önce veri yükleme scriptlerini çalıştırın.")
+def select_season(data_version):
+    """Yan menüde lig ve sezon seçimi; seçilen sezonun bilgilerini döndür"""
+    seasons = load_seasons(data_version)
+    
+    if not seasons:
+        st.warning("Veritabanında henüz sezon yok. Lütfen önce veri yükleme scriptlerini çalıştırın.")
         st.stop()
     
-    return sqlite3.connect(db_path, check_same_thread=False)
-
-@st.cache_data
-def load_standings():
-    """Puan durumunu yükle"""
-    query = """
-        SELECT 
-            t.team_name,
-            s.position,
-            s.played_games,
-            s.won,
-            s.draw,
-            s.lost,
-            s.points,
-            s.goals_for,
-            s.goals_against,
-            s.goal_difference,
-            s.form,
-            s.points_per_game,
-            s.goals_per_game
-        FROM standings s
-        JOIN teams t ON s.team_id = t.team_id
-        ORDER BY s.position
-    """
-    return pd.read_sql_query(query, get_connection())
-
-@st.cache_data
-def load_matches():
-    """Maç verilerini yükle"""
-    query = """
-        SELECT 
-            m.*,
-            h.team_name as home_team_name,
-            a.team_name as away_team_name
-        FROM matches m
-        JOIN teams h ON m.home_team_id = h.team_id
-        JOIN teams a ON m.away_team_id = a.team_id
-        WHERE m.status = 'FINISHED'
-    """
-    return pd.read_sql_query(query, get_connection())
+    competitions = {}
+    for _, code, name, _ in seasons:
+        competitions.setdefault(code, name)
+    competition_code = st.sidebar.selectbox("🏆 Lig:", list(competitions), format_func=competitions.get)
+    
+    league_seasons = {year: season_id for season_id, code, _, year in seasons if code == competition_code}
+    season_year = st.sidebar.selectbox(
+        "📅 Sezon:", list(league_seasons),
+        format_func=lambda year: f"{year}/{(year + 1) % 100:02d}"
+    )
+    
+    return {
+        'season_id': league_seasons[season_year],
+        'competition_name': competitions[competition_code],
+        'season_year': season_year
+    }
 
-@st.cache_data
-def get_team_stats():
-    """Takım istatistikleri"""
-    query = """
-        SELECT 
-            t.team_name,
-            COUNT(CASE WHEN m.home_team_id = t.team_id THEN 1 END) as home_games,
-            COUNT(CASE WHEN m.away_team_id = t.team_id THEN 1 END) as away_games,
-            SUM(CASE WHEN m.home_team_id = t.team_id AND m.is_home_win = 1 THEN 1
-                     WHEN m.away_team_id = t.team_id AND m.is_away_win = 1 THEN 1 ELSE 0 END) as total_wins,
-            SUM(CASE WHEN m.home_team_id = t.team_id AND m.is_home_win = 1 THEN 1 ELSE 0 END) as home_wins,
-            SUM(CASE WHEN m.away_team_id = t.team_id AND m.is_away_win = 1 THEN 1 ELSE 0 END) as away_wins,
-            AVG(CASE WHEN m.home_team_id = t.team_id THEN m.home_score
-                     WHEN m.away_team_id = t.team_id THEN m.away_score END) as avg_goals_scored,
-            AVG(CASE WHEN m.home_team_id = t.team_id THEN m.away_score
-                     WHEN m.away_team_id = t.team_id THEN m.home_score END) as avg_goals_conceded
-        FROM teams t
-        LEFT JOIN matches m ON m.home_team_id = t.team_id OR m.away_team_id = t.team_id
-        WHERE m.status = 'FINISHED'
-        GROUP BY t.team_id, t.team_name
-    """
-    return pd.read_sql_query(query, get_connection())
+def export_controls(data_version, report, season_id, file_label, team_id=None):
+    """Excel/PDF hazırla ve indir butonları"""
+    extension = st.radio("Format:", ['.xlsx', '.pdf'], horizontal=True,
+                         key=f"export_format_{report}", format_func=lambda e: e[1:].upper())
+    
+    # Dosya yalnızca istendiğinde üretilir; aynı veri sürümü için tekrar kullanılır
+    if st.button("📥 Hazırla", key=f"export_prepare_{report}"):
+        path = prepare_export(data_version, report, season_id, extension, team_id)
+        with open(path, 'rb') as f:
+            st.download_button("💾 İndir", f, file_name=f"{file_label}{extension}",
+                               key=f"export_download_{report}")
 
 def main():
-    # Başlık
-    st.markdown('<h1 class="main-header">⚽ Premier League 2023/24 Analiz Dashboard</h1>', unsafe_allow_html=True)
-    
     # Yan menü
     st.sidebar.title("📊 Menü")
+    data_version = current_data_version()
+    season = select_season(data_version)
+    season_id = int(season['season_id'])
+    
+    # Başlık
+    season_label = f"{season['season_year']}/{(season['season_year'] + 1) % 100:02d}"
+    st.markdown(f'<h1 class="main-header">⚽ {season["competition_name"]} {season_label} Analiz Dashboard</h1>',
+                unsafe_allow_html=True)
+    
     page = st.sidebar.radio("Sayfa Seçin:", 
-                            ["🏠 Ana Sayfa", "📊 Puan Durumu", "⚽ Maç Analizi", "📈 Takım Performansı", "🎯 Detaylı İstatistikler"])
+                            ["🏠 Ana Sayfa", "📊 Puan Durumu", "⚽ Maç Analizi", "📈 Takım Performansı", "🎯 Detaylı İstatistikler",
+                             "🧑‍⚖️ Hakem Analizi"])
+    
+    with st.sidebar.expander("📥 Dışa Aktar"):
+        report = st.radio("Rapor:", ['standings', 'matches'],
+                          format_func={'standings': "Puan Durumu", 'matches': "Maçlar"}.get)
+        export_controls(data_version, report, season_id, f"{report}_{season['season_year']}")
     
+    # Her sayfa yalnızca seçili sezonun verisini yükler
     if page == "🏠 Ana Sayfa":
-        show_homepage()
+        show_homepage(data_version, season_id)
     elif page == "📊 Puan Durumu":
-        show_standings()
+        show_standings(data_version, season_id)
     elif page == "⚽ Maç Analizi":
-        show_match_analysis()
+        show_match_analysis(data_version, season_id)
     elif page == "📈 Takım Performansı":
-        show_team_performance()
+        show_team_performance(data_version, season_id)
     elif page == "🎯 Detaylı İstatistikler":
-        show_detailed_stats()
+        show_detailed_stats(data_version, season_id)
+    elif page == "🧑‍⚖️ Hakem Analizi":
+        show_referee_analysis(data_version, season_id)
 
-def show_homepage():
+def show_homepage(data_version, season_id):
     """Ana sayfa"""
     st.subheader("🏆 Sezon Özeti")
     
     # Temel metrikler
-    standings_df = load_standings()
-    matches_df = load_matches()
+    standings_df = load_standings(data_version, season_id)
+    matches_df = load_matches(data_version, season_id)
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("🏆 Şampiyon", standings_df.iloc[0]['team_name'])
-        
+    
     with col2:
         total_goals = matches_df['total_goals'].sum()
         st.metric("⚽ Toplam Gol", f"{total_goals:,}")
-        
+    
     with col3:
         avg_goals = matches_df['total_goals'].mean()
         st.metric("📊 Ortalama Gol/Maç", f"{avg_goals:.2f}")
-        
+    
     with col4:
         home_win_pct = (matches_df['is_home_win'].sum() / len(matches_df) * 100)
         st.metric("🏠 Ev Sahibi Galibiyet %", f"{home_win_pct:.1f}%")
     
     # Top 5 takım grafiği
     st.subheader("📊 İlk 5 Takım")
-    top5 = standings_df.head()
-    
-    fig = px.bar(top5, x='team_name', y='points', 
-                 color='points',
-                 color_continuous_scale='Blues',
-                 title='Puan Durumu - İlk 5')
-    fig.update_layout(showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures.top5_points_bar(data_version, season_id), use_container_width=True)
     
     # Gol istatistikleri
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("⚽ En Çok Gol Atan Takımlar")
-        top_scorers = standings_df.nlargest(5, 'goals_for')[['team_name', 'goals_for']]
-        fig_goals = px.bar(top_scorers, x='goals_for', y='team_name', 
-                          orientation='h',
-                          color='goals_for',
-                          color_continuous_scale='Reds')
-        fig_goals.update_layout(showlegend=False, yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig_goals, use_container_width=True)
+        st.plotly_chart(figures.top_scorers_bar(data_version, season_id), use_container_width=True)
     
     with col2:
         st.subheader("🛡️ En Az Gol Yiyen Takımlar")
-        best_defense = standings_df.nsmallest(5, 'goals_against')[['team_name', 'goals_against']]
-        fig_defense = px.bar(best_defense, x='goals_against', y='team_name', 
-                            orientation='h',
-                            color='goals_against',
-                            color_continuous_scale='Greens_r')
-        fig_defense.update_layout(showlegend=False, yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig_defense, use_container_width=True)
+        st.plotly_chart(figures.best_defense_bar(data_version, season_id), use_container_width=True)
 
-def show_standings():
+def show_standings(data_version, season_id):
     """Puan durumu sayfası"""
     st.subheader("📊 Puan Durumu Tablosu")
     
-    standings_df = load_standings()
+    standings_df = load_standings(data_version, season_id)
+    
+    # Renklendirme için stil (küme düşme bölgesi: son 3 sıra)
+    relegation_start = len(standings_df) - 2
     
-    # Renklendirme için stil
     def highlight_positions(row):
         if row['position'] <= 4:
             return ['background-color: #90EE90'] * len(row)  # Champions League
         elif row['position'] == 5:
             return ['background-color: #FFE4B5'] * len(row)  # Europa League
-        elif row['position'] >= 18:
+        elif row['position'] >= relegation_start:
             return ['background-color: #FFB6C1'] * len(row)  # Küme düşme
         else:
             return [''] * len(row)
@@ -213,18 +169,36 @@ def show_standings():
     st.dataframe(styled_df, height=750, use_container_width=True)
     
     # Açıklama
-    st.markdown("""
+    st.markdown(f"""
     **Renk Kodları:**
     - 🟢 Yeşil: Champions League (1-4)
     - 🟡 Sarı: Europa League (5)
-    - 🔴 Kırmızı: Küme Düşme (18-20)
+    - 🔴 Kırmızı: Küme Düşme ({relegation_start}-{len(standings_df)})
     """)
+    
+    # Sezon sonu olasılıkları (yalnızca oynanmamış maç varsa)
+    remaining = count_remaining_matches(data_version, season_id)
+    
+    if remaining:
+        st.subheader("🎲 Sezon Sonu Olasılıkları")
+        st.caption(f"Kalan {remaining} maç 100.000 kez simüle edildi")
+        
+        probs = load_season_probabilities(data_version, season_id)
+        probs_display = probs[['team_name', 'current_points', 'expected_points',
+                               'title_prob', 'top4_prob', 'relegation_prob']].copy()
+        for col in ['title_prob', 'top4_prob', 'relegation_prob']:
+            probs_display[col] = (probs_display[col] * 100).round(1)
+        probs_display.columns = ['Takım', 'Puan', 'Beklenen Puan', 'Şampiyonluk %', 'İlk 4 %', 'Küme Düşme %']
+        st.dataframe(probs_display, use_container_width=True, hide_index=True)
+        
+        with st.expander("📊 Sıralama Dağılımı"):
+            st.plotly_chart(figures.position_heatmap(data_version, season_id), use_container_width=True)
 
-def show_match_analysis():
+def show_match_analysis(data_version, season_id):
     """Maç analizi sayfası"""
     st.subheader("⚽ Maç Analizleri")
     
-    matches_df = load_matches()
+    matches_df = load_matches(data_version, season_id)
     
     # Filtreleme seçenekleri
     col1, col2 = st.columns(2)
@@ -233,17 +207,11 @@ def show_match_analysis():
         selected_team = st.selectbox("Takım Seçin:", ["Tüm Takımlar"] + sorted(matches_df['home_team_name'].unique().tolist()))
     
     with col2:
-        matchday = st.slider("Hafta Aralığı:", 1, 38, (1, 38))
+        last_matchday = max(int(matches_df['matchday'].max()) if not matches_df.empty else 1, 2)
+        matchday = st.slider("Hafta Aralığı:", 1, last_matchday, (1, last_matchday))
     
     # Filtreleme
-    filtered_df = matches_df.copy()
-    
-    if selected_team != "Tüm Takımlar":
-        filtered_df = filtered_df[(filtered_df['home_team_name'] == selected_team) | 
-                                  (filtered_df['away_team_name'] == selected_team)]
-    
-    filtered_df = filtered_df[(filtered_df['matchday'] >= matchday[0]) & 
-                              (filtered_df['matchday'] <= matchday[1])]
+    filtered_df = figures.filter_matches(matches_df, selected_team, matchday)
     
     # İstatistikler
     col1, col2, col3 = st.columns(3)
@@ -262,12 +230,8 @@ def show_match_analysis():
     
     # Gol dağılımı
     st.subheader("📊 Maçlardaki Gol Dağılımı")
-    goal_dist = filtered_df['total_goals'].value_counts().sort_index()
-    
-    fig = px.bar(x=goal_dist.index, y=goal_dist.values,
-                 labels={'x': 'Toplam Gol', 'y': 'Maç Sayısı'},
-                 title='Maçlardaki Toplam Gol Dağılımı')
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(figures.goal_distribution_bar(data_version, season_id, selected_team, matchday),
+                    use_container_width=True)
     
     # En yüksek skorlu maçlar
     st.subheader("🔥 En Çok Gollü Maçlar")
@@ -276,19 +240,17 @@ def show_match_analysis():
     ]
     st.dataframe(top_matches, use_container_width=True)
 
-def show_team_performance():
+def show_team_performance(data_version, season_id):
     """Takım performans analizi"""
     st.subheader("📈 Takım Performans Analizi")
     
-    standings_df = load_standings()
-    team_stats_df = get_team_stats()
+    standings_df = load_standings(data_version, season_id)
     
     # Takım seçimi
     selected_team = st.selectbox("Takım Seçin:", sorted(standings_df['team_name'].tolist()))
     
     # Takım bilgileri
     team_data = standings_df[standings_df['team_name'] == selected_team].iloc[0]
-    team_stats = team_stats_df[team_stats_df['team_name'] == selected_team].iloc[0]
     
     # Metrikler
     col1, col2, col3, col4 = st.columns(4)
@@ -315,40 +277,17 @@ def show_team_performance():
     col1, col2 = st.columns(2)
     
     with col1:
-        home_away_data = pd.DataFrame({
-            'Konum': ['Ev Sahibi', 'Deplasman'],
-            'Galibiyet': [int(team_stats['home_wins']), int(team_stats['away_wins'])],
-            'Maç': [int(team_stats['home_games']), int(team_stats['away_games'])]
-        })
-        home_away_data['Galibiyet %'] = (home_away_data['Galibiyet'] / home_away_data['Maç'] * 100).round(1)
-        
-        fig = px.bar(home_away_data, x='Konum', y='Galibiyet %',
-                     color='Konum',
-                     color_discrete_map={'Ev Sahibi': '#1f77b4', 'Deplasman': '#ff7f0e'},
-                     title='Ev Sahibi vs Deplasman Galibiyet Oranı')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figures.home_away_bar(data_version, season_id, selected_team), use_container_width=True)
     
     with col2:
         # Form grafiği
-        if team_data['form']:
-            form_data = []
-            for i, result in enumerate(team_data['form'][-5:]):
-                form_data.append({
-                    'Maç': i+1,
-                    'Sonuç': result,
-                    'Puan': 3 if result == 'W' else (1 if result == 'D' else 0)
-                })
-            form_df = pd.DataFrame(form_data)
-            
-            fig = px.line(form_df, x='Maç', y='Puan', 
-                         markers=True,
-                         title='Son 5 Maç Formu')
-            fig.update_yaxis(range=[-0.5, 3.5], tickvals=[0, 1, 3], ticktext=['L', 'D', 'W'])
+        fig = figures.form_line(data_version, season_id, selected_team)
+        if fig is not None:
             st.plotly_chart(fig, use_container_width=True)
     
     # Takımın tüm maçları
     st.subheader("📅 Sezon Maçları")
-    matches_df = load_matches()
+    matches_df = load_matches(data_version, season_id)
     team_matches = matches_df[(matches_df['home_team_name'] == selected_team) | 
                               (matches_df['away_team_name'] == selected_team)].copy()
     
@@ -385,16 +324,21 @@ def show_team_performance():
         return ''
     
     display_cols = ['match_date', 'matchday', 'match_display', 'result']
-    styled_matches = team_matches[display_cols].style.applymap(color_result, subset=['result'])
+    styled_matches = team_matches[display_cols].style.map(color_result, subset=['result'])
     
     st.dataframe(styled_matches, use_container_width=True, height=500)
+    
+    # Takım raporu (özet + tüm maçlar)
+    with st.expander("📥 Takım Raporunu Dışa Aktar"):
+        export_controls(data_version, 'team', season_id, f"{selected_team}_rapor",
+                        team_id=find_team_id(data_version, season_id, selected_team))
 
-def show_detailed_stats():
+def show_detailed_stats(data_version, season_id):
     """Detaylı istatistikler"""
     st.subheader("🎯 Detaylı İstatistikler")
     
-    standings_df = load_standings()
-    matches_df = load_matches()
+    standings_df = load_standings(data_version, season_id)
+    matches_df = load_matches(data_version, season_id)
     
     # Tab'lar
     tab1, tab2, tab3, tab4 = st.tabs(["📊 Lig İstatistikleri", "👥 Kafa Kafaya", "📈 Trendler", "🏆 Rekorlar"])
@@ -405,23 +349,11 @@ def show_detailed_stats():
         
         with col1:
             # Puan/Maç dağılımı
-            fig = px.scatter(standings_df, x='played_games', y='points',
-                           size='goals_for', color='position',
-                           hover_data=['team_name'],
-                           title='Puan vs Oynanan Maç (Gol Sayısına Göre)',
-                           color_continuous_scale='RdYlGn_r')
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figures.points_scatter(data_version, season_id), use_container_width=True)
         
         with col2:
             # Atak vs Savunma
-            fig = px.scatter(standings_df, x='goals_for', y='goals_against',
-                           color='points', size='points',
-                           hover_data=['team_name', 'position'],
-                           title='Atak vs Savunma Performansı',
-                           color_continuous_scale='Blues')
-            fig.add_hline(y=standings_df['goals_against'].mean(), line_dash="dash", line_color="gray")
-            fig.add_vline(x=standings_df['goals_for'].mean(), line_dash="dash", line_color="gray")
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figures.attack_defense_scatter(data_version, season_id), use_container_width=True)
     
     with tab2:
         # Kafa kafaya karşılaştırma
@@ -446,63 +378,17 @@ def show_detailed_stats():
                     st.write(f"📅 {match['match_date']}: {match['home_team_name']} {match['home_score']}-{match['away_score']} {match['away_team_name']}")
             
             # Karşılaştırma radar chart
-            team1_data = standings_df[standings_df['team_name'] == team1].iloc[0]
-            team2_data = standings_df[standings_df['team_name'] == team2].iloc[0]
-            
-            categories = ['Puan', 'Galibiyet', 'Atılan Gol', 'Az Yenilen Gol', 'Puan/Maç']
-            
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatterpolar(
-                r=[team1_data['points'], team1_data['won'], team1_data['goals_for'], 
-                   38-team1_data['goals_against'], team1_data['points_per_game']*10],
-                theta=categories,
-                fill='toself',
-                name=team1
-            ))
-            
-            fig.add_trace(go.Scatterpolar(
-                r=[team2_data['points'], team2_data['won'], team2_data['goals_for'], 
-                   38-team2_data['goals_against'], team2_data['points_per_game']*10],
-                theta=categories,
-                fill='toself',
-                name=team2
-            ))
-            
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(visible=True, range=[0, 100])
-                ),
-                title="Takım Performans Karşılaştırması",
-                showlegend=True
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(figures.team_radar(data_version, season_id, team1, team2), use_container_width=True)
     
     with tab3:
         # Sezon içi trendler
         st.subheader("📈 Sezon İçi Trendler")
         
         # Haftalık gol ortalaması
-        weekly_goals = matches_df.groupby('matchday')['total_goals'].agg(['sum', 'count', 'mean'])
-        weekly_goals['avg_goals'] = weekly_goals['mean']
-        
-        fig = px.line(weekly_goals.reset_index(), x='matchday', y='avg_goals',
-                     title='Haftalık Ortalama Gol Sayısı',
-                     labels={'matchday': 'Hafta', 'avg_goals': 'Ortalama Gol'})
-        fig.add_hline(y=weekly_goals['avg_goals'].mean(), line_dash="dash", 
-                     line_color="red", annotation_text="Sezon Ortalaması")
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figures.weekly_goals_line(data_version, season_id), use_container_width=True)
         
         # Ev sahibi avantajı trendi
-        home_advantage = matches_df.groupby('matchday')[['is_home_win', 'is_draw', 'is_away_win']].mean() * 100
-        
-        fig = px.area(home_advantage.reset_index(), x='matchday', 
-                     y=['is_home_win', 'is_draw', 'is_away_win'],
-                     title='Maç Sonucu Dağılımı (%)',
-                     labels={'value': 'Yüzde (%)', 'matchday': 'Hafta'},
-                     color_discrete_map={'is_home_win': '#2E7D32', 'is_draw': '#FFA000', 'is_away_win': '#C62828'})
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(figures.result_share_area(data_version, season_id), use_container_width=True)
     
     with tab4:
         # Rekorlar
@@ -556,5 +442,37 @@ def show_detailed_stats():
             best_ppg = standings_df.nlargest(1, 'points_per_game').iloc[0]
             st.metric("En Yüksek Puan/Maç", best_ppg['team_name'], f"{best_ppg['points_per_game']:.2f}")
 
+def show_referee_analysis(data_version, season_id):
+    """Hakem analizi (önceden hesaplanmış sezon istatistiklerinden)"""
+    st.subheader("🧑‍⚖️ Hakem Analizi")
+    
+    scope = st.radio("Kapsam:", ["Seçili sezon", "Tüm ligler ve sezonlar"], horizontal=True)
+    scope_season_id = season_id if scope == "Seçili sezon" else None
+    referee_df = load_referee_stats(data_version, scope_season_id)
+    
+    if referee_df.empty:
+        st.info("Bu kapsam için hakem verisi yok. Hakem tabloları maç görevlileri yüklendiğinde doldurulur.")
+        return
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("🧑‍⚖️ Hakem Sayısı", f"{len(referee_df)}")
+    
+    with col2:
+        home_win_pct = referee_df['home_wins'].sum() / referee_df['matches_officiated'].sum() * 100
+        st.metric("🏠 Ev Sahibi Galibiyet %", f"{home_win_pct:.1f}%")
+    
+    with col3:
+        busiest = referee_df.iloc[0]
+        st.metric("📋 En Çok Maç Yöneten", busiest['referee_name'], f"{int(busiest['matches_officiated'])} maç")
+    
+    max_matches = int(referee_df['matches_officiated'].max())
+    min_matches = st.slider("Minimum maç sayısı:", 1, max_matches, 1) if max_matches > 1 else 1
+    st.plotly_chart(figures.referee_scatter(data_version, scope_season_id, min_matches), use_container_width=True)
+    
+    st.dataframe(referee_df[referee_df['matches_officiated'] >= min_matches],
+                 use_container_width=True, hide_index=True)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,150 @@
+# dashboard/data.py
+# Dashboard veri katmanı. Tüm yükleyiciler ilk argüman olarak veri sürümünü
+# (get_data_version) alır; yeni bir yükleme sürümü değiştirdiği için
+# cache'ler kendiliğinden yenilenir.
+# pandas, ilk görünür öğelerin (başlık, lig/sezon seçimi) gecikmemesi için
+# yalnızca tablo döndüren fonksiyonların içinde yüklenir.
+import streamlit as st
+import sqlite3
+import os
+import tempfile
+
+from configs.config import DATABASE_PATH, SHARD_PATH, SNAPSHOT_PATH
+from src.utils.data_version import get_data_version
+from src.database.shards import connect_shards, shard_for_season, shards_version
+from src.database.queries import run_query, read_query
+
+# Yollar configs.config'ten gelir (FOOTBALL_DATA_DIR ile başka bir veri klasörü seçilebilir)
+DB_PATH = DATABASE_PATH
+
+# Tek veritabanı dosyası yoksa lig shard'ları okunur (database_loader.py --sharded)
+SHARD_DIR = SHARD_PATH
+
+# Loader'ın her yüklemeden sonra yayınladığı Arrow snapshot (src/loaders/snapshot.py)
+SNAPSHOT_DIR = SNAPSHOT_PATH
+
+# Dışa aktarılan dosyalar sunucu tarafında burada tutulur
+EXPORT_DIR = os.path.join(tempfile.gettempdir(), 'football_dashboard_exports')
+
+def current_data_version():
+    """Veritabanının (ya da tüm shard'ların) şu anki sürüm anahtarı"""
+    if os.path.exists(DB_PATH):
+        return get_data_version(DB_PATH)
+    return shards_version(SHARD_DIR)
+
+def season_db_path(season_id):
+    """Sezonun okunacağı veritabanı dosyası (tek dosya ya da sezonun shard'ı)"""
+    if os.path.exists(DB_PATH):
+        return DB_PATH
+    return shard_for_season(season_id, SHARD_DIR)
+
+@st.cache_resource(max_entries=2)
+def get_connection(data_version):
+    """Veri sürümüne ait veritabanı bağlantısı
+    
+    Loader yeni sürümü dosyayı rename ederek yayınlar; eski bağlantı eski dosyayı
+    okumaya devam edeceği için her sürüm kendi bağlantısını açar. Shard düzeninde
+    bağlantı tüm ligleri ATTACH eder (src/database/shards.py).
+    """
+    if data_version is None:
+        st.error(f"Veritabanı dosyası bulunamadı: {DB_PATH}")
+        st.info("Lütfen önce veri yükleme scriptlerini çalıştırın.")
+        st.stop()
+    
+    if not os.path.exists(DB_PATH):
+        return connect_shards(SHARD_DIR, check_same_thread=False)
+    return sqlite3.connect(DB_PATH, check_same_thread=False)
+
+@st.cache_resource(max_entries=2)
+def open_snapshot(data_version, manifest_mtime):
+    """Veri sürümüne ait snapshot'ı memory-map ile aç (tüm oturumlar paylaşır); yoksa/eskiyse None"""
+    from src.loaders.snapshot import open_snapshot as open_snapshot_files
+    return open_snapshot_files(SNAPSHOT_DIR, data_version)
+
+@st.cache_resource(max_entries=64)
+def load_season_table(data_version, name, season_id):
+    """Sezon tablosu Arrow olarak; tüm oturumlar aynı nesneyi paylaşır (kopyalanmaz, pickle'lanmaz)
+    
+    Snapshot varsa memory-map'li dosyanın sıfır kopyalı dilimidir; yoksa aynı adlı
+    SQL sorgusunun sonucu bir kez Arrow'a çevrilir.
+    """
+    # Snapshot yüklemeden biraz sonra yayınlanır; manifest zamanı anahtarda olduğu
+    # için yayından önce cache'lenen "snapshot yok" sonucu kalıcı olmaz
+    manifest_path = os.path.join(SNAPSHOT_DIR, 'manifest.json')
+    manifest_mtime = os.stat(manifest_path).st_mtime_ns if os.path.exists(manifest_path) else None
+    snapshot = open_snapshot(data_version, manifest_mtime)
+    if snapshot is not None:
+        return snapshot.season_table(name, season_id)
+    
+    import pyarrow as pa
+    return pa.Table.from_pandas(read_query(get_connection(data_version), name, season_id=season_id),
+                                preserve_index=False)
+
+@st.cache_data
+def load_seasons(data_version):
+    """Veritabanındaki lig-sezon listesi: (season_id, competition_code, competition_name, season_year)"""
+    return run_query(get_connection(data_version), 'seasons')[1]
+
+# Aşağıdaki yükleyiciler cache'lenmez: grafikler pandas ister, dönüşüm her çağrıda
+# paylaşılan Arrow tablosundan yapılır ve oturum başına kopya saklanmaz
+def load_standings(data_version, season_id):
+    """Seçili sezonun puan durumunu yükle"""
+    return load_season_table(data_version, 'standings', season_id).to_pandas()
+
+def load_matches(data_version, season_id):
+    """Seçili sezonun oynanmış maçlarını yükle"""
+    return load_season_table(data_version, 'matches', season_id).to_pandas()
+
+def get_team_stats(data_version, season_id):
+    """Seçili sezonun takım istatistikleri"""
+    return load_season_table(data_version, 'team_stats', season_id).to_pandas()
+
+@st.cache_data
+def load_referee_stats(data_version, season_id=None):
+    """Önceden hesaplanmış hakem istatistikleri; season_id None ise tüm lig ve sezonlar"""
+    if season_id is None:
+        return read_query(get_connection(data_version), 'referee_all_stats')
+    return read_query(get_connection(data_version), 'referee_season_stats', season_id=season_id)
+
+@st.cache_data
+def count_remaining_matches(data_version, season_id):
+    """Sezonun oynanmamış maç sayısı"""
+    return run_query(get_connection(data_version), 'remaining_matches', season_id=season_id)[1][0][0]
+
+@st.cache_data(show_spinner="Sezon simüle ediliyor...")
+def load_season_probabilities(data_version, season_id, n_simulations=100_000):
+    """Kalan fikstürün Monte Carlo simülasyonu (veri sürümüne göre cache'lenir)"""
+    from src.models.season_simulator import SeasonSimulator
+    return SeasonSimulator(season_db_path(season_id)).simulate(season_id=season_id, n_simulations=n_simulations)
+
+@st.cache_data
+def find_team_id(data_version, season_id, team_name):
+    """Sezondaki takım adından takım ID'si"""
+    return run_query(get_connection(data_version), 'team_id', season_id=season_id, team_name=team_name)[1][0][0]
+
+@st.cache_resource(max_entries=32, show_spinner="Dosya hazırlanıyor...")
+def prepare_export(data_version, report, season_id, extension, team_id=None):
+    """Dışa aktarma dosyasını diske üret ve yolunu döndür (veri sürümüne göre cache'lenir)
+    
+    Exporter kendi bağlantısıyla parça parça okur ve yazar; aynı dosyayı isteyen
+    oturumlar tek üretimi bekler, diğer oturumlar etkilenmez.
+    """
+    from src.exporters.report_exporter import ReportExporter
+    
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    name = f"{report}_{season_id}_{team_id or 'all'}_{data_version}"
+    path = os.path.join(EXPORT_DIR, f"{name}{extension}")
+    if os.path.exists(path):
+        return path
+    
+    exporter = ReportExporter(season_db_path(season_id))
+    tmp_path = os.path.join(EXPORT_DIR, f"{name}.{os.getpid()}.tmp{extension}")
+    if report == 'standings':
+        exporter.export_standings(season_id, tmp_path)
+    elif report == 'matches':
+        exporter.export_matches(tmp_path, season_id=season_id)
+    else:
+        exporter.export_team_report(team_id, season_id, tmp_path)
+    os.replace(tmp_path, path)
+    
+    return path
@@ -0,0 +1,335 @@
+# dashboard/figures.py
+# Cache'lenen grafik katmanı. Her grafik (veri sürümü, sezon, parametreler)
+# anahtarıyla bir kez üretilir; widget değişikliğinde yalnızca o widget'a bağlı
+# grafikler yeniden çizilir. Plotly ağır bir import olduğu için fonksiyonların
+# içinde, ilk ihtiyaç anında yüklenir.
+# Nokta ve çizgi grafikleri aşağıdaki yardımcılardan geçer: her grafik en fazla
+# MAX_POINTS nokta gönderir (fazlası ızgarada toplanır ya da LTTB ile seyreltilir),
+# WEBGL_THRESHOLD üstü SVG yerine WebGL ile çizilir.
+import streamlit as st
+
+from dashboard.data import load_standings, load_matches, get_team_stats, load_season_probabilities, load_referee_stats
+
+# Bir grafikte tarayıcıya gönderilen en fazla nokta sayısı
+MAX_POINTS = 2000
+
+# Bu sayının üstündeki nokta/çizgi grafikleri WebGL ile çizilir
+WEBGL_THRESHOLD = 500
+
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: seriyi görünür şeklini koruyarak n_out noktaya indir (seçilen indeksler)
+    
+    x artan sırada olmalıdır. İlk ve son nokta her zaman korunur; aradaki her
+    kovadan, önceki seçilen nokta ve sonraki kovanın ortalamasıyla en büyük
+    üçgeni oluşturan nokta seçilir.
+    """
+    import numpy as np
+    
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    
+    selected = np.empty(n_out, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:next_end].mean(), y[end:next_end].mean()
+        
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+def downsample_series(df, x, y_columns, max_points=MAX_POINTS):
+    """Çizgi verisini x'e göre sırala; max_points üstündeyse her seri için LTTB ile seyrelt"""
+    import numpy as np
+    import pandas as pd
+    
+    df = df.sort_values(x)
+    if len(df) <= max_points:
+        return df
+    
+    x_values = df[x]
+    if pd.api.types.is_datetime64_any_dtype(x_values):
+        x_values = x_values.astype('int64')
+    
+    # Birden fazla seri aynı x eksenini paylaşır; her serinin önemli noktaları korunur
+    per_series = max(max_points // len(y_columns), 3)
+    selected = np.unique(np.concatenate([lttb(x_values.to_numpy(), df[y].to_numpy(), per_series) for y in y_columns]))
+    return df.iloc[selected]
+
+def bin_points(df, x, y, max_points=MAX_POINTS, weight=None):
+    """Noktaları en fazla max_points hücreli ızgarada topla
+    
+    Her hücre tek nokta olur: sayısal kolonların ortalaması (weight kolonu için
+    toplamı) ve hücredeki nokta sayısı ('n'). Sayısal olmayan kolonlar düşer.
+    """
+    import numpy as np
+    
+    if len(df) <= max_points:
+        return df
+    
+    side = int(np.sqrt(max_points))
+    numeric = df.select_dtypes('number')
+    cells = [((numeric[col] - numeric[col].min()) / ((numeric[col].max() - numeric[col].min()) or 1) * (side - 1))
+             .round().astype(int) for col in (x, y)]
+    
+    aggregations = {col: ('sum' if col == weight else 'mean') for col in numeric.columns}
+    binned = numeric.groupby(cells).agg(aggregations)
+    binned['n'] = numeric.groupby(cells).size()
+    return binned.reset_index(drop=True)
+
+def scatter(df, x, y, size=None, hover_data=None, **kwargs):
+    """px.scatter: MAX_POINTS üstü ızgarada toplanır, WEBGL_THRESHOLD üstü WebGL ile çizilir"""
+    import plotly.express as px
+    
+    if len(df) > MAX_POINTS:
+        df = bin_points(df, x, y, MAX_POINTS, weight=size)
+        hover_data = [col for col in (hover_data or []) if col in df.columns] + ['n']
+        if kwargs.get('color') not in df.columns:
+            kwargs.pop('color', None)
+    
+    render_mode = 'webgl' if len(df) > WEBGL_THRESHOLD else 'svg'
+    return px.scatter(df, x=x, y=y, size=size, hover_data=hover_data, render_mode=render_mode, **kwargs)
+
+def line(df, x, y, **kwargs):
+    """px.line: MAX_POINTS üstü LTTB ile seyreltilir, WEBGL_THRESHOLD üstü WebGL ile çizilir"""
+    import plotly.express as px
+    
+    df = downsample_series(df, x, [y] if isinstance(y, str) else list(y))
+    render_mode = 'webgl' if len(df) > WEBGL_THRESHOLD else 'svg'
+    return px.line(df, x=x, y=y, render_mode=render_mode, **kwargs)
+
+def filter_matches(matches_df, team, matchday_range):
+    """Maçları takım ve hafta aralığına göre filtrele"""
+    filtered_df = matches_df
+    
+    if team != "Tüm Takımlar":
+        filtered_df = filtered_df[(filtered_df['home_team_name'] == team) |
+                                  (filtered_df['away_team_name'] == team)]
+    
+    return filtered_df[(filtered_df['matchday'] >= matchday_range[0]) &
+                       (filtered_df['matchday'] <= matchday_range[1])]
+
+@st.cache_resource(max_entries=256)
+def top5_points_bar(data_version, season_id):
+    """İlk 5 takımın puan grafiği"""
+    import plotly.express as px
+    
+    top5 = load_standings(data_version, season_id).head()
+    
+    fig = px.bar(top5, x='team_name', y='points',
+                 color='points',
+                 color_continuous_scale='Blues',
+                 title='Puan Durumu - İlk 5')
+    fig.update_layout(showlegend=False)
+    return fig
+
+@st.cache_resource(max_entries=256)
+def top_scorers_bar(data_version, season_id):
+    """En çok gol atan 5 takım"""
+    import plotly.express as px
+    
+    standings_df = load_standings(data_version, season_id)
+    top_scorers = standings_df.nlargest(5, 'goals_for')[['team_name', 'goals_for']]
+    
+    fig = px.bar(top_scorers, x='goals_for', y='team_name',
+                 orientation='h',
+                 color='goals_for',
+                 color_continuous_scale='Reds')
+    fig.update_layout(showlegend=False, yaxis={'categoryorder':'total ascending'})
+    return fig
+
+@st.cache_resource(max_entries=256)
+def best_defense_bar(data_version, season_id):
+    """En az gol yiyen 5 takım"""
+    import plotly.express as px
+    
+    standings_df = load_standings(data_version, season_id)
+    best_defense = standings_df.nsmallest(5, 'goals_against')[['team_name', 'goals_against']]
+    
+    fig = px.bar(best_defense, x='goals_against', y='team_name',
+                 orientation='h',
+                 color='goals_against',
+                 color_continuous_scale='Greens_r')
+    fig.update_layout(showlegend=False, yaxis={'categoryorder':'total ascending'})
+    return fig
+
+@st.cache_resource(max_entries=256)
+def position_heatmap(data_version, season_id):
+    """Simülasyondan gelen takım x sıra olasılık ısı haritası"""
+    import plotly.express as px
+    
+    probs = load_season_probabilities(data_version, season_id)
+    position_cols = [c for c in probs.columns if c.startswith('pos_')]
+    
+    return px.imshow(probs.set_index('team_name')[position_cols] * 100,
+                     labels={'x': 'Sıra', 'y': 'Takım', 'color': '%'},
+                     x=[c.split('_')[1] for c in position_cols],
+                     color_continuous_scale='Blues', aspect='auto')
+
+@st.cache_resource(max_entries=256)
+def goal_distribution_bar(data_version, season_id, team, matchday_range):
+    """Filtrelenmiş maçlardaki toplam gol dağılımı"""
+    import plotly.express as px
+    
+    filtered_df = filter_matches(load_matches(data_version, season_id), team, matchday_range)
+    goal_dist = filtered_df['total_goals'].value_counts().sort_index()
+    
+    return px.bar(x=goal_dist.index, y=goal_dist.values,
+                  labels={'x': 'Toplam Gol', 'y': 'Maç Sayısı'},
+                  title='Maçlardaki Toplam Gol Dağılımı')
+
+@st.cache_resource(max_entries=256)
+def home_away_bar(data_version, season_id, team):
+    """Takımın ev sahibi / deplasman galibiyet oranı"""
+    import pandas as pd
+    import plotly.express as px
+    
+    team_stats_df = get_team_stats(data_version, season_id)
+    team_stats = team_stats_df[team_stats_df['team_name'] == team].iloc[0]
+    
+    home_away_data = pd.DataFrame({
+        'Konum': ['Ev Sahibi', 'Deplasman'],
+        'Galibiyet': [int(team_stats['home_wins']), int(team_stats['away_wins'])],
+        'Maç': [int(team_stats['home_games']), int(team_stats['away_games'])]
+    })
+    home_away_data['Galibiyet %'] = (home_away_data['Galibiyet'] / home_away_data['Maç'] * 100).round(1)
+    
+    return px.bar(home_away_data, x='Konum', y='Galibiyet %',
+                  color='Konum',
+                  color_discrete_map={'Ev Sahibi': '#1f77b4', 'Deplasman': '#ff7f0e'},
+                  title='Ev Sahibi vs Deplasman Galibiyet Oranı')
+
+@st.cache_resource(max_entries=256)
+def form_line(data_version, season_id, team):
+    """Son 5 maç formu; form verisi yoksa None"""
+    import pandas as pd
+    
+    standings_df = load_standings(data_version, season_id)
+    form = standings_df[standings_df['team_name'] == team].iloc[0]['form']
+    if not form:
+        return None
+    
+    form_data = []
+    for i, result in enumerate(form[-5:]):
+        form_data.append({
+            'Maç': i+1,
+            'Sonuç': result,
+            'Puan': 3 if result == 'W' else (1 if result == 'D' else 0)
+        })
+    form_df = pd.DataFrame(form_data)
+    
+    fig = line(form_df, x='Maç', y='Puan',
+               markers=True,
+               title='Son 5 Maç Formu')
+    fig.update_yaxes(range=[-0.5, 3.5], tickvals=[0, 1, 3], ticktext=['L', 'D', 'W'])
+    return fig
+
+@st.cache_resource(max_entries=256)
+def points_scatter(data_version, season_id):
+    """Puan vs oynanan maç (gol sayısına göre boyut)"""
+    return scatter(load_standings(data_version, season_id), x='played_games', y='points',
+                   size='goals_for', color='position',
+                   hover_data=['team_name'],
+                   title='Puan vs Oynanan Maç (Gol Sayısına Göre)',
+                   color_continuous_scale='RdYlGn_r')
+
+@st.cache_resource(max_entries=256)
+def attack_defense_scatter(data_version, season_id):
+    """Atılan vs yenilen gol, lig ortalaması çizgileriyle"""
+    standings_df = load_standings(data_version, season_id)
+    
+    fig = scatter(standings_df, x='goals_for', y='goals_against',
+                  color='points', size='points',
+                  hover_data=['team_name', 'position'],
+                  title='Atak vs Savunma Performansı',
+                  color_continuous_scale='Blues')
+    fig.add_hline(y=standings_df['goals_against'].mean(), line_dash="dash", line_color="gray")
+    fig.add_vline(x=standings_df['goals_for'].mean(), line_dash="dash", line_color="gray")
+    return fig
+
+@st.cache_resource(max_entries=256)
+def team_radar(data_version, season_id, team1, team2):
+    """İki takımın radar karşılaştırması"""
+    import plotly.graph_objects as go
+    
+    standings_df = load_standings(data_version, season_id)
+    categories = ['Puan', 'Galibiyet', 'Atılan Gol', 'Az Yenilen Gol', 'Puan/Maç']
+    
+    # Az yenilen gol: ligin en çok gol yiyen takımına göre fark
+    max_goals_against = standings_df['goals_against'].max()
+    
+    fig = go.Figure()
+    
+    for team in [team1, team2]:
+        team_data = standings_df[standings_df['team_name'] == team].iloc[0]
+        fig.add_trace(go.Scatterpolar(
+            r=[team_data['points'], team_data['won'], team_data['goals_for'],
+               max_goals_against-team_data['goals_against'], team_data['points_per_game']*10],
+            theta=categories,
+            fill='toself',
+            name=team
+        ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(visible=True, range=[0, 100])
+        ),
+        title="Takım Performans Karşılaştırması",
+        showlegend=True
+    )
+    return fig
+
+@st.cache_resource(max_entries=256)
+def weekly_goals_line(data_version, season_id):
+    """Haftalık ortalama gol sayısı"""
+    matches_df = load_matches(data_version, season_id)
+    weekly_goals = matches_df.groupby('matchday')['total_goals'].agg(['sum', 'count', 'mean'])
+    weekly_goals['avg_goals'] = weekly_goals['mean']
+    
+    fig = line(weekly_goals.reset_index(), x='matchday', y='avg_goals',
+               title='Haftalık Ortalama Gol Sayısı',
+               labels={'matchday': 'Hafta', 'avg_goals': 'Ortalama Gol'})
+    fig.add_hline(y=weekly_goals['avg_goals'].mean(), line_dash="dash",
+                  line_color="red", annotation_text="Sezon Ortalaması")
+    return fig
+
+@st.cache_resource(max_entries=256)
+def result_share_area(data_version, season_id):
+    """Haftalık ev sahibi / beraberlik / deplasman oranları"""
+    import plotly.express as px
+    
+    matches_df = load_matches(data_version, season_id)
+    home_advantage = matches_df.groupby('matchday')[['is_home_win', 'is_draw', 'is_away_win']].mean() * 100
+    home_advantage = downsample_series(home_advantage.reset_index(), 'matchday',
+                                       ['is_home_win', 'is_draw', 'is_away_win'])
+    
+    return px.area(home_advantage, x='matchday',
+                   y=['is_home_win', 'is_draw', 'is_away_win'],
+                   title='Maç Sonucu Dağılımı (%)',
+                   labels={'value': 'Yüzde (%)', 'matchday': 'Hafta'},
+                   color_discrete_map={'is_home_win': '#2E7D32', 'is_draw': '#FFA000', 'is_away_win': '#C62828'})
+
+@st.cache_resource(max_entries=256)
+def referee_scatter(data_version, season_id, min_matches):
+    """Hakem başına ev sahibi galibiyet oranı vs maç başı gol (season_id None: tüm ligler)"""
+    referee_df = load_referee_stats(data_version, season_id)
+    referee_df = referee_df[referee_df['matches_officiated'] >= min_matches]
+    
+    fig = scatter(referee_df, x='goals_per_game', y='home_win_rate',
+                  size='matches_officiated', hover_data=['referee_name', 'nationality'],
+                  labels={'goals_per_game': 'Maç Başı Gol', 'home_win_rate': 'Ev Sahibi Galibiyet %', 'n': 'Hakem'},
+                  title='Hakemler: Ev Sahibi Galibiyet Oranı vs Maç Başı Gol')
+    if not referee_df.empty:
+        # Ağırlıklı ortalama: hakemlerin yönettiği tüm maçlar üzerinden
+        average = referee_df['home_wins'].sum() / referee_df['matches_officiated'].sum() * 100
+        fig.add_hline(y=average, line_dash="dash", line_color="gray", annotation_text="Ortalama")
+    return fig
@@ -0,0 +1,266 @@
+# src/api/server.py
+# Futbol veritabanı için salt-okunur, asyncio tabanlı REST API.
+# Sorgular dashboard ile aynıdır (src/database/queries.py). Yanıtlar veri
+# sürümünden türetilen güçlü ETag'lerle döner; istemci If-None-Match
+# gönderirse veritabanına gidilmeden 304 verilir.
+import argparse
+import asyncio
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+
+from aiohttp import web
+
+from configs.config import DATABASE_PATH
+from src.database.queries import run_query, latency_histograms
+from src.utils.data_version import get_data_version, read_only_uri
+
+POOL_SIZE = 4
+CACHE_SIZE = 1024
+
+JSON_TYPE = 'application/json'
+ARROW_TYPE = 'application/vnd.apache.arrow.stream'
+
+
+def to_json(columns, rows):
+    """Satırları nesne listesi olarak JSON'a çevir"""
+    return json.dumps([dict(zip(columns, row)) for row in rows],
+                      ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def error_response(http_error, message):
+    """JSON gövdeli HTTP hatası"""
+    return http_error(text=json.dumps({'error': message}, ensure_ascii=False), content_type=JSON_TYPE)
+
+
+def to_arrow(columns, rows):
+    """Satırları Arrow IPC stream formatına çevir"""
+    import pyarrow as pa
+
+    arrays = [pa.array(list(values)) for values in zip(*rows)] if rows else \
+        [pa.array([], type=pa.null()) for _ in columns]
+    table = pa.Table.from_arrays(arrays, names=columns)
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+class ConnectionPool:
+    """Sabit sayıda salt-okunur sqlite bağlantısı; sorgular event loop'u bloklamamak için thread'de çalışır
+
+    Loader yeni veritabanını rename ile yayınladığında açık bağlantılar eski dosyayı
+    okumaya devam eder; bu yüzden her bağlantı açıldığı veri sürümüyle tutulur ve
+    sürüm değişince yeniden açılır.
+    """
+    def __init__(self, db_path, size=POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle = None
+
+    def _connect(self):
+        # Sürüm bağlantıdan önce okunur: arada yeni sürüm yayınlanırsa bağlantı en kötü
+        # yeni dosyaya eski sürüm etiketiyle açılır ve bir sonraki fetch'te yenilenir
+        version = get_data_version(self.db_path)
+        conn = sqlite3.connect(read_only_uri(self.db_path), uri=True, check_same_thread=False)
+        return [conn, version]
+
+    def _run(self, slot, query, params):
+        """Thread'de çalışır: sürüm değiştiyse slot'un bağlantısını yenile, sorguyu çalıştır"""
+        if slot[1] != get_data_version(self.db_path):
+            conn = slot[0]
+            slot[:] = self._connect()
+            conn.close()
+        return run_query(slot[0], query, **params)
+
+    def open(self):
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._idle.put_nowait(self._connect())
+
+    def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait()[0].close()
+
+    async def fetch(self, query, **params):
+        """Adlandırılmış sorguyu boştaki bir bağlantıda çalıştır: (sütunlar, satırlar)
+
+        Yayından sonraki yeniden bağlanma da (stat + soğuk dosyada connect) sorguyla
+        birlikte thread'de yapılır; event loop diğer istekleri beklemeden karşılar.
+        """
+        slot = await self._idle.get()
+        try:
+            return await asyncio.to_thread(self._run, slot, query, params)
+        finally:
+            self._idle.put_nowait(slot)
+
+
+class ResponseCache:
+    """Serileştirilmiş yanıtlar için LRU cache; veri sürümü değişince boşaltılır"""
+    def __init__(self, max_entries=CACHE_SIZE):
+        self.max_entries = max_entries
+        self.version = None
+        self._entries = OrderedDict()
+
+    def get(self, version, key):
+        if version != self.version:
+            self._entries.clear()
+            self.version = version
+            return None
+
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, version, key, body):
+        if version != self.version or self.max_entries <= 0:
+            return
+        self._entries[key] = body
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class FootballApi:
+    def __init__(self, db_path=DATABASE_PATH, pool_size=POOL_SIZE, cache_size=CACHE_SIZE):
+        self.db_path = db_path
+        self.pool = ConnectionPool(db_path, pool_size)
+        self.cache = ResponseCache(cache_size)
+        # Aynı yanıtı bekleyen eşzamanlı istekler tek sorguyu paylaşır
+        self._inflight = {}
+
+    def make_app(self):
+        """aiohttp uygulamasını oluştur"""
+        app = web.Application()
+        app.on_startup.append(self._on_startup)
+        app.on_cleanup.append(self._on_cleanup)
+        app.router.add_get('/health', self.health)
+        app.router.add_get('/metrics/queries', self.query_metrics)
+        app.router.add_get('/seasons', self.seasons)
+        app.router.add_get(r'/seasons/{season_id:\d+}/standings', self.standings)
+        app.router.add_get(r'/seasons/{season_id:\d+}/matches', self.matches)
+        app.router.add_get(r'/seasons/{season_id:\d+}/team-stats', self.team_stats)
+        app.router.add_get(r'/h2h/{team_a:\d+}/{team_b:\d+}', self.head_to_head)
+        return app
+
+    async def _on_startup(self, app):
+        if get_data_version(self.db_path) is None:
+            raise RuntimeError(f"Veritabanı dosyası bulunamadı: {self.db_path}")
+        self.pool.open()
+        print(f"✅ API hazır: {self.db_path} ({self.pool.size} bağlantı)")
+
+    async def _on_cleanup(self, app):
+        self.pool.close()
+
+    @staticmethod
+    def _negotiate(request):
+        """?format=json|arrow ya da Accept başlığına göre yanıt formatı"""
+        fmt = request.query.get('format')
+        if fmt is None:
+            fmt = 'arrow' if ARROW_TYPE in request.headers.get('Accept', '') else 'json'
+        if fmt not in ('json', 'arrow'):
+            raise error_response(web.HTTPBadRequest, f"Geçersiz format: {fmt}")
+        return fmt
+
+    @staticmethod
+    def _etag(version, request, fmt):
+        """Veri sürümü + yol + sorgu parametreleri + formattan güçlü ETag"""
+        query = '&'.join(f'{k}={v}' for k, v in sorted(request.query.items()) if k != 'format')
+        digest = hashlib.blake2b(f'{version}|{request.path}|{query}|{fmt}'.encode('utf-8'), digest_size=16)
+        return f'"{digest.hexdigest()}"'
+
+    @staticmethod
+    def _not_modified(request, etag):
+        header = request.headers.get('If-None-Match')
+        if not header:
+            return False
+        candidates = [tag.strip().removeprefix('W/') for tag in header.split(',')]
+        return '*' in candidates or etag in candidates
+
+    async def _build(self, fmt, query, params, season_id):
+        columns, rows = await self.pool.fetch(query, **(params or {}))
+        if not rows and season_id is not None:
+            _, exists = await self.pool.fetch('season_exists', season_id=season_id)
+            if not exists:
+                return None
+
+        if fmt == 'arrow':
+            return await asyncio.to_thread(to_arrow, columns, rows)
+        return to_json(columns, rows)
+
+    async def _respond(self, request, query, params=None, season_id=None):
+        """Ortak yanıt akışı: ETag/304 -> LRU cache -> veritabanı"""
+        fmt = self._negotiate(request)
+        version = get_data_version(self.db_path)
+        etag = self._etag(version, request, fmt)
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+
+        if self._not_modified(request, etag):
+            return web.Response(status=304, headers=headers)
+
+        body = self.cache.get(version, etag)
+        if body is None:
+            task = self._inflight.get(etag)
+            if task is None:
+                task = asyncio.ensure_future(self._build(fmt, query, params, season_id))
+                self._inflight[etag] = task
+                task.add_done_callback(lambda _: self._inflight.pop(etag, None))
+
+            try:
+                body = await asyncio.shield(task)
+            except ImportError:
+                raise error_response(web.HTTPNotAcceptable, "Arrow formatı için pyarrow gerekli")
+
+            if body is None:
+                raise error_response(web.HTTPNotFound, f"Sezon bulunamadı: {season_id}")
+            self.cache.put(version, etag, body)
+
+        return web.Response(body=body, headers=headers,
+                            content_type=ARROW_TYPE if fmt == 'arrow' else JSON_TYPE,
+                            charset=None if fmt == 'arrow' else 'utf-8')
+
+    async def health(self, request):
+        return web.json_response({'status': 'ok', 'data_version': get_data_version(self.db_path)})
+
+    async def query_metrics(self, request):
+        """Sunucu açıldığından beri sorgu başına gecikme histogramları (src/database/queries.py)"""
+        return web.json_response(latency_histograms())
+
+    async def seasons(self, request):
+        """Lig-sezon listesi"""
+        return await self._respond(request, 'seasons')
+
+    async def standings(self, request):
+        """Sezonun puan durumu"""
+        season_id = int(request.match_info['season_id'])
+        return await self._respond(request, 'standings', {'season_id': season_id}, season_id)
+
+    async def matches(self, request):
+        """Sezonun oynanmış maçları"""
+        season_id = int(request.match_info['season_id'])
+        return await self._respond(request, 'matches', {'season_id': season_id}, season_id)
+
+    async def team_stats(self, request):
+        """Sezonun ev sahibi / deplasman takım istatistikleri"""
+        season_id = int(request.match_info['season_id'])
+        return await self._respond(request, 'team_stats', {'season_id': season_id}, season_id)
+
+    async def head_to_head(self, request):
+        """İki takımın tüm sezonlardaki karşılaşmaları"""
+        team_a, team_b = int(request.match_info['team_a']), int(request.match_info['team_b'])
+        return await self._respond(request, 'h2h', {'team_a': team_a, 'team_b': team_b})
+
+# Sunucuyu başlat
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Futbol veritabanı için salt-okunur REST API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--db', default=DATABASE_PATH)
+    parser.add_argument('--pool-size', type=int, default=POOL_SIZE)
+    parser.add_argument('--cache-size', type=int, default=CACHE_SIZE)
+    args = parser.parse_args()
+
+    api = FootballApi(args.db, pool_size=args.pool_size, cache_size=args.cache_size)
+    web.run_app(api.make_app(), host=args.host, port=args.port, access_log=None)
@@ -0,0 +1,163 @@
+# src/cli.py
+# Tek komut satırı giriş noktası (pyproject.toml'da football-etl):
+#
+#   football-etl [--data-dir KLASÖR] [--env-file .env] {extract,transform,load,run,inspect} ...
+#
+# Açılışın hızlı kalması için burada yalnızca argparse ve configs.config
+# yüklenir; requests, pandas ve Polars alt komutun kendi modülüyle, komut
+# çalışırken yüklenir. Ayarlar (veri klasörü, API anahtarı) modüller
+# yüklenmeden önce bir kez çözülür ve alt komutlara argüman olarak verilir.
+import argparse
+import sys
+import time
+
+from configs.config import LEAGUES, SEASONS, ENDPOINTS, API_BASE_URL, TRANSFORM_ENGINE, configure
+
+
+def cmd_extract(args, settings):
+    """Seçili lig-sezonların ham JSON'larını API'den çek"""
+    from src.extractors.football_data_extractor import FootballDataExtractor
+    from src.pipeline.backfill import parse_seasons
+
+    extractor = FootballDataExtractor(base_url=args.base_url, api_key=settings['FOOTBALL_DATA_API_KEY'],
+                                      raw_path=settings['RAW_DATA_PATH'])
+    extractor.extract_all(args.competitions, parse_seasons(args.seasons), args.endpoints)
+
+
+def cmd_transform(args, settings):
+    """Her lig-sezonun en son ham dosyalarını işlenmiş tablolara dönüştür"""
+    from src.transformers.football_data_transformer import FootballDataTransformer, find_latest_raw_files
+
+    transformer = FootballDataTransformer(engine=args.engine, processed_path=settings['PROCESSED_DATA_PATH'])
+    groups = find_latest_raw_files(settings['RAW_DATA_PATH'])
+    print(f"📊 İşleniyor: {len(groups)} lig-sezon ({transformer.engine.name})")
+
+    start = time.perf_counter()
+    transformer.transform_batch(groups, fmt=args.format)
+    print(f"⏱️ {time.perf_counter() - start:.2f} sn, 📁 {transformer.processed_path}")
+
+
+def cmd_load(args, settings):
+    """İşlenmiş dosyaları ya da (--from-raw) dönüştürücünün bellekteki tablolarını yükle ve yayınla"""
+    from src.loaders.database_loader import load_all, load_batches, load_sharded
+
+    if args.from_raw:
+        from src.transformers.football_data_transformer import FootballDataTransformer, find_latest_raw_files
+
+        transformer = FootballDataTransformer(engine=args.engine, processed_path=settings['PROCESSED_DATA_PATH'])
+        checkpoint_path = settings['PROCESSED_DATA_PATH'] if args.checkpoint else None
+        batches = transformer.transform_frames(find_latest_raw_files(settings['RAW_DATA_PATH']), checkpoint_path)
+        load_batches(batches, settings['DATABASE_PATH'], settings['SNAPSHOT_PATH'])
+    elif args.sharded:
+        load_sharded(settings['PROCESSED_DATA_PATH'], args.shard_dir or settings['SHARD_PATH'], args.workers)
+    else:
+        load_all(settings['PROCESSED_DATA_PATH'], settings['DATABASE_PATH'], settings['SNAPSHOT_PATH'])
+
+
+def cmd_run(args, settings):
+    """Tüm akış: eksik birimleri indir, lig-sezon tamamlandıkça dönüştür ve yükle"""
+    from src.pipeline import backfill
+
+    if args.status:
+        backfill.print_status(settings['CHECKPOINT_PATH'])
+        return
+
+    from src.extractors.football_data_extractor import FootballDataExtractor
+
+    extractor = FootballDataExtractor(base_url=args.base_url, api_key=settings['FOOTBALL_DATA_API_KEY'],
+                                      raw_path=settings['RAW_DATA_PATH'])
+    backfill.Backfill(args.competitions, backfill.parse_seasons(args.seasons), args.endpoints,
+                      db_path=settings['DATABASE_PATH'], checkpoint_path=settings['CHECKPOINT_PATH'],
+                      max_retries=args.max_retries if args.max_retries is not None else backfill.MAX_RETRIES,
+                      extractor=extractor, snapshot_dir=settings['SNAPSHOT_PATH']).run(retry_failed=args.retry_failed)
+
+
+def cmd_inspect(args, settings):
+    """Ham arşivin şemasını çıkar, şema kaymasını ve dönüştürücü risklerini raporla"""
+    from src.utils.data_inspector import ArchiveInspector, print_report
+
+    start = time.perf_counter()
+    inspector = ArchiveInspector(settings['RAW_DATA_PATH'], settings['INSPECTOR_CACHE_PATH'], args.workers)
+    report = inspector.inspect()
+    inspector.close()
+    print(f"📋 {report['files']} dosya ({report['inspected']} yeni incelendi, diğerleri cache'ten) "
+          f"{time.perf_counter() - start:.2f} sn")
+
+    print_report(report, args.kind, args.schema)
+
+
+def _add_scope_arguments(parser):
+    """extract ve run'ın ortak lig / sezon / veri türü seçenekleri"""
+    parser.add_argument('--competitions', nargs='+', default=list(LEAGUES), choices=list(LEAGUES))
+    parser.add_argument('--seasons', nargs='+', default=[str(s) for s in SEASONS],
+                        help="Sezon başlangıç yılları ya da aralık (ör. 2014-2023)")
+    parser.add_argument('--endpoints', nargs='+', default=list(ENDPOINTS), choices=list(ENDPOINTS))
+    parser.add_argument('--base-url', default=API_BASE_URL,
+                        help="API adresi (ör. src/extractors/mock_server.py için http://127.0.0.1:8090/v4)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='football-etl', description="football-data.org ETL akışı")
+    parser.add_argument('--data-dir', help="Veri klasörü (varsayılan: FOOTBALL_DATA_DIR ya da proje kökündeki data/)")
+    parser.add_argument('--env-file', help="API anahtarının okunacağı .env dosyası")
+    commands = parser.add_subparsers(dest='command', metavar='KOMUT', required=True)
+
+    extract = commands.add_parser('extract', help="Ham verileri API'den çek")
+    _add_scope_arguments(extract)
+    extract.set_defaults(handler=cmd_extract)
+
+    transform = commands.add_parser('transform', help="Ham JSON dosyalarını işlenmiş tablolara dönüştür")
+    transform.add_argument('--engine', default=TRANSFORM_ENGINE, choices=['pandas', 'polars'])
+    transform.add_argument('--format', default='csv', choices=['csv', 'parquet'])
+    transform.set_defaults(handler=cmd_transform)
+
+    load = commands.add_parser('load', help="İşlenmiş dosyaları veritabanına yükle")
+    load.add_argument('--sharded', action='store_true', help="Her lig için ayrı veritabanı dosyası (paralel yükleme)")
+    load.add_argument('--shard-dir', help="Shard klasörü (varsayılan: veri klasöründeki shards/)")
+    load.add_argument('--workers', type=int, help="Paralel yükleyen süreç sayısı (--sharded, varsayılan: CPU sayısı)")
+    load.add_argument('--from-raw', action='store_true',
+                      help="Ham dosyaları dönüştürüp tabloları bellekte yükle (CSV yazılıp okunmaz)")
+    load.add_argument('--engine', default=TRANSFORM_ENGINE, choices=['pandas', 'polars'], help="--from-raw için")
+    load.add_argument('--checkpoint', action='store_true',
+                      help="--from-raw: tabloları işlenmiş veri klasörüne Parquet olarak da yaz")
+    load.set_defaults(handler=cmd_load)
+
+    run = commands.add_parser('run', help="İndir, dönüştür ve yükle (kaldığı yerden devam eder)")
+    _add_scope_arguments(run)
+    run.add_argument('--max-retries', type=int, help="Geçici hatalarda tekrar deneme sayısı")
+    run.add_argument('--retry-failed', action='store_true', help="Kalıcı hata almış birimleri de tekrar dene")
+    run.add_argument('--status', action='store_true', help="Yalnızca checkpoint durumunu göster")
+    run.set_defaults(handler=cmd_run)
+
+    inspect = commands.add_parser('inspect', help="Ham arşivin şemasını ve şema kaymasını raporla")
+    inspect.add_argument('--workers', type=int, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    inspect.add_argument('--kind', choices=list(ENDPOINTS), help="Yalnızca bu veri türü")
+    inspect.add_argument('--schema', action='store_true', help="Birleşik şemayı alan alan göster")
+    inspect.set_defaults(handler=cmd_inspect)
+
+    return parser
+
+
+def _check_load_arguments(parser, args):
+    """load seçeneklerinin birlikte kullanılabilirliği: --from-raw tek veritabanına yükler"""
+    if args.from_raw:
+        given = {'--sharded': args.sharded, '--workers': args.workers is not None,
+                 '--shard-dir': args.shard_dir is not None}
+        sharded = [option for option, value in given.items() if value]
+        if sharded:
+            parser.error(f"load: --from-raw, {', '.join(sharded)} ile birlikte kullanılamaz")
+    elif args.checkpoint:
+        parser.error("load: --checkpoint yalnızca --from-raw ile kullanılır")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == 'load':
+        _check_load_arguments(parser, args)
+    settings = configure(data_dir=args.data_dir, env_file=args.env_file)
+    args.handler(args, settings)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+# src/database/change_log.py
+# change_log tablosunu kaldığı yerden okuyan tüketici API'si. Her tüketicinin
+# son işlediği sıra numarası (seq) ayrı bir offset veritabanında tutulur;
+# ana veritabanına yazılmaz, böylece offset kaydetmek veri sürümünü ve
+# dashboard/API cache'lerini geçersiz kılmaz.
+import argparse
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+from configs.config import DATABASE_PATH, CHANGE_OFFSETS_PATH
+from src.utils.data_version import get_data_version, read_only_uri
+
+BATCH_SIZE = 1000
+
+OFFSETS_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS consumer_offsets (
+        consumer VARCHAR(50) PRIMARY KEY,
+        last_seq INTEGER NOT NULL,
+        updated_at TIMESTAMP
+    )
+"""
+
+
+class ChangeLogConsumer:
+    """Adlandırılmış tüketici: poll() ile yeni olayları al, işledikten sonra commit() ile offset'i kaydet
+
+    Offset yalnızca commit() ile ilerler; işleme yarıda kalırsa aynı olaylar tekrar okunur
+    (en az bir kez teslim). Tüketicilerin olayları idempotent işlemesi beklenir.
+
+    Loader yeni veritabanını rename ile yayınlar; açık bağlantı eski dosyayı okumaya
+    devam edeceği için veri sürümü değişince bağlantı yeniden açılır.
+    """
+    def __init__(self, name, db_path=DATABASE_PATH, offsets_path=CHANGE_OFFSETS_PATH):
+        self.name = name
+        self.db_path = db_path
+        self.conn, self.version = None, None
+
+        os.makedirs(os.path.dirname(offsets_path) or '.', exist_ok=True)
+        self.offsets = sqlite3.connect(offsets_path)
+        self.offsets.execute(OFFSETS_SCHEMA)
+        self.offsets.commit()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+        self.offsets.close()
+
+    def _connection(self):
+        """Güncel veri sürümüne ait bağlantı; sürüm bağlantıdan önce okunur (bkz. api/server.py)"""
+        version = get_data_version(self.db_path)
+        if self.conn is None or version != self.version:
+            if self.conn is not None:
+                self.conn.close()
+            self.conn = sqlite3.connect(read_only_uri(self.db_path), uri=True)
+            self.version = version
+        return self.conn
+
+    @property
+    def offset(self):
+        """Son işlenen olayın sıra numarası (hiç commit edilmediyse 0)"""
+        row = self.offsets.execute("SELECT last_seq FROM consumer_offsets WHERE consumer = ?", (self.name,)).fetchone()
+        return row[0] if row else 0
+
+    def lag(self, tables=None):
+        """Henüz işlenmemiş olay sayısı"""
+        query, params = self._query("SELECT COUNT(*)", tables)
+        return self._connection().execute(query, params).fetchone()[0]
+
+    def _query(self, select, tables, limit=None):
+        query = f"{select} FROM change_log WHERE seq > ?"
+        params = [self.offset]
+        if tables:
+            query += f" AND table_name IN ({','.join('?' for _ in tables)})"
+            params.extend(tables)
+        if limit is not None:
+            query += " ORDER BY seq LIMIT ?"
+            params.append(limit)
+        return query, params
+
+    def poll(self, tables=None, limit=BATCH_SIZE):
+        """Offset'ten sonraki en fazla limit olay; tables verilirse yalnızca o tabloların olayları"""
+        query, params = self._query(
+            "SELECT seq, table_name, record_key, change_type, season_id, changes, changed_at", tables, limit)
+        return [{
+            'seq': seq,
+            'table_name': table_name,
+            'record_key': record_key,
+            'change_type': change_type,
+            'season_id': season_id,
+            'changes': json.loads(changes) if changes else {},
+            'changed_at': changed_at,
+        } for seq, table_name, record_key, change_type, season_id, changes, changed_at
+            in self._connection().execute(query, params)]
+
+    def commit(self, seq):
+        """Offset'i seq'e ilerlet (geri alınmaz)"""
+        self.offsets.execute("""
+            INSERT INTO consumer_offsets (consumer, last_seq, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (consumer) DO UPDATE SET
+                last_seq = MAX(last_seq, excluded.last_seq),
+                updated_at = excluded.updated_at
+        """, (self.name, seq, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        self.offsets.commit()
+
+    def batches(self, tables=None, batch_size=BATCH_SIZE):
+        """Olay kalmayana kadar batch'ler üret; her batch işlendikten sonra offset kaydedilir"""
+        while True:
+            events = self.poll(tables, batch_size)
+            if not events:
+                return
+            yield events
+            self.commit(events[-1]['seq'])
+
+    def seek(self, seq):
+        """Offset'i verilen sıra numarasına ayarla (ör. 0: baştan tekrar işle)"""
+        self.offsets.execute("""
+            INSERT INTO consumer_offsets (consumer, last_seq, updated_at) VALUES (?, ?, ?)
+            ON CONFLICT (consumer) DO UPDATE SET last_seq = excluded.last_seq, updated_at = excluded.updated_at
+        """, (self.name, seq, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        self.offsets.commit()
+
+# Test
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="change_log olaylarını bir tüketici adına oku")
+    parser.add_argument('consumer', help="Tüketici adı (offset bu adla saklanır)")
+    parser.add_argument('--tables', nargs='+', help="Yalnızca bu tabloların olayları (ör. matches standings)")
+    parser.add_argument('--db', default=DATABASE_PATH)
+    parser.add_argument('--peek', action='store_true', help="Olayları göster ama offset'i ilerletme")
+    args = parser.parse_args()
+
+    consumer = ChangeLogConsumer(args.consumer, args.db)
+    print(f"📊 {args.consumer}: offset {consumer.offset}, işlenmemiş {consumer.lag(args.tables)} olay")
+
+    summary = {}
+    events = consumer.poll(args.tables) if args.peek else [e for batch in consumer.batches(args.tables) for e in batch]
+    for event in events:
+        key = (event['table_name'], event['change_type'])
+        summary[key] = summary.get(key, 0) + 1
+        if event['change_type'] == 'update' and summary[key] <= 5:
+            print(f"  #{event['seq']} {event['table_name']} {event['record_key']}: {event['changes']}")
+
+    for (table_name, change_type), count in sorted(summary.items()):
+        print(f"  - {table_name} {change_type}: {count}")
+    print(f"✅ Yeni offset: {consumer.offset}")
+    consumer.close()
@@ -0,0 +1,373 @@
+# src/database/queries.py
+# Dashboard, REST API, snapshot ve test_queries.py'nin ortak kullandığı
+# sorgular. Her sorgu QUERIES'te bir adla kayıtlıdır, adlı parametreler
+# (:season_id) alır ve run_query / read_query ile çalıştırılır. Aynı ad her
+# zaman aynı SQL metnini verdiği için sqlite3'ün bağlantı başına statement
+# cache'i sorguyu bir kez hazırlar; sonraki çağrılar ayrıştırma ve planlamayı
+# atlar. Her çalıştırmanın süresi sorgunun gecikme histogramına eklenir
+# (latency_histograms). Sonuçları JSON/Arrow'a çevirmek çağıranın işidir.
+#
+# EXPECTED_PLANS sorguların tek dosyalı veritabanındaki (schema.sql
+# indeksleriyle) EXPLAIN QUERY PLAN çıktısıdır. tests/test_queries.py büyük
+# sentetik bir veritabanında planları bununla karşılaştırır; matches tablosunu
+# tamamen tarayan sorgu testi düşürür. Sorgu ya da indeks değişince yeni plan
+# `python src/database/queries.py` ile görülür ve buraya yazılır.
+import bisect
+import re
+import threading
+import time
+
+SEASONS_QUERY = """
+    SELECT season_id, competition_code, competition_name, season_year
+    FROM seasons
+    ORDER BY competition_name, season_year DESC
+"""
+
+SEASON_EXISTS_QUERY = "SELECT 1 FROM seasons WHERE season_id = :season_id"
+
+STANDINGS_QUERY = """
+    SELECT
+        t.team_name,
+        s.position,
+        s.played_games,
+        s.won,
+        s.draw,
+        s.lost,
+        s.points,
+        s.goals_for,
+        s.goals_against,
+        s.goal_difference,
+        s.form,
+        s.points_per_game,
+        s.goals_per_game
+    FROM standings s
+    JOIN teams t ON s.team_id = t.team_id
+    WHERE s.season_id = :season_id
+    ORDER BY s.position
+"""
+
+MATCHES_QUERY = """
+    SELECT
+        m.*,
+        h.team_name as home_team_name,
+        a.team_name as away_team_name
+    FROM matches m
+    JOIN teams h ON m.home_team_id = h.team_id
+    JOIN teams a ON m.away_team_id = a.team_id
+    WHERE m.season_id = :season_id AND m.status = 'FINISHED'
+"""
+
+# Her maç ev sahibi ve deplasman bakış açısıyla iki satıra açılır;
+# böylece sorgu (season_id, status) indeksini kullanır
+TEAM_STATS_QUERY = """
+    WITH team_matches AS (
+        SELECT home_team_id AS team_id, 1 AS is_home, is_home_win AS is_win,
+               home_score AS scored, away_score AS conceded
+        FROM matches
+        WHERE season_id = :season_id AND status = 'FINISHED'
+        UNION ALL
+        SELECT away_team_id AS team_id, 0 AS is_home, is_away_win AS is_win,
+               away_score AS scored, home_score AS conceded
+        FROM matches
+        WHERE season_id = :season_id AND status = 'FINISHED'
+    )
+    SELECT
+        t.team_name,
+        SUM(tm.is_home) as home_games,
+        SUM(1 - tm.is_home) as away_games,
+        SUM(tm.is_win) as total_wins,
+        SUM(tm.is_home * tm.is_win) as home_wins,
+        SUM((1 - tm.is_home) * tm.is_win) as away_wins,
+        AVG(tm.scored) as avg_goals_scored,
+        AVG(tm.conceded) as avg_goals_conceded
+    FROM team_matches tm
+    JOIN teams t ON tm.team_id = t.team_id
+    GROUP BY t.team_id, t.team_name
+"""
+
+# İki takımın tüm sezonlardaki oynanmış karşılaşmaları, en yeniden eskiye
+H2H_QUERY = """
+    SELECT
+        m.match_id,
+        se.competition_code,
+        se.season_year,
+        m.match_date,
+        m.matchday,
+        m.home_team_id,
+        h.team_name as home_team_name,
+        m.away_team_id,
+        a.team_name as away_team_name,
+        m.home_score,
+        m.away_score
+    FROM matches m
+    JOIN seasons se ON m.season_id = se.season_id
+    JOIN teams h ON m.home_team_id = h.team_id
+    JOIN teams a ON m.away_team_id = a.team_id
+    WHERE m.status = 'FINISHED'
+      AND ((m.home_team_id = :team_a AND m.away_team_id = :team_b)
+           OR (m.home_team_id = :team_b AND m.away_team_id = :team_a))
+    ORDER BY m.match_date DESC
+"""
+
+# Önceden hesaplanmış orta hakem istatistikleri (referee_season_stats)
+REFEREE_SEASON_STATS_QUERY = """
+    SELECT
+        r.referee_name,
+        r.nationality,
+        rs.matches_officiated,
+        rs.home_wins,
+        rs.draws,
+        rs.away_wins,
+        rs.home_win_rate,
+        rs.goals_per_game
+    FROM referee_season_stats rs
+    JOIN referees r ON rs.referee_id = r.referee_id
+    WHERE rs.season_id = :season_id
+    ORDER BY rs.matches_officiated DESC, r.referee_name
+"""
+
+# Tüm lig ve sezonlar; sezon istatistiklerinin toplamından hesaplanır
+REFEREE_ALL_STATS_QUERY = """
+    SELECT
+        r.referee_name,
+        r.nationality,
+        COUNT(DISTINCT se.competition_code) as competitions,
+        COUNT(*) as seasons,
+        SUM(rs.matches_officiated) as matches_officiated,
+        SUM(rs.home_wins) as home_wins,
+        SUM(rs.draws) as draws,
+        SUM(rs.away_wins) as away_wins,
+        ROUND(100.0 * SUM(rs.home_wins) / SUM(rs.matches_officiated), 2) as home_win_rate,
+        ROUND(1.0 * SUM(rs.total_goals) / SUM(rs.matches_officiated), 2) as goals_per_game
+    FROM referee_season_stats rs
+    JOIN referees r ON rs.referee_id = r.referee_id
+    JOIN seasons se ON rs.season_id = se.season_id
+    GROUP BY rs.referee_id, r.referee_name, r.nationality
+    ORDER BY matches_officiated DESC, r.referee_name
+"""
+
+# Sezonun oynanmamış maç sayısı (simülasyon sekmesi)
+REMAINING_MATCHES_QUERY = """
+    SELECT COUNT(*) FROM matches
+    WHERE season_id = :season_id AND status != 'FINISHED'
+"""
+
+# Sezondaki takım adından takım ID'si (takım raporu)
+TEAM_ID_QUERY = """
+    SELECT t.team_id
+    FROM standings s
+    JOIN teams t ON s.team_id = t.team_id
+    WHERE s.season_id = :season_id AND t.team_name = :team_name
+"""
+
+SEASON_IDS_QUERY = "SELECT season_id FROM seasons ORDER BY season_id"
+
+# Ad -> SQL; snapshot tabloları da aynı adları kullanır (standings, matches, team_stats)
+QUERIES = {
+    'seasons': SEASONS_QUERY,
+    'season_ids': SEASON_IDS_QUERY,
+    'season_exists': SEASON_EXISTS_QUERY,
+    'standings': STANDINGS_QUERY,
+    'matches': MATCHES_QUERY,
+    'team_stats': TEAM_STATS_QUERY,
+    'remaining_matches': REMAINING_MATCHES_QUERY,
+    'team_id': TEAM_ID_QUERY,
+    'h2h': H2H_QUERY,
+    'referee_season_stats': REFEREE_SEASON_STATS_QUERY,
+    'referee_all_stats': REFEREE_ALL_STATS_QUERY,
+}
+
+# Ad -> beklenen EXPLAIN QUERY PLAN (alt adımlar iki boşluk içeride, bkz. explain)
+EXPECTED_PLANS = {
+    'seasons': [
+        'SCAN seasons',
+        'USE TEMP B-TREE FOR ORDER BY',
+    ],
+    'season_ids': [
+        'SCAN seasons',
+    ],
+    'season_exists': [
+        'SEARCH seasons USING INTEGER PRIMARY KEY (rowid=?)',
+    ],
+    'standings': [
+        'SEARCH s USING INDEX idx_standings_season (season_id=?)',
+        'SEARCH t USING INTEGER PRIMARY KEY (rowid=?)',
+    ],
+    'matches': [
+        'SEARCH m USING INDEX idx_matches_season_status (season_id=? AND status=?)',
+        'SEARCH h USING INTEGER PRIMARY KEY (rowid=?)',
+        'SEARCH a USING INTEGER PRIMARY KEY (rowid=?)',
+    ],
+    'team_stats': [
+        'MATERIALIZE team_matches',
+        '  COMPOUND QUERY',
+        '    LEFT-MOST SUBQUERY',
+        '      SEARCH matches USING INDEX idx_matches_season_status (season_id=? AND status=?)',
+        '    UNION ALL',
+        '      SEARCH matches USING INDEX idx_matches_season_status (season_id=? AND status=?)',
+        'SCAN tm',
+        'SEARCH t USING INTEGER PRIMARY KEY (rowid=?)',
+        'USE TEMP B-TREE FOR GROUP BY',
+    ],
+    'remaining_matches': [
+        'SEARCH matches USING COVERING INDEX idx_matches_season_status (season_id=?)',
+    ],
+    'team_id': [
+        'SEARCH s USING INDEX idx_standings_season (season_id=?)',
+        'SEARCH t USING INTEGER PRIMARY KEY (rowid=?)',
+    ],
+    'h2h': [
+        'MULTI-INDEX OR',
+        '  INDEX 1',
+        '    SEARCH m USING INDEX idx_matches_teams (home_team_id=? AND away_team_id=?)',
+        '  INDEX 2',
+        '    SEARCH m USING INDEX idx_matches_teams (home_team_id=? AND away_team_id=?)',
+        'SEARCH se USING INTEGER PRIMARY KEY (rowid=?)',
+        'SEARCH h USING INTEGER PRIMARY KEY (rowid=?)',
+        'SEARCH a USING INTEGER PRIMARY KEY (rowid=?)',
+        'USE TEMP B-TREE FOR ORDER BY',
+    ],
+    'referee_season_stats': [
+        'SEARCH rs USING INDEX sqlite_autoindex_referee_season_stats_1 (season_id=?)',
+        'SEARCH r USING INTEGER PRIMARY KEY (rowid=?)',
+        'USE TEMP B-TREE FOR ORDER BY',
+    ],
+    'referee_all_stats': [
+        'SCAN rs USING INDEX idx_referee_season_stats_referee',
+        'SEARCH r USING INTEGER PRIMARY KEY (rowid=?)',
+        'SEARCH se USING INTEGER PRIMARY KEY (rowid=?)',
+        'USE TEMP B-TREE FOR GROUP BY',
+        'USE TEMP B-TREE FOR count(DISTINCT)',
+        'USE TEMP B-TREE FOR ORDER BY',
+    ],
+}
+
+# Gecikme histogramı kovalarının üst sınırları (ms); son kova bunların üstüdür
+LATENCY_BUCKETS_MS = (0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+PARAM_PATTERN = re.compile(r':(\w+)')
+
+_latencies = {}
+# API sorguları thread havuzunda çalışır
+_latency_lock = threading.Lock()
+
+
+def _record(name, seconds):
+    ms = seconds * 1000
+    with _latency_lock:
+        stats = _latencies.setdefault(name, {'counts': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+                                             'total_ms': 0.0, 'max_ms': 0.0})
+        stats['counts'][bisect.bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        stats['total_ms'] += ms
+        stats['max_ms'] = max(stats['max_ms'], ms)
+
+
+def run_query(conn, name, **params):
+    """Adlandırılmış sorguyu çalıştır: (sütunlar, satırlar)"""
+    start = time.perf_counter()
+    cursor = conn.execute(QUERIES[name], params)
+    rows = cursor.fetchall()
+    _record(name, time.perf_counter() - start)
+    return [d[0] for d in cursor.description], rows
+
+
+def read_query(conn, name, **params):
+    """Adlandırılmış sorgunun sonucu pandas DataFrame olarak"""
+    import pandas as pd
+
+    start = time.perf_counter()
+    df = pd.read_sql_query(QUERIES[name], conn, params=params)
+    _record(name, time.perf_counter() - start)
+    return df
+
+
+def explain(conn, name):
+    """Sorgunun EXPLAIN QUERY PLAN satırları; parametreler NULL bağlanır"""
+    query = QUERIES[name]
+    depths, plan = {}, []
+    for node_id, parent_id, _, detail in conn.execute(f"EXPLAIN QUERY PLAN {query}",
+                                                      dict.fromkeys(PARAM_PATTERN.findall(query))):
+        depths[node_id] = depths.get(parent_id, -1) + 1
+        plan.append('  ' * depths[node_id] + detail)
+    return plan
+
+
+def _percentile(counts, total, q, max_ms):
+    """Kovalardan yüzdelik tahmini: değerin düştüğü kovanın üst sınırı (en büyük değeri aşmaz)"""
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS_MS + (max_ms,), counts):
+        seen += count
+        if seen >= q * total:
+            return min(bound, max_ms)
+    return max_ms
+
+
+def latency_histograms():
+    """Bu süreçte çalışan sorguların gecikme histogramları
+
+    {ad: {'count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'buckets'}};
+    buckets [(üst sınır ms, sayı)] listesidir, son kovanın sınırı None'dır.
+    """
+    with _latency_lock:
+        snapshot = {name: (list(stats['counts']), stats['total_ms'], stats['max_ms'])
+                    for name, stats in _latencies.items()}
+
+    histograms = {}
+    for name, (counts, total_ms, max_ms) in snapshot.items():
+        total = sum(counts)
+        histograms[name] = {
+            'count': total,
+            'mean_ms': total_ms / total,
+            **{f'p{q}_ms': _percentile(counts, total, q / 100, max_ms) for q in (50, 95, 99)},
+            'max_ms': max_ms,
+            'buckets': list(zip(LATENCY_BUCKETS_MS + (None,), counts)),
+        }
+    return histograms
+
+
+def reset_latencies():
+    with _latency_lock:
+        _latencies.clear()
+
+
+def print_latency_report():
+    histograms = latency_histograms()
+    if not histograms:
+        print("⚠️ Uyarı: henüz çalıştırılmış sorgu yok")
+        return
+
+    print("\n⏱️ Sorgu gecikmeleri (ms)")
+    print(f"  {'sorgu':22s}{'sayı':>7s}{'ort.':>9s}{'p50':>9s}{'p95':>9s}{'p99':>9s}{'en çok':>9s}")
+    for name, h in sorted(histograms.items()):
+        print(f"  {name:22s}{h['count']:7d}{h['mean_ms']:9.2f}{h['p50_ms']:9.2f}{h['p95_ms']:9.2f}"
+              f"{h['p99_ms']:9.2f}{h['max_ms']:9.2f}")
+
+
+# Planları kontrol et: python src/database/queries.py [--db data/football_data.db]
+if __name__ == "__main__":
+    import argparse
+    import sqlite3
+    import sys
+
+    from configs.config import DATABASE_PATH
+    from src.utils.data_version import read_only_uri
+
+    parser = argparse.ArgumentParser(description="Sorgu planlarını EXPECTED_PLANS ile karşılaştır")
+    parser.add_argument('--db', default=DATABASE_PATH)
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(read_only_uri(args.db), uri=True)
+    changed = []
+    for name in QUERIES:
+        plan = explain(conn, name)
+        status = '✅' if plan == EXPECTED_PLANS.get(name) else '❌'
+        if status == '❌':
+            changed.append(name)
+        print(f"\n{status} {name}")
+        for line in plan:
+            print(f"    {line}")
+    conn.close()
+
+    if changed:
+        print(f"\n❌ Hata: planı değişen sorgular: {', '.join(changed)}")
+        sys.exit(1)
@@ -15,6 +15,7 @@ CREATE TABLE IF NOT EXISTS seasons (
     season_id INTEGER PRIMARY KEY AUTOINCREMENT,
     competition_code VARCHAR(10),
     competition_name VARCHAR(100),
+    season_year INTEGER,
     season_start DATE,
     season_end DATE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -71,8 +72,125 @@ CREATE TABLE IF NOT EXISTS matches (
     FOREIGN KEY (away_team_id) REFERENCES teams(team_id)
 );
 
+-- Hakemler tablosu
+CREATE TABLE IF NOT EXISTS referees (
+    referee_id INTEGER PRIMARY KEY,
+    referee_name VARCHAR(100) NOT NULL,
+    nationality VARCHAR(50),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Maç görevlileri (maç x hakem x rol)
+CREATE TABLE IF NOT EXISTS match_officials (
+    match_id INTEGER NOT NULL,
+    referee_id INTEGER NOT NULL,
+    role VARCHAR(30) NOT NULL,
+    PRIMARY KEY (match_id, referee_id, role),
+    FOREIGN KEY (match_id) REFERENCES matches(match_id),
+    FOREIGN KEY (referee_id) REFERENCES referees(referee_id)
+) WITHOUT ROWID;
+
+-- Hakem sezon istatistikleri (yalnızca orta hakem; her yüklemede yeniden hesaplanır)
+CREATE TABLE IF NOT EXISTS referee_season_stats (
+    season_id INTEGER NOT NULL,
+    referee_id INTEGER NOT NULL,
+    matches_officiated INTEGER,
+    home_wins INTEGER,
+    draws INTEGER,
+    away_wins INTEGER,
+    total_goals INTEGER,
+    home_win_rate DECIMAL(5,2),
+    goals_per_game DECIMAL(4,2),
+    PRIMARY KEY (season_id, referee_id),
+    FOREIGN KEY (season_id) REFERENCES seasons(season_id),
+    FOREIGN KEY (referee_id) REFERENCES referees(referee_id)
+);
+
+-- Oyuncular tablosu
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY,
+    player_name VARCHAR(100) NOT NULL,
+    first_name VARCHAR(50),
+    last_name VARCHAR(50),
+    date_of_birth DATE,
+    nationality VARCHAR(50),
+    position VARCHAR(30),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Kadrolar (sezon x takım x oyuncu)
+CREATE TABLE IF NOT EXISTS squad_memberships (
+    season_id INTEGER NOT NULL,
+    team_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    position VARCHAR(30),
+    PRIMARY KEY (season_id, team_id, player_id),
+    FOREIGN KEY (season_id) REFERENCES seasons(season_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id),
+    FOREIGN KEY (player_id) REFERENCES players(player_id)
+) WITHOUT ROWID;
+
+-- Oyuncu sezon istatistikleri (gol krallığı listesinden)
+CREATE TABLE IF NOT EXISTS player_season_stats (
+    season_id INTEGER NOT NULL,
+    player_id INTEGER NOT NULL,
+    team_id INTEGER,
+    shirt_number INTEGER,
+    played_matches INTEGER,
+    goals INTEGER,
+    assists INTEGER,
+    penalties INTEGER,
+    goals_per_match DECIMAL(4,2),
+    PRIMARY KEY (season_id, player_id),
+    FOREIGN KEY (season_id) REFERENCES seasons(season_id),
+    FOREIGN KEY (player_id) REFERENCES players(player_id),
+    FOREIGN KEY (team_id) REFERENCES teams(team_id)
+);
+
+-- Karantina: doğrulamadan geçemeyen satırlar ve sebepleri
+CREATE TABLE IF NOT EXISTS quarantine (
+    quarantine_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(20) NOT NULL,
+    record_key VARCHAR(50),
+    reason TEXT NOT NULL,
+    payload TEXT,
+    source_file VARCHAR(255),
+    quarantined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Değişiklik günlüğü: yükleyicinin yaptığı ekleme/güncelleme/silmeler (yalnızca eklenir)
+-- changes: insert -> yeni satır, update -> {kolon: [eski, yeni]}, delete -> silinen satır (JSON)
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name VARCHAR(30) NOT NULL,
+    record_key VARCHAR(50) NOT NULL,
+    change_type VARCHAR(10) NOT NULL CHECK (change_type IN ('insert', 'update', 'delete')),
+    season_id INTEGER,
+    changes TEXT,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- İndeksler for performans
-CREATE INDEX idx_matches_date ON matches(match_date);
-CREATE INDEX idx_matches_teams ON matches(home_team_id, away_team_id);
-CREATE INDEX idx_standings_position ON standings(position);
-CREATE INDEX idx_standings_team ON standings(team_id);
\ No newline at end of file
+CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(match_date);
+CREATE INDEX IF NOT EXISTS idx_matches_teams ON matches(home_team_id, away_team_id);
+CREATE INDEX IF NOT EXISTS idx_standings_position ON standings(position);
+CREATE INDEX IF NOT EXISTS idx_standings_team ON standings(team_id);
+CREATE INDEX IF NOT EXISTS idx_matches_season_status ON matches(season_id, status);
+CREATE INDEX IF NOT EXISTS idx_matches_season_matchday ON matches(season_id, matchday);
+CREATE INDEX IF NOT EXISTS idx_standings_season ON standings(season_id, position);
+CREATE INDEX IF NOT EXISTS idx_match_officials_referee ON match_officials(referee_id, role);
+CREATE INDEX IF NOT EXISTS idx_referee_season_stats_referee ON referee_season_stats(referee_id);
+CREATE INDEX IF NOT EXISTS idx_squad_memberships_player ON squad_memberships(player_id, season_id);
+CREATE INDEX IF NOT EXISTS idx_squad_memberships_team ON squad_memberships(team_id, season_id);
+CREATE INDEX IF NOT EXISTS idx_player_season_stats_player ON player_season_stats(player_id);
+CREATE INDEX IF NOT EXISTS idx_player_season_stats_team ON player_season_stats(team_id, season_id);
+CREATE INDEX IF NOT EXISTS idx_player_season_stats_goals ON player_season_stats(season_id, goals DESC);
+CREATE INDEX IF NOT EXISTS idx_change_log_table ON change_log(table_name, seq);
+CREATE INDEX IF NOT EXISTS idx_quarantine_table ON quarantine(table_name, quarantined_at);
+
+-- Sezon anahtarı: lig kodu + başlangıç yılı
+CREATE UNIQUE INDEX IF NOT EXISTS idx_seasons_key ON seasons(competition_code, season_year);
+
+-- Karantina anahtarı: aynı batch tekrar yüklenince kayıtlar çoğalmaz (boş anahtar/dosya da eşit sayılır)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_quarantine_key
+    ON quarantine(table_name, IFNULL(record_key, ''), reason, IFNULL(source_file, ''));
@@ -0,0 +1,121 @@
+# src/database/shards.py
+# Lig başına ayrı veritabanı dosyaları (data/shards/{lig}.db). Her lig kendi
+# yazma kilidine sahiptir; bir ligin yüklenmesi ya da VACUUM'u diğer liglerin
+# okuyucularını etkilemez. Ligler arası sorgular için shard'lar tek bir
+# bağlantıya ATTACH edilir ve her tablo için UNION ALL görünümü (TEMP VIEW)
+# oluşturulur; src/database/queries.py'deki sorgular değişmeden çalışır.
+import hashlib
+import os
+import re
+import sqlite3
+import zlib
+
+from configs.config import SHARD_PATH
+from src.utils.data_version import get_data_version, read_only_uri
+
+# Shard dosya adı: {lig}.db (staging dosyaları hariç)
+SHARD_FILE_PATTERN = re.compile(r'^(?P<code>[A-Z0-9]+)\.db$')
+
+# Birleşik görünümü oluşturulan tablolar
+SHARD_TABLES = ['teams', 'seasons', 'standings', 'matches', 'referees', 'match_officials', 'referee_season_stats',
+                'players', 'squad_memberships', 'player_season_stats', 'quarantine']
+
+# Küçük boyut tabloları: bağlantı açılırken TEMP tabloya (birincil anahtarıyla) kopyalanır.
+# Birden fazla ligde bulunan anahtar (ör. lig değiştiren oyuncu) bir kez tutulur.
+DIMENSION_TABLES = ['teams', 'seasons', 'referees', 'players']
+
+CREATE_TABLE_PATTERN = re.compile(r'^CREATE TABLE (IF NOT EXISTS )?', re.IGNORECASE)
+
+# Her ligin season_id'leri kendi aralığında üretilir; böylece shard'lar arasında çakışmaz
+SEASON_ID_STRIDE = 10_000
+
+
+def shard_path(code, shard_dir=SHARD_PATH):
+    """Ligin veritabanı dosyası"""
+    return os.path.join(shard_dir, f"{code}.db")
+
+
+def list_shards(shard_dir=SHARD_PATH):
+    """Klasördeki shard'lar: {lig: dosya}"""
+    if not os.path.isdir(shard_dir):
+        return {}
+    return {match['code']: os.path.join(shard_dir, filename)
+            for filename in sorted(os.listdir(shard_dir))
+            if (match := SHARD_FILE_PATTERN.match(filename))}
+
+
+def season_id_base(code):
+    """Ligin season_id aralığının başlangıcı (lig kodundan sabit olarak türetilir)"""
+    return (zlib.crc32(code.encode('utf-8')) % 100_000 + 1) * SEASON_ID_STRIDE
+
+
+def shard_for_season(season_id, shard_dir=SHARD_PATH):
+    """season_id'nin ait olduğu shard dosyası; yoksa None"""
+    for code, path in list_shards(shard_dir).items():
+        base = season_id_base(code)
+        if base < season_id <= base + SEASON_ID_STRIDE:
+            return path
+    return None
+
+
+def shards_version(shard_dir=SHARD_PATH):
+    """Tüm shard'ların ortak sürüm anahtarı; herhangi bir lig yeniden yüklenince değişir"""
+    shards = list_shards(shard_dir)
+    if not shards:
+        return None
+    versions = '|'.join(f"{code}={get_data_version(path)}" for code, path in shards.items())
+    return hashlib.blake2b(versions.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def connect_shards(shard_dir=SHARD_PATH, check_same_thread=True):
+    """Shard'ları salt-okunur ATTACH eden bağlantı; tablolar tek veritabanındaki adlarıyla erişilir
+
+    Olgu tabloları (maçlar, puan durumu...) UNION ALL görünümleridir; sezon
+    filtreli sorgularda SQLite WHERE koşulunu her shard'a iner ve shard'ın
+    indeksini kullanır. Boyut tabloları ise TEMP tablolara kopyalanır: görünüm
+    olarak bırakıldıklarında SQLite her JOIN'i shard kombinasyonlarına açar
+    (5 lig için maçlar x sezonlar = 25 kol). Kopyalar bağlantı açıldığı andaki
+    veriyi tutar; bağlantı shards_version() ile yenilenmelidir. Bağlanabilecek
+    shard sayısı SQLite'ın ATTACH sınırıyla (varsayılan 10) sınırlıdır.
+    """
+    shards = list_shards(shard_dir)
+    conn = sqlite3.connect(':memory:', uri=True, check_same_thread=check_same_thread)
+
+    limit = conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+    if len(shards) > limit:
+        conn.close()
+        raise ValueError(f"{len(shards)} shard var, SQLite en fazla {limit} veritabanı bağlayabilir")
+
+    tables = {}
+    for code, path in shards.items():
+        schema = f"shard_{code.lower()}"
+        conn.execute("ATTACH DATABASE ? AS ?", (read_only_uri(path), schema))
+        for (table,) in conn.execute(f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'"):
+            tables.setdefault(table, []).append(schema)
+
+    for table in SHARD_TABLES:
+        if table not in tables:
+            continue
+        if table in DIMENSION_TABLES:
+            schemas = tables[table]
+            (sql,) = conn.execute(f"SELECT sql FROM {schemas[0]}.sqlite_master WHERE name = ?", (table,)).fetchone()
+            conn.execute(CREATE_TABLE_PATTERN.sub('CREATE TEMP TABLE ', sql))
+            for schema in schemas:
+                conn.execute(f"INSERT OR IGNORE INTO temp.{table} SELECT * FROM {schema}.{table}")
+        else:
+            union = "\nUNION ALL\n".join(f"SELECT * FROM {schema}.{table}" for schema in tables[table])
+            conn.execute(f"CREATE TEMP VIEW {table} AS {union}")
+    conn.commit()
+    return conn
+
+# Test
+if __name__ == "__main__":
+    from src.database.queries import run_query
+
+    shards = list_shards()
+    print(f"📊 {len(shards)} shard: {', '.join(shards) or '-'} (sürüm: {shards_version()})")
+    if shards:
+        conn = connect_shards()
+        _, seasons = run_query(conn, 'seasons')
+        print(f"✅ {len(seasons)} sezon, {len(run_query(conn, 'referee_all_stats')[1])} hakem")
+        conn.close()
@@ -1,49 +1,40 @@
 # src/database/test_queries.py
 import sqlite3
-import pandas as pd
+
+from configs.config import DATABASE_PATH
+from src.database.queries import run_query, read_query, print_latency_report
 
 def test_database():
-    conn = sqlite3.connect('data/football_data.db')
+    conn = sqlite3.connect(DATABASE_PATH)
+    
+    # En güncel sezon; sorgular dashboard'daki adlandırılmış sorgulardır (src/database/queries.py)
+    _, seasons = run_query(conn, 'seasons')
+    if not seasons:
+        print("⚠️ Uyarı: veritabanında sezon yok")
+        conn.close()
+        return
+    season_id, _, competition_name, season_year = max(seasons, key=lambda s: s[3])
+    print(f"📋 {competition_name} {season_year}")
+    
+    standings = read_query(conn, 'standings', season_id=season_id)
+    matches = read_query(conn, 'matches', season_id=season_id)
     
     # Test sorguları
-    queries = {
-        "Top 5 Takım": """
-            SELECT t.team_name, s.position, s.points, s.goal_difference
-            FROM standings s
-            JOIN teams t ON s.team_id = t.team_id
-            ORDER BY s.position
-            LIMIT 5
-        """,
+    results = {
+        "Top 5 Takım": standings[['team_name', 'position', 'points', 'goal_difference']].head(5),
         
-        "En Çok Gol Atan Takımlar": """
-            SELECT t.team_name, s.goals_for, s.goals_per_game
-            FROM standings s
-            JOIN teams t ON s.team_id = t.team_id
-            ORDER BY s.goals_for DESC
-            LIMIT 5
-        """,
+        "En Çok Gol Atan Takımlar": standings.nlargest(5, 'goals_for')[['team_name', 'goals_for', 'goals_per_game']],
         
-        "En Çok Gol Yenen Maçlar": """
-            SELECT 
-                h.team_name as home_team,
-                a.team_name as away_team,
-                m.home_score,
-                m.away_score,
-                m.total_goals,
-                m.match_date
-            FROM matches m
-            JOIN teams h ON m.home_team_id = h.team_id
-            JOIN teams a ON m.away_team_id = a.team_id
-            ORDER BY m.total_goals DESC
-            LIMIT 10
-        """
+        "En Çok Gol Yenen Maçlar": matches.nlargest(10, 'total_goals')[
+            ['home_team_name', 'away_team_name', 'home_score', 'away_score', 'total_goals', 'match_date']
+        ]
     }
     
-    for title, query in queries.items():
+    for title, df in results.items():
         print(f"\n📊 {title}:")
-        df = pd.read_sql_query(query, conn)
-        print(df)
+        print(df.to_string(index=False))
     
+    print_latency_report()
     conn.close()
 
 if __name__ == "__main__":
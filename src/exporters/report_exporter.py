@@ -0,0 +1,307 @@
+# src/exporters/report_exporter.py
+import argparse
+import os
+import sqlite3
+
+from configs.config import DATABASE_PATH
+from src.utils.data_version import read_only_uri
+
+# Veritabanından tek seferde okunan satır sayısı
+CHUNK_SIZE = 5_000
+
+STANDINGS_QUERY = """
+    SELECT s.position AS "Sıra", t.team_name AS "Takım", s.played_games AS "O",
+           s.won AS "G", s.draw AS "B", s.lost AS "M", s.goals_for AS "AG",
+           s.goals_against AS "YG", s.goal_difference AS "Av", s.points AS "Puan", s.form AS "Form"
+    FROM standings s
+    JOIN teams t ON s.team_id = t.team_id
+    WHERE s.season_id = ?
+    ORDER BY s.position
+"""
+
+MATCHES_QUERY = """
+    SELECT se.competition_code AS "Lig", se.season_year AS "Sezon", m.match_date AS "Tarih",
+           m.matchday AS "Hafta", h.team_name AS "Ev Sahibi", m.home_score AS "EG",
+           m.away_score AS "DG", a.team_name AS "Deplasman", m.status AS "Durum"
+    FROM matches m
+    JOIN seasons se ON m.season_id = se.season_id
+    JOIN teams h ON m.home_team_id = h.team_id
+    JOIN teams a ON m.away_team_id = a.team_id
+"""
+
+TEAM_SUMMARY_QUERY = """
+    SELECT t.team_name AS "Takım", se.competition_name AS "Lig", se.season_year AS "Sezon",
+           s.position AS "Sıra", s.points AS "Puan", s.won AS "G", s.draw AS "B", s.lost AS "M",
+           s.goals_for AS "AG", s.goals_against AS "YG", s.form AS "Form"
+    FROM standings s
+    JOIN teams t ON s.team_id = t.team_id
+    JOIN seasons se ON s.season_id = se.season_id
+    WHERE s.team_id = ? AND s.season_id = ?
+"""
+
+# Helvetica (WinAnsiEncoding) Türkçe karakterlerin bir kısmını içermez
+_PDF_TRANSLITERATION = str.maketrans({'ğ': 'g', 'Ğ': 'G', 'ş': 's', 'Ş': 'S', 'ı': 'i', 'İ': 'I'})
+
+
+class StreamingPdfWriter:
+    """Sayfaları doldukça diske yazan minimal PDF üreticisi (yalnızca metin tabloları)
+    
+    Hazır PDF kütüphaneleri tüm sayfaları kaydetmeden önce bellekte tutar;
+    bu sınıf her sayfayı dolduğu anda dosyaya yazar ve bellekte yalnızca
+    nesne ofsetlerini tutar.
+    """
+    PAGE_WIDTH = 842   # A4 yatay
+    PAGE_HEIGHT = 595
+    MARGIN = 36
+    
+    def __init__(self, path, font_size=8):
+        self.file = open(path, 'wb')
+        self.font_size = font_size
+        self.line_height = font_size * 1.5
+        self.offsets = {}
+        self.page_ids = []
+        # 1: katalog, 2: sayfa ağacı, 3: normal font, 4: kalın font
+        self.next_id = 5
+        self.columns = None
+        self.commands = []
+        self.y = self.PAGE_HEIGHT - self.MARGIN
+        
+        self.file.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    
+    def _write_object(self, obj_id, body):
+        self.offsets[obj_id] = self.file.tell()
+        self.file.write(f'{obj_id} 0 obj\n'.encode('latin-1') + body + b'\nendobj\n')
+    
+    def _escape(self, value):
+        text = '' if value is None else str(value)
+        text = text.translate(_PDF_TRANSLITERATION)
+        text = text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+        return text.encode('cp1252', errors='replace')
+    
+    def _text(self, x, text, font='F1', size=None):
+        size = size or self.font_size
+        self.commands.append(b'BT /%s %d Tf %.1f %.1f Td (' % (font.encode(), size, x, self.y)
+                             + self._escape(text) + b') Tj ET')
+    
+    def _flush_page(self):
+        """Mevcut sayfayı dosyaya yaz"""
+        if not self.commands:
+            return
+        
+        content = b'\n'.join(self.commands)
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        
+        self._write_object(content_id, b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+        self._write_object(page_id, (
+            f'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {self.PAGE_WIDTH} {self.PAGE_HEIGHT}] '
+            f'/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {content_id} 0 R >>'
+        ).encode('latin-1'))
+        self.page_ids.append(page_id)
+        
+        self.commands = []
+        self.y = self.PAGE_HEIGHT - self.MARGIN
+    
+    def _ensure_space(self, lines=1):
+        if self.y - lines * self.line_height < self.MARGIN:
+            self._flush_page()
+            if self.columns:
+                self._write_cells(self.columns, font='F2')
+    
+    def _write_cells(self, values, font='F1'):
+        width = (self.PAGE_WIDTH - 2 * self.MARGIN) / len(values)
+        # Helvetica'da ortalama karakter genişliği ~0.5em
+        max_chars = max(int(width / (self.font_size * 0.5)) - 1, 1)
+        for i, value in enumerate(values):
+            self._text(self.MARGIN + i * width, str('' if value is None else value)[:max_chars], font=font)
+        self.y -= self.line_height
+    
+    def heading(self, text):
+        """Bölüm başlığı; yeni tablo başlatır"""
+        self.columns = None
+        self._ensure_space(3)
+        self.y -= self.line_height
+        self._text(self.MARGIN, text, font='F2', size=self.font_size + 4)
+        self.y -= self.line_height * 1.5
+    
+    def table_header(self, columns):
+        """Tablo başlığı; sayfa taşarsa yeni sayfada tekrarlanır"""
+        self._ensure_space(2)
+        self.columns = list(columns)
+        self._write_cells(self.columns, font='F2')
+    
+    def row(self, values):
+        self._ensure_space()
+        self._write_cells(values)
+    
+    def close(self):
+        """Kalan sayfayı, sayfa ağacını ve xref tablosunu yazıp dosyayı kapat"""
+        self._flush_page()
+        if not self.page_ids:
+            self._text(self.MARGIN, '')
+            self._flush_page()
+        
+        self._write_object(3, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>')
+        self._write_object(4, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>')
+        kids = ' '.join(f'{page_id} 0 R' for page_id in self.page_ids)
+        self._write_object(2, f'<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>'.encode('latin-1'))
+        self._write_object(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+        
+        xref_offset = self.file.tell()
+        self.file.write(f'xref\n0 {self.next_id}\n0000000000 65535 f \n'.encode('latin-1'))
+        for obj_id in range(1, self.next_id):
+            self.file.write(f'{self.offsets[obj_id]:010d} 00000 n \n'.encode('latin-1'))
+        self.file.write(f'trailer\n<< /Size {self.next_id} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n'.encode('latin-1'))
+        self.file.close()
+
+
+class ReportExporter:
+    def __init__(self, db_path=DATABASE_PATH, chunk_size=CHUNK_SIZE):
+        self.db_path = db_path
+        self.chunk_size = chunk_size
+    
+    def _connect(self):
+        # Dışa aktarma kendi salt-okunur bağlantısını kullanır; dashboard'un
+        # paylaşılan bağlantısını ve diğer oturumları bloklamaz
+        return sqlite3.connect(read_only_uri(self.db_path), uri=True)
+    
+    def _iter_chunks(self, conn, query, params):
+        """Sorgu sonucunu satır parçaları olarak akıt"""
+        cursor = conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(self.chunk_size)
+            if not rows:
+                break
+            yield rows
+    
+    def _column_names(self, conn, query, params):
+        return [d[0] for d in conn.execute(f"SELECT * FROM ({query}) LIMIT 0", params).description]
+    
+    def export(self, sections, path):
+        """Bölümleri (başlık, sorgu, parametreler) uzantıya göre Excel veya PDF'e yaz"""
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in ('.xlsx', '.pdf'):
+            raise ValueError(f"Desteklenmeyen dosya türü: {extension} (.xlsx veya .pdf olmalı)")
+        
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        try:
+            if extension == '.xlsx':
+                n_rows = self._export_excel(conn, sections, path)
+            else:
+                n_rows = self._export_pdf(conn, sections, path)
+        finally:
+            conn.close()
+        
+        print(f"📁 {n_rows:,} satır dışa aktarıldı: {path}")
+        return path
+    
+    def _export_excel(self, conn, sections, path):
+        from openpyxl import Workbook
+        
+        # write_only modunda satırlar geçici dosyaya akıtılır, bellekte tutulmaz
+        workbook = Workbook(write_only=True)
+        n_rows = 0
+        
+        for title, query, params in sections:
+            sheet = workbook.create_sheet(title=title[:31])
+            sheet.append(self._column_names(conn, query, params))
+            for rows in self._iter_chunks(conn, query, params):
+                for row in rows:
+                    sheet.append(row)
+                n_rows += len(rows)
+        
+        workbook.save(path)
+        return n_rows
+    
+    def _export_pdf(self, conn, sections, path):
+        writer = StreamingPdfWriter(path)
+        n_rows = 0
+        
+        try:
+            for title, query, params in sections:
+                writer.heading(title)
+                writer.table_header(self._column_names(conn, query, params))
+                for rows in self._iter_chunks(conn, query, params):
+                    for row in rows:
+                        writer.row(row)
+                    n_rows += len(rows)
+        finally:
+            writer.close()
+        
+        return n_rows
+    
+    def find_season_id(self, competition_code, season_year):
+        """(lig, sezon yılı) anahtarından season_id bul"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT season_id FROM seasons WHERE competition_code = ? AND season_year = ?",
+                               (competition_code, season_year)).fetchone()
+        finally:
+            conn.close()
+        
+        if row is None:
+            raise ValueError(f"Sezon bulunamadı: {competition_code} {season_year}")
+        return row[0]
+    
+    def export_standings(self, season_id, path):
+        """Bir sezonun puan durumunu dışa aktar"""
+        return self.export([("Puan Durumu", STANDINGS_QUERY, (season_id,))], path)
+    
+    def export_matches(self, path, season_id=None, competition_code=None):
+        """Maçları dışa aktar (sezon ve/veya lig filtresi opsiyonel)"""
+        conditions, params = [], []
+        if season_id is not None:
+            conditions.append("m.season_id = ?")
+            params.append(season_id)
+        if competition_code is not None:
+            conditions.append("se.competition_code = ?")
+            params.append(competition_code)
+        
+        query = MATCHES_QUERY
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY se.competition_code, se.season_year, m.match_date"
+        
+        return self.export([("Maçlar", query, tuple(params))], path)
+    
+    def export_team_report(self, team_id, season_id, path):
+        """Takım raporu: sezon özeti ve takımın tüm maçları"""
+        team_matches = MATCHES_QUERY + """
+            WHERE m.season_id = ? AND (m.home_team_id = ? OR m.away_team_id = ?)
+            ORDER BY m.match_date
+        """
+        return self.export([
+            ("Özet", TEAM_SUMMARY_QUERY, (team_id, season_id)),
+            ("Maçlar", team_matches, (season_id, team_id, team_id)),
+        ], path)
+
+# Komut satırı
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Puan durumu, maç ve takım raporlarını Excel/PDF olarak dışa aktar")
+    parser.add_argument('report', choices=['standings', 'matches', 'team'])
+    parser.add_argument('-o', '--output', required=True, help="Çıktı dosyası (.xlsx veya .pdf)")
+    parser.add_argument('--competition', help="Lig kodu (ör. PL)")
+    parser.add_argument('--season', type=int, help="Sezon başlangıç yılı (ör. 2023)")
+    parser.add_argument('--team-id', type=int, help="Takım raporu için takım ID")
+    parser.add_argument('--db', default=DATABASE_PATH)
+    args = parser.parse_args()
+    
+    exporter = ReportExporter(args.db)
+    
+    season_id = None
+    if args.season is not None:
+        if not args.competition:
+            parser.error("--season için --competition gerekli")
+        season_id = exporter.find_season_id(args.competition, args.season)
+    
+    if args.report == 'standings':
+        if season_id is None:
+            parser.error("standings için --competition ve --season gerekli")
+        exporter.export_standings(season_id, args.output)
+    elif args.report == 'matches':
+        exporter.export_matches(args.output, season_id=season_id, competition_code=args.competition)
+    else:
+        if season_id is None or args.team_id is None:
+            parser.error("team için --competition, --season ve --team-id gerekli")
+        exporter.export_team_report(args.team_id, season_id, args.output)
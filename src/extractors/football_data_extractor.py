@@ -4,83 +4,99 @@ import json
 import time
 from datetime import datetime
 import os
-import sys
 
-# Parent directory'yi path'e ekle
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from configs.config import (FOOTBALL_DATA_API_KEY, API_BASE_URL, LEAGUES, SEASONS, RAW_DATA_PATH, REQUEST_DELAY,
+                            ENDPOINTS, ENDPOINT_PARAMS)
 
-from configs.config import FOOTBALL_DATA_API_KEY, API_BASE_URL, LEAGUES, RAW_DATA_PATH, REQUEST_DELAY
+REQUEST_TIMEOUT = 30  # saniye
+
+# Veri türü -> o türü çeken metod
+EXTRACT_METHODS = {
+    'standings': 'extract_league_standings',
+    'matches': 'extract_league_matches',
+    'squads': 'extract_squads',
+    'scorers': 'extract_top_scorers',
+}
 
 class FootballDataExtractor:
-    def __init__(self):
+    def __init__(self, base_url=API_BASE_URL, api_key=FOOTBALL_DATA_API_KEY, raw_path=RAW_DATA_PATH,
+                 request_delay=REQUEST_DELAY):
+        """base_url ile başka bir sunucu (ör. src/extractors/mock_server.py) kullanılabilir"""
+        self.base_url = base_url
+        self.raw_path = raw_path
+        self.request_delay = request_delay
         self.headers = {
-            'X-Auth-Token': FOOTBALL_DATA_API_KEY
+            'X-Auth-Token': api_key
         }
         self.session = requests.Session()
         self.session.headers.update(self.headers)
+    
+    def fetch(self, league_code, kind, season, **params):
+        """Tek bir uç noktayı çek ve kaydet; hata durumunda istisna fırlatır: (veri, dosya yolu)"""
+        url = f"{self.base_url}/competitions/{league_code}/{ENDPOINTS[kind]}"
+        response = self.session.get(url, params={'season': season, **params}, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
         
-    def extract_league_standings(self, league_code, season=2023):
-        """Lig puan durumunu çeker"""
-        url = f"{API_BASE_URL}/competitions/{league_code}/standings"
-        params = {'season': season}
+        data = response.json()
         
+        # Veriyi kaydet
+        filepath = self._save_data(data, f"{league_code}_{kind}_{season}")
+        
+        return data, filepath
+    
+    def _extract(self, league_code, kind, season, label, **params):
+        """fetch + kullanıcı mesajı + istekler arası bekleme; hata durumunda None döner"""
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data, _ = self.fetch(league_code, kind, season, **params)
             
-            # Veriyi kaydet
-            self._save_data(data, f"{league_code}_standings_{season}")
-            
-            print(f"✅ {LEAGUES[league_code]} puan durumu başarıyla çekildi")
-            time.sleep(REQUEST_DELAY)
+            print(f"✅ {LEAGUES[league_code]} {season} {label} başarıyla çekildi")
+            time.sleep(self.request_delay)
             
             return data
-            
+        
         except requests.exceptions.RequestException as e:
             print(f"❌ Hata: {e}")
             return None
     
+    def extract_league_standings(self, league_code, season=2023):
+        """Lig puan durumunu çeker"""
+        return self._extract(league_code, 'standings', season, 'puan durumu')
+    
     def extract_league_matches(self, league_code, season=2023):
         """Lig maçlarını çeker"""
-        url = f"{API_BASE_URL}/competitions/{league_code}/matches"
-        params = {'season': season}
-        
-        try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Veriyi kaydet
-            self._save_data(data, f"{league_code}_matches_{season}")
-            
-            print(f"✅ {LEAGUES[league_code]} maçları başarıyla çekildi")
-            time.sleep(REQUEST_DELAY)
-            
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Hata: {e}")
-            return None
+        return self._extract(league_code, 'matches', season, 'maçları')
+    
+    def extract_top_scorers(self, league_code, season=2023, limit=ENDPOINT_PARAMS['scorers']['limit']):
+        """Ligin gol krallığı listesini (oyuncu, takım, gol, asist, penaltı) çeker"""
+        return self._extract(league_code, 'scorers', season, 'gol krallığı', limit=limit)
+    
+    def extract_squads(self, league_code, season=2023):
+        """Ligdeki tüm takımları kadrolarıyla birlikte tek istekte çeker"""
+        return self._extract(league_code, 'squads', season, 'kadroları')
+    
+    def extract_all(self, competitions=tuple(LEAGUES), seasons=tuple(SEASONS), kinds=tuple(ENDPOINTS)):
+        """Her lig-sezon için seçili veri türlerini sırayla çeker"""
+        for league_code in competitions:
+            for season in seasons:
+                for kind in kinds:
+                    getattr(self, EXTRACT_METHODS[kind])(league_code, season)
     
     def _save_data(self, data, filename):
         """Veriyi JSON olarak kaydet"""
-        os.makedirs(RAW_DATA_PATH, exist_ok=True)
+        os.makedirs(self.raw_path, exist_ok=True)
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = os.path.join(RAW_DATA_PATH, f"{filename}_{timestamp}.json")
+        filepath = os.path.join(self.raw_path, f"{filename}_{timestamp}.json")
         
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         
         print(f"📁 Veri kaydedildi: {filepath}")
+        return filepath
 
 # Test için
 if __name__ == "__main__":
     extractor = FootballDataExtractor()
     
-    # Premier League verilerini çek
-    extractor.extract_league_standings('PL')
-    extractor.extract_league_matches('PL')
\ No newline at end of file
+    # Tüm lig ve sezonların verilerini çek
+    extractor.extract_all()
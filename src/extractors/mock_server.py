@@ -0,0 +1,372 @@
+# src/extractors/mock_server.py
+# football-data.org v4 API'sinin yerel taklidi. Extractor, backfill ve
+# benchmark'lar API anahtarı ve internet olmadan, tekrarlanabilir şekilde
+# çalıştırılabilir. /competitions/{lig}/standings|matches|teams|scorers
+# uç noktaları kaydedilmiş ham dosyalardan ya da seed'e bağlı sentetik
+# verilerden cevaplanır. Dakikalık kota (429 ve X-Requests-Available-Minute /
+# X-RequestCounter-Reset başlıkları), gecikme ve rastgele sunucu hataları
+# ayarlanabilir.
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from configs.config import LEAGUES, SEASONS, RAW_DATA_PATH
+from src.transformers.football_data_transformer import find_latest_raw_files
+
+# Ücretsiz planın dakikalık istek hakkı
+QUOTA_PER_MINUTE = 10
+
+# limit verilmediğinde gol krallığında dönen oyuncu sayısı (gerçek API ile aynı)
+DEFAULT_SCORERS_LIMIT = 10
+
+# /v4/competitions/{lig}/{uç nokta}
+PATH_PATTERN = re.compile(r'^/v4/competitions/(?P<code>[A-Z0-9]+)/(?P<endpoint>standings|matches|teams|scorers)/?$')
+
+# Uç nokta -> ham dosya adındaki veri türü
+ENDPOINT_KINDS = {'standings': 'standings', 'matches': 'matches', 'teams': 'squads', 'scorers': 'scorers'}
+
+POSITIONS = ['Goalkeeper', 'Defence', 'Midfield', 'Offence']
+
+
+def _stable_id(*parts):
+    """Süreçten bağımsız sabit sayısal kimlik (hash() her süreçte farklıdır)"""
+    return zlib.crc32('|'.join(map(str, parts)).encode('utf-8')) % 100_000
+
+
+def synthetic_payloads(code, season, n_teams=20, played_rounds=None, seed=0):
+    """Tutarlı sentetik lig-sezon verisi: {'standings', 'matches', 'squads', 'scorers'}
+
+    Puan durumu oynanmış maçların skorlarından hesaplanır; aynı argümanlar her
+    zaman aynı veriyi üretir.
+    """
+    rng = random.Random(f'{code}-{season}-{seed}')
+    n_rounds = 2 * (n_teams - 1)
+    played_rounds = n_rounds if played_rounds is None else min(played_rounds, n_rounds)
+    base_id = _stable_id(code) * 100
+
+    competition = {'id': _stable_id('competition', code), 'name': LEAGUES.get(code, f'League {code}'), 'code': code}
+    season_info = {'id': _stable_id(code, season), 'startDate': f'{season}-08-10', 'endDate': f'{season + 1}-05-20',
+                   'currentMatchday': max(played_rounds, 1)}
+    teams = [{'id': base_id + i, 'name': f'{code} Team {i + 1}', 'shortName': f'Team {i + 1}',
+              'tla': f'{code[:1]}{i + 1:02d}', 'crest': None} for i in range(n_teams)]
+    referees = [{'id': _stable_id('referee', code) * 100 + r, 'name': f'{code} Referee {r + 1}',
+                 'type': 'REFEREE', 'nationality': None} for r in range(n_teams + 5)]
+
+    # Çift devreli lig fikstürü (round-robin)
+    order = list(range(n_teams))
+    first_half = []
+    for _ in range(n_teams - 1):
+        first_half.append([(order[i], order[n_teams - 1 - i]) for i in range(n_teams // 2)])
+        order = [order[0], order[-1]] + order[1:-1]
+    rounds = first_half + [[(away, home) for home, away in pairs] for pairs in first_half]
+
+    matches = []
+    table = {team['id']: Counter() for team in teams}
+    kickoff = datetime(season, 8, 10, 15)
+    for matchday, pairs in enumerate(rounds, 1):
+        for home, away in pairs:
+            played = matchday <= played_rounds
+            home_goals = rng.choice([0, 1, 1, 2, 2, 3, 4]) if played else None
+            away_goals = rng.choice([0, 0, 1, 1, 2, 3]) if played else None
+            winner = None
+            if played:
+                winner = 'HOME_TEAM' if home_goals > away_goals else 'AWAY_TEAM' if away_goals > home_goals else 'DRAW'
+                for team, scored, conceded in ((teams[home], home_goals, away_goals), (teams[away], away_goals, home_goals)):
+                    row = table[team['id']]
+                    row['playedGames'] += 1
+                    row['goalsFor'] += scored
+                    row['goalsAgainst'] += conceded
+                    row['won' if scored > conceded else 'lost' if scored < conceded else 'draw'] += 1
+
+            matches.append({
+                'id': season * 10 ** 9 + _stable_id(code) * 10_000 + len(matches),
+                'utcDate': (kickoff + timedelta(days=7 * (matchday - 1))).strftime('%Y-%m-%dT%H:%M:%SZ'),
+                'status': 'FINISHED' if played else 'TIMED',
+                'matchday': matchday,
+                'stage': 'REGULAR_SEASON',
+                'homeTeam': teams[home],
+                'awayTeam': teams[away],
+                'score': {
+                    'winner': winner,
+                    'duration': 'REGULAR',
+                    'fullTime': {'home': home_goals, 'away': away_goals},
+                    'halfTime': {'home': home_goals // 2 if played else None, 'away': away_goals // 2 if played else None},
+                },
+                'referees': [rng.choice(referees)],
+            })
+
+    rows = []
+    for team in teams:
+        row = table[team['id']]
+        rows.append({
+            'team': team,
+            'playedGames': row['playedGames'],
+            'form': None,
+            'won': row['won'],
+            'draw': row['draw'],
+            'lost': row['lost'],
+            'points': 3 * row['won'] + row['draw'],
+            'goalsFor': row['goalsFor'],
+            'goalsAgainst': row['goalsAgainst'],
+            'goalDifference': row['goalsFor'] - row['goalsAgainst'],
+        })
+    rows.sort(key=lambda r: (-r['points'], -r['goalDifference'], -r['goalsFor'], r['team']['name']))
+    for position, row in enumerate(rows, 1):
+        row['position'] = position
+
+    # Kadrolar: her sezon kadronun bir kısmı yenilenir
+    squads = []
+    for team in teams:
+        squad = []
+        for k in range(25):
+            player_id = team['id'] * 1000 + k + 30 * ((season + k) // 4 % 10)
+            squad.append({'id': player_id, 'name': f'Player {player_id}', 'position': POSITIONS[k % 4],
+                          'dateOfBirth': f'{1985 + player_id % 18}-{1 + player_id % 12:02d}-{1 + player_id % 28:02d}',
+                          'nationality': None})
+        squads.append(dict(team, squad=squad))
+
+    candidates = [(player, team) for team in squads for player in team['squad'] if player['position'] != 'Goalkeeper']
+    scorers = []
+    for player, team in rng.sample(candidates, min(100, len(candidates))):
+        goals = rng.randrange(1, 30)
+        scorers.append({
+            'player': dict(player, section=player['position']),
+            'team': {key: team[key] for key in ('id', 'name', 'shortName', 'tla', 'crest')},
+            'playedMatches': rng.randrange(goals // 2 + 1, max(played_rounds, goals // 2 + 1) + 1),
+            'goals': goals,
+            'assists': rng.choice([None, rng.randrange(0, 15)]),
+            'penalties': rng.randrange(0, goals // 3 + 1),
+        })
+    scorers.sort(key=lambda s: -s['goals'])
+
+    return {
+        'standings': {'competition': competition, 'season': season_info,
+                      'standings': [{'stage': 'REGULAR_SEASON', 'type': 'TOTAL', 'group': None, 'table': rows}]},
+        'matches': {'competition': competition, 'resultSet': {'count': len(matches), 'played': played_rounds * (n_teams // 2)},
+                    'matches': matches},
+        'squads': {'competition': competition, 'season': season_info, 'count': len(squads), 'teams': squads},
+        'scorers': {'competition': competition, 'season': season_info, 'count': len(scorers), 'scorers': scorers},
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive: requests.Session bağlantıyı tekrar kullanır
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status, headers, body = self.server.mock.handle(self.path, self.headers.get('X-Auth-Token'))
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json;charset=UTF-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockFootballDataServer:
+    """Arka planda çalışan taklit football-data.org sunucusu
+
+    with MockFootballDataServer(quota_per_minute=10, window=1.0) as server:
+        extractor = FootballDataExtractor(base_url=server.base_url)
+
+    raw_path verilirse o klasördeki en güncel ham dosyalar (olmayanlar için 404),
+    verilmezse LEAGUES'teki ligler için sentetik veri döner. Kota her API anahtarı için window saniyelik sabit pencerelerde sayılır
+    (window küçültülerek dakikalık kota testlerde hızlandırılabilir);
+    quota_per_minute=None kotayı kapatır. Rastgelelik seed ile tekrarlanabilir.
+    """
+    def __init__(self, host='127.0.0.1', port=0, raw_path=None, quota_per_minute=QUOTA_PER_MINUTE, window=60.0,
+                 latency=0.0, jitter=0.0, error_rate=0.0, restricted=(), api_key=None, n_teams=20, seed=0):
+        self.recorded = raw_path is not None
+        self.raw_files = find_latest_raw_files(raw_path) if self.recorded else {}
+        self.quota = quota_per_minute
+        self.window = window
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.restricted = set(restricted)
+        self.api_key = api_key
+        self.n_teams = n_teams
+        self.seed = seed
+        self.stats = Counter()
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._bodies = {}
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f'http://{host}:{port}/v4'
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='mock-football-data', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self):
+        """Sunucuyu ön planda çalıştır (Ctrl+C ile durur)"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _admit(self, token):
+        """Kotayı say: (izin verildi mi, kota başlıkları)"""
+        now = time.monotonic()
+        with self._lock:
+            start, used = self._windows.get(token, (now, 0))
+            if now - start >= self.window:
+                start, used = now, 0
+            allowed = self.quota is None or used < self.quota
+            if allowed:
+                used += 1
+            self._windows[token] = (start, used)
+
+        if self.quota is None:
+            return True, {}
+        reset = max(int(start + self.window - now + 0.999), 0)
+        return allowed, {'X-Requests-Available-Minute': str(self.quota - used), 'X-RequestCounter-Reset': str(reset)}
+
+    def _body(self, code, kind, season, limit):
+        """Uç noktanın JSON gövdesi (kodlanmış hali cache'lenir); veri yoksa None"""
+        key = (code, kind, season, limit)
+        body = self._bodies.get(key)
+        if body is None:
+            files = self.raw_files.get((code, season), {})
+            if kind in files:
+                with open(files[kind], encoding='utf-8') as f:
+                    data = json.load(f)
+            elif self.recorded or code not in LEAGUES:
+                return None
+            else:
+                data = synthetic_payloads(code, season, self.n_teams, seed=self.seed)[kind]
+
+            if kind == 'scorers':
+                scorers = data['scorers'][:DEFAULT_SCORERS_LIMIT if limit is None else limit]
+                data = dict(data, count=len(scorers), scorers=scorers)
+            body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+            self._bodies[key] = body
+        return body
+
+    def handle(self, path, token):
+        """İsteği cevapla: (durum kodu, başlıklar, gövde)"""
+        url = urlparse(path)
+        match = PATH_PATTERN.match(url.path)
+        query = parse_qs(url.query)
+        headers = {'X-API-Version': 'v4', 'X-Authenticated-Client': 'mock'}
+
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._rng.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if self.api_key is not None and token != self.api_key:
+            return self._error(403, headers, "The resource you are looking for is restricted. "
+                                             "Please pass a valid API token and check your subscription for permission.")
+
+        allowed, quota_headers = self._admit(token)
+        headers.update(quota_headers)
+        if not allowed:
+            return self._error(429, headers, f"You reached your request limit. "
+                                             f"Wait {quota_headers['X-RequestCounter-Reset']} seconds.")
+
+        if self.error_rate:
+            with self._lock:
+                failed = self._rng.random() < self.error_rate
+                status = self._rng.choice([500, 502, 503])
+            if failed:
+                return self._error(status, headers, "Mock server error")
+
+        if match is None:
+            return self._error(404, headers, "The resource you are looking for does not exist.")
+
+        try:
+            season = int(query.get('season', [SEASONS[-1]])[0])
+            limit = int(query['limit'][0]) if 'limit' in query else None
+        except ValueError:
+            return self._error(400, headers, "Invalid season or limit parameter.")
+
+        code, kind = match['code'], ENDPOINT_KINDS[match['endpoint']]
+        if (code, season) in self.restricted:
+            return self._error(403, headers, "The resource you are looking for is restricted. "
+                                             "Please pass a valid API token and check your subscription for permission.")
+
+        body = self._body(code, kind, season, limit)
+        if body is None:
+            return self._error(404, headers, "The resource you are looking for does not exist.")
+
+        self._count(200)
+        return 200, headers, body
+
+    def _count(self, status):
+        with self._lock:
+            self.stats[status] += 1
+
+    def _error(self, status, headers, message):
+        self._count(status)
+        return status, headers, json.dumps({'message': message, 'errorCode': status}).encode('utf-8')
+
+
+def parse_restricted(values):
+    """'SA:2014' biçimindeki değerleri (lig, sezon) çiftlerine çevir"""
+    pairs = []
+    for value in values:
+        code, season = value.split(':')
+        pairs.append((code, int(season)))
+    return pairs
+
+# Sunucuyu başlat
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="football-data.org v4 API'sinin yerel taklidi")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8090)
+    parser.add_argument('--raw', help=f"Kaydedilmiş ham dosyalar (ör. {RAW_DATA_PATH}); verilmezse sentetik veri")
+    parser.add_argument('--quota', type=int, default=QUOTA_PER_MINUTE, help="Pencere başına istek hakkı (0: sınırsız)")
+    parser.add_argument('--window', type=float, default=60.0, help="Kota penceresi (saniye)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Her isteğe eklenen gecikme (saniye)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Gecikmeye eklenen rastgele süre üst sınırı (saniye)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500/502/503 dönen isteklerin oranı")
+    parser.add_argument('--restricted', nargs='*', default=[], help="403 dönen lig-sezonlar (ör. SA:2014)")
+    parser.add_argument('--api-key', help="Verilirse yalnızca bu X-Auth-Token kabul edilir")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockFootballDataServer(args.host, args.port, raw_path=args.raw, quota_per_minute=args.quota or None,
+                                    window=args.window, latency=args.latency, jitter=args.jitter,
+                                    error_rate=args.error_rate, restricted=parse_restricted(args.restricted),
+                                    api_key=args.api_key, seed=args.seed)
+    print(f"✅ Mock football-data sunucusu: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 İstekler: {dict(server.stats)}")
@@ -1,149 +1,582 @@
 # src/loaders/database_loader.py
+import argparse
+import contextlib
 import sqlite3
 import pandas as pd
+import json
 import os
-import sys
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from configs.config import PROCESSED_DATA_PATH
+from configs.config import PROCESSED_DATA_PATH, DATABASE_PATH, SNAPSHOT_PATH, SHARD_PATH
+from src.validators.data_validator import DataValidator
+from src.utils.data_version import get_data_version, read_only_uri
+from src.database.shards import shard_path, season_id_base
+from src.transformers.engines import SCHEMAS, conform
+
+# İşlenmiş dosya adı: {lig}_{sezon}_{standings|matches|officials|squads|scorers}.{csv|parquet}
+PROCESSED_FILE_PATTERN = re.compile(r'^(?P<code>[A-Z0-9]+)_(?P<season>\d{4})_(?P<kind>standings|matches|officials|squads|scorers)\.(csv|parquet)$')
+
+# Şema dosyası paketle birlikte gelir; çalışılan klasörden bağımsız okunur
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'database', 'schema.sql')
+
+# Staging veritabanı canlı dosyanın yanında oluşturulur (rename aynı dosya sisteminde atomiktir);
+# her yükleyicinin dosya adı benzersizdir: {db}.{rastgele}.staging
+STAGING_SUFFIX = '.staging'
+
+# Boş staging veritabanında bu indeksler veriden sonra oluşturulur; UNIQUE indeksler
+# upsert'lerin ON CONFLICT hedefi olduğu için baştan kalır
+DEFERRED_INDEX_PATTERN = re.compile(r'^CREATE INDEX IF NOT EXISTS .*?;$', re.MULTILINE)
+
+
+def find_processed_files(processed_path=PROCESSED_DATA_PATH):
+    """İşlenmiş dosyaları (lig, sezon) anahtarına göre grupla (aynı tablonun Parquet'i CSV'sine tercih edilir)"""
+    groups = {}
+    # sorted() .csv'yi .parquet'ten önce getirir; Parquet varsa CSV'nin yerine geçer
+    for filename in sorted(os.listdir(processed_path)):
+        match = PROCESSED_FILE_PATTERN.match(filename)
+        if match:
+            key = (match['code'], int(match['season']))
+            groups.setdefault(key, {})[match['kind']] = os.path.join(processed_path, filename)
+    return groups
+
+
+def read_processed_file(path, kind):
+    """İşlenmiş dosyayı bildirilen tiplerle oku (Parquet tipleri taşır, CSV metinden çözülür)"""
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        # Metin kolonları sayıya benzese de metin kalır (ör. sezon '2023')
+        df = pd.read_csv(path, dtype={col: 'str' for col, dtype in SCHEMAS[kind].items() if dtype == 'str'})
+    return conform(kind, df)
+
+def _to_records(df, columns):
+    """DataFrame'i executemany için tuple listesine çevir (NaN -> None, tarih -> string)"""
+    frame = df.reindex(columns=columns)
+    
+    for col in columns:
+        values = frame[col]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            frame[col] = values.dt.strftime('%Y-%m-%d %H:%M:%S')
+        elif values.dtype == object and values.map(lambda v: hasattr(v, 'strftime')).any():
+            frame[col] = values.map(lambda v: v.strftime('%Y-%m-%d %H:%M:%S') if hasattr(v, 'strftime') else v)
+    
+    frame = frame.astype(object)
+    frame = frame.where(frame.notna(), None)
+    return list(frame.itertuples(index=False, name=None))
+
 
 class DatabaseLoader:
-    def __init__(self, db_path='data/football_data.db'):
+    def __init__(self, db_path=DATABASE_PATH, staging=False, season_id_base=None):
+        """staging=True: yükleme canlı veritabanının kopyasına yapılır, publish() ile atomik olarak yayınlanır
+        
+        season_id_base: yeni sezonların ID'leri bu değerden başlar (lig shard'ları için, bkz. src/database/shards.py)
+        """
         self.db_path = db_path
+        self.staging = staging
+        self.season_id_base = season_id_base
         self.conn = None
         self.cursor = None
-        
+        self.staging_path = None
+        self._base_version = None
+        self._deferred_indexes = []
+        self._in_transaction = False
+    
     def connect(self):
-        """Veritabanına bağlan"""
-        self.conn = sqlite3.connect(self.db_path)
-        self.cursor = self.conn.cursor()
-        print(f"✅ Veritabanına bağlanıldı: {self.db_path}")
+        """Veritabanına bağlan (staging modunda canlı veritabanının kopyasına)"""
+        if not self.staging:
+            self.conn = sqlite3.connect(self.db_path)
+            self.cursor = self.conn.cursor()
+            print(f"✅ Veritabanına bağlanıldı: {self.db_path}")
+            return
+        
+        # Aynı anda çalışan yükleyiciler (ör. backfill ve football-etl load) birbirinin
+        # staging dosyasına dokunmaz; yükleme her zaman canlı sürümden başlar
+        fd, self.staging_path = tempfile.mkstemp(suffix=STAGING_SUFFIX, prefix=f"{os.path.basename(self.db_path)}.",
+                                                 dir=os.path.dirname(os.path.abspath(self.db_path)))
+        os.close(fd)
+        # mkstemp dosyayı yalnızca sahibine açar; yayınlanan veritabanını diğer kullanıcılar da okuyabilmeli
+        os.chmod(self.staging_path, 0o644)
+        
+        self._base_version = get_data_version(self.db_path)
+        self.conn = sqlite3.connect(self.staging_path)
+        if self._base_version is not None:
+            source = sqlite3.connect(read_only_uri(self.db_path), uri=True)
+            try:
+                source.backup(self.conn)
+            finally:
+                source.close()
         
+        # Staging dosyası yayından önce çökerse zaten atılır; fsync beklemeye gerek yok
+        self.conn.execute("PRAGMA synchronous = OFF")
+        self.cursor = self.conn.cursor()
+        print(f"✅ Staging veritabanına bağlanıldı: {self.staging_path}")
+    
     def disconnect(self):
-        """Bağlantıyı kapat"""
+        """Bağlantıyı kapat; yayınlanmamış staging dosyası silinir"""
         if self.conn:
             self.conn.close()
+            self.conn = None
             print("🔌 Veritabanı bağlantısı kapatıldı")
+        
+        if self.staging and self.staging_path:
+            for path in (self.staging_path, f"{self.staging_path}-journal"):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.staging_path = None
+    
+    @contextlib.contextmanager
+    def transaction(self):
+        """İçindeki load_* çağrılarını tek transaction'da çalıştır; hata olursa hiçbiri yazılmaz
+        
+        load_* metotları tek başına çağrıldıklarında kendileri commit eder; bir lig-sezonun
+        tabloları bu blokta yüklenirse yarım kalan lig-sezon (ör. maçsız puan durumu) kalmaz.
+        """
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
+    
+    def _commit(self):
+        if not self._in_transaction:
+            self.conn.commit()
     
     def create_tables(self):
         """Tabloları oluştur"""
-        schema_path = 'src/database/schema.sql'
-        
-        with open(schema_path, 'r') as f:
+        with open(SCHEMA_PATH, 'r') as f:
             schema = f.read()
         
+        self._migrate()
+        self._dedupe_quarantine()
+        if self.staging and self._base_version is None:
+            # Sıfırdan kurulan veritabanında ikincil indeksler toplu yüklemeden sonra oluşturulur
+            self._deferred_indexes = DEFERRED_INDEX_PATTERN.findall(schema)
+            schema = DEFERRED_INDEX_PATTERN.sub('', schema)
+        
         self.cursor.executescript(schema)
+        if self.season_id_base is not None:
+            self.cursor.execute("""
+                INSERT INTO sqlite_sequence (name, seq)
+                SELECT 'seasons', ? WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = 'seasons')
+            """, (self.season_id_base,))
         self.conn.commit()
         print("✅ Tablolar oluşturuldu")
     
+    def _migrate(self):
+        """Eski veritabanlarını sezon anahtarlı şemaya taşı"""
+        columns = [row[1] for row in self.cursor.execute("PRAGMA table_info(seasons)")]
+        if not columns or 'season_year' in columns:
+            return
+        
+        # Eskiden her yükleme yeni bir sezon satırı açıyordu; her anahtar için en son satır kalır
+        self.cursor.executescript("""
+            ALTER TABLE seasons ADD COLUMN season_year INTEGER;
+            UPDATE seasons SET season_year = CAST(substr(season_start, 1, 4) AS INTEGER);
+            
+            CREATE TEMP TABLE season_map AS
+                SELECT s.season_id AS old_id, latest.season_id AS new_id
+                FROM seasons s
+                JOIN (SELECT competition_code, season_year, MAX(season_id) AS season_id
+                      FROM seasons GROUP BY competition_code, season_year) latest
+                  ON s.competition_code IS latest.competition_code AND s.season_year IS latest.season_year;
+            
+            UPDATE matches SET season_id = (SELECT new_id FROM season_map WHERE old_id = matches.season_id)
+            WHERE season_id IN (SELECT old_id FROM season_map WHERE old_id != new_id);
+            DELETE FROM standings WHERE season_id IN (SELECT old_id FROM season_map WHERE old_id != new_id);
+            DELETE FROM seasons WHERE season_id IN (SELECT old_id FROM season_map WHERE old_id != new_id);
+            DROP TABLE season_map;
+        """)
+        self.conn.commit()
+        print("✅ Sezon tablosu sezon anahtarına taşındı")
+    
+    def _dedupe_quarantine(self):
+        """Benzersiz karantina indeksinden önceki veritabanlarında tekrar yüklemelerle çoğalan kayıtların ilki kalır"""
+        indexes = {row[0] for row in self.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'quarantine'")}
+        if not indexes or 'idx_quarantine_key' in indexes:
+            return
+        
+        deleted = self.cursor.execute("""
+            DELETE FROM quarantine WHERE quarantine_id NOT IN (
+                SELECT MIN(quarantine_id) FROM quarantine
+                GROUP BY table_name, IFNULL(record_key, ''), reason, IFNULL(source_file, '')
+            )
+        """).rowcount
+        self.conn.commit()
+        if deleted:
+            print(f"✅ {deleted} tekrarlanan karantina kaydı silindi")
+    
+    def _log_changes(self, table_name, key_column, columns, records, old_rows, season_id=None,
+                     detect_deletes=False, ignore=()):
+        """Eski ve yeni satırları karşılaştırıp change_log'a olay ekle (commit çağırana aittir)
+        
+        old_rows ve records aynı kolon sırasında olmalıdır; ignore'daki kolonlar karşılaştırılmaz.
+        """
+        key_index = columns.index(key_column)
+        tracked = [i for i, column in enumerate(columns) if column not in ignore]
+        old = {row[key_index]: row for row in old_rows}
+        events, seen = [], set()
+        
+        for record in records:
+            key = record[key_index]
+            seen.add(key)
+            before = old.get(key)
+            if before is None:
+                events.append((key, 'insert', {columns[i]: record[i] for i in tracked}))
+            else:
+                changed = {columns[i]: [before[i], record[i]] for i in tracked if before[i] != record[i]}
+                if changed:
+                    events.append((key, 'update', changed))
+        
+        if detect_deletes:
+            events.extend((key, 'delete', {columns[i]: row[i] for i in tracked})
+                          for key, row in old.items() if key not in seen)
+        
+        changed_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.cursor.executemany("""
+            INSERT INTO change_log (table_name, record_key, change_type, season_id, changes, changed_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [(table_name, str(key), change_type, season_id, json.dumps(changes, ensure_ascii=False), changed_at)
+              for key, change_type, changes in events])
+        return len(events)
+    
     def load_teams(self, standings_df):
         """Takımları veritabanına yükle"""
         # Unique takımları al
         teams_df = standings_df[['team_id', 'team_name', 'team_short_name', 'team_tla', 'crest_url']].drop_duplicates()
         
-        # Veritabanına yükle
-        for _, team in teams_df.iterrows():
-            self.cursor.execute("""
-                INSERT OR REPLACE INTO teams (team_id, team_name, team_short_name, team_tla, crest_url)
-                VALUES (?, ?, ?, ?, ?)
-            """, (team['team_id'], team['team_name'], team['team_short_name'], team['team_tla'], team['crest_url']))
+        columns = list(teams_df.columns)
+        records = _to_records(teams_df, columns)
+        old_rows = self.cursor.execute(
+            f"SELECT {','.join(columns)} FROM teams WHERE team_id IN (SELECT value FROM json_each(?))",
+            (json.dumps([record[0] for record in records]),)
+        ).fetchall()
+        changes = self._log_changes('teams', 'team_id', columns, records, old_rows)
         
-        self.conn.commit()
-        print(f"✅ {len(teams_df)} takım yüklendi")
+        # Veritabanına toplu yükle
+        self.cursor.executemany("""
+            INSERT OR REPLACE INTO teams (team_id, team_name, team_short_name, team_tla, crest_url)
+            VALUES (?, ?, ?, ?, ?)
+        """, records)
         
+        self._commit()
+        print(f"✅ {len(teams_df)} takım yüklendi ({changes} değişiklik)")
+    
     def load_season(self, standings_df):
-        """Sezon bilgisini yükle"""
+        """Sezon bilgisini yükle; (lig, sezon yılı) zaten varsa aynı ID'yi döndür"""
         season_info = standings_df[['competition_code', 'competition_name', 'season_start', 'season_end']].iloc[0]
         
+        if 'season_year' in standings_df.columns:
+            season_year = int(standings_df['season_year'].iloc[0])
+        else:
+            season_year = int(str(season_info['season_start'])[:4])
+        
         self.cursor.execute("""
-            INSERT INTO seasons (competition_code, competition_name, season_start, season_end)
-            VALUES (?, ?, ?, ?)
-        """, (season_info['competition_code'], season_info['competition_name'], 
+            INSERT INTO seasons (competition_code, competition_name, season_year, season_start, season_end)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (competition_code, season_year) DO UPDATE SET
+                competition_name = excluded.competition_name,
+                season_start = excluded.season_start,
+                season_end = excluded.season_end
+        """, (season_info['competition_code'], season_info['competition_name'], season_year,
               season_info['season_start'], season_info['season_end']))
         
-        season_id = self.cursor.lastrowid
-        self.conn.commit()
-        print(f"✅ Sezon yüklendi (ID: {season_id})")
+        season_id = self.cursor.execute(
+            "SELECT season_id FROM seasons WHERE competition_code = ? AND season_year = ?",
+            (season_info['competition_code'], season_year)
+        ).fetchone()[0]
+        self._commit()
+        print(f"✅ Sezon yüklendi: {season_info['competition_code']} {season_year} (ID: {season_id})")
         
         return season_id
     
     def load_standings(self, standings_df, season_id):
-        """Puan durumunu yükle"""
+        """Puan durumunu yükle (sezonun önceki puan durumu silinir)"""
         standings_df['season_id'] = season_id
         standings_df['last_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # String formatına çevir
         
-        columns = ['season_id', 'team_id', 'position', 'played_games', 'won', 'draw', 'lost', 
-                'points', 'goals_for', 'goals_against', 'goal_difference', 'form', 
-                'win_percentage', 'points_per_game', 'goals_per_game', 'goals_conceded_per_game', 
+        columns = ['season_id', 'team_id', 'position', 'played_games', 'won', 'draw', 'lost',
+                'points', 'goals_for', 'goals_against', 'goal_difference', 'form',
+                'win_percentage', 'points_per_game', 'goals_per_game', 'goals_conceded_per_game',
                 'last_updated']
         
         # form_points varsa ekle
         if 'form_points' in standings_df.columns:
             columns.insert(columns.index('form') + 1, 'form_points')
         
-        for _, row in standings_df.iterrows():
-            values = []
-            for col in columns:
-                value = row[col]
-                # NaN değerleri None'a çevir
-                if pd.isna(value):
-                    values.append(None)
-                # Timestamp objelerini string'e çevir
-                elif hasattr(value, 'strftime'):
-                    values.append(value.strftime('%Y-%m-%d %H:%M:%S'))
-                else:
-                    values.append(value)
-            
-            placeholders = ','.join(['?' for _ in columns])
-            query = f"INSERT INTO standings ({','.join(columns)}) VALUES ({placeholders})"
-            self.cursor.execute(query, values)
+        records = _to_records(standings_df, columns)
+        old_rows = self.cursor.execute(
+            f"SELECT {','.join(columns)} FROM standings WHERE season_id = ?", (season_id,)
+        ).fetchall()
+        # last_updated her yüklemede değişir; değişiklik sayılmaz
+        changes = self._log_changes('standings', 'team_id', columns, records, old_rows, season_id,
+                                    detect_deletes=True, ignore=('season_id', 'last_updated'))
         
-        self.conn.commit()
-        print(f"✅ {len(standings_df)} takımın puan durumu yüklendi")
+        placeholders = ','.join(['?' for _ in columns])
+        self.cursor.execute("DELETE FROM standings WHERE season_id = ?", (season_id,))
+        self.cursor.executemany(
+            f"INSERT INTO standings ({','.join(columns)}) VALUES ({placeholders})",
+            records
+        )
+        
+        self._commit()
+        print(f"✅ {len(standings_df)} takımın puan durumu yüklendi ({changes} değişiklik)")
     
     def load_matches(self, matches_df, season_id):
         """Maçları yükle"""
         matches_df['season_id'] = season_id
         
-        # match_date ve match_time sütunlarını string'e çevir
-        if 'match_date' in matches_df.columns:
-            matches_df['match_date'] = pd.to_datetime(matches_df['match_date']).dt.strftime('%Y-%m-%d')
-        
-        if 'match_time' in matches_df.columns:
-            matches_df['match_time'] = matches_df['match_time'].astype(str)
+        # match_date / match_time date ve time nesneleri olarak gelir; SQLite'a ISO metni yazılır
+        for col in ('match_date', 'match_time'):
+            if col in matches_df.columns:
+                matches_df[col] = matches_df[col].map(lambda v: v.isoformat() if pd.notna(v) else None)
         
         columns = ['match_id', 'season_id', 'match_date', 'match_time', 'matchday',
                 'home_team_id', 'away_team_id', 'home_score', 'away_score',
                 'home_score_ht', 'away_score_ht', 'status', 'total_goals',
                 'goal_difference', 'is_draw', 'is_home_win', 'is_away_win', 'referees']
         
-        for _, row in matches_df.iterrows():
-            values = []
-            for col in columns:
-                value = row[col] if col in row else None
-                # NaN değerleri None'a çevir
-                if pd.isna(value):
-                    values.append(None)
-                # Timestamp objelerini string'e çevir
-                elif hasattr(value, 'strftime'):
-                    values.append(value.strftime('%Y-%m-%d %H:%M:%S'))
-                else:
-                    values.append(value)
+        records = _to_records(matches_df, columns)
+        old_rows = self.cursor.execute(
+            f"SELECT {','.join(columns)} FROM matches WHERE match_id IN (SELECT value FROM json_each(?))",
+            (json.dumps([record[0] for record in records]),)
+        ).fetchall()
+        changes = self._log_changes('matches', 'match_id', columns, records, old_rows, season_id)
+        
+        placeholders = ','.join(['?' for _ in columns])
+        self.cursor.executemany(
+            f"INSERT OR REPLACE INTO matches ({','.join(columns)}) VALUES ({placeholders})",
+            records
+        )
+        
+        self._commit()
+        print(f"✅ {len(matches_df)} maç yüklendi ({changes} değişiklik)")
+    
+    def load_match_officials(self, officials_df, season_id):
+        """Hakemleri ve maç görevlilerini yükle, sezonun hakem istatistiklerini yeniden hesapla"""
+        referees_df = officials_df.drop_duplicates('referee_id', keep='last')
+        self.cursor.executemany("""
+            INSERT INTO referees (referee_id, referee_name, nationality) VALUES (?, ?, ?)
+            ON CONFLICT (referee_id) DO UPDATE SET
+                referee_name = excluded.referee_name,
+                nationality = excluded.nationality
+        """, _to_records(referees_df, ['referee_id', 'referee_name', 'nationality']))
+        
+        # Sezonun görevli listesi her yüklemede baştan yazılır
+        officials_df = officials_df.drop_duplicates(['match_id', 'referee_id', 'role'])
+        self.cursor.execute("""
+            DELETE FROM match_officials
+            WHERE match_id IN (SELECT match_id FROM matches WHERE season_id = ?)
+        """, (season_id,))
+        self.cursor.executemany(
+            "INSERT INTO match_officials (match_id, referee_id, role) VALUES (?, ?, ?)",
+            _to_records(officials_df, ['match_id', 'referee_id', 'role'])
+        )
+        
+        self._commit()
+        print(f"✅ {len(referees_df)} hakem, {len(officials_df)} maç görevlisi yüklendi")
+        
+        self.refresh_referee_stats(season_id)
+    
+    def refresh_referee_stats(self, season_id):
+        """Sezonun orta hakem istatistiklerini (ev sahibi galibiyet oranı, maç başı gol) yeniden hesapla"""
+        self.cursor.execute("DELETE FROM referee_season_stats WHERE season_id = ?", (season_id,))
+        self.cursor.execute("""
+            INSERT INTO referee_season_stats (season_id, referee_id, matches_officiated, home_wins, draws,
+                                              away_wins, total_goals, home_win_rate, goals_per_game)
+            SELECT m.season_id, mo.referee_id, COUNT(*), SUM(m.is_home_win), SUM(m.is_draw), SUM(m.is_away_win),
+                   SUM(m.total_goals),
+                   ROUND(100.0 * SUM(m.is_home_win) / COUNT(*), 2),
+                   ROUND(1.0 * SUM(m.total_goals) / COUNT(*), 2)
+            FROM matches m
+            JOIN match_officials mo ON mo.match_id = m.match_id
+            WHERE m.season_id = ? AND m.status = 'FINISHED' AND mo.role = 'REFEREE'
+            GROUP BY m.season_id, mo.referee_id
+        """, (season_id,))
+        
+        self._commit()
+        print(f"✅ {self.cursor.rowcount} hakemin sezon istatistikleri hesaplandı")
+    
+    def load_players(self, players_df):
+        """Oyuncuları ekle/güncelle; kaynakta olmayan alanlar (null) mevcut değerin üzerine yazılmaz"""
+        columns = ['player_id', 'player_name', 'first_name', 'last_name', 'date_of_birth', 'nationality', 'position']
+        players_df = players_df.drop_duplicates('player_id', keep='last')
+        
+        self.cursor.executemany("""
+            INSERT INTO players (player_id, player_name, first_name, last_name, date_of_birth, nationality, position)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (player_id) DO UPDATE SET
+                player_name = excluded.player_name,
+                first_name = COALESCE(excluded.first_name, players.first_name),
+                last_name = COALESCE(excluded.last_name, players.last_name),
+                date_of_birth = COALESCE(excluded.date_of_birth, players.date_of_birth),
+                nationality = COALESCE(excluded.nationality, players.nationality),
+                position = COALESCE(excluded.position, players.position)
+        """, _to_records(players_df, columns))
+        
+        self._commit()
+        print(f"✅ {len(players_df)} oyuncu yüklendi")
+    
+    def load_squads(self, squads_df, season_id):
+        """Sezonun kadrolarını yükle (sezonun önceki kadro kayıtları silinir)"""
+        self.load_players(squads_df)
+        
+        squads_df = squads_df.drop_duplicates(['team_id', 'player_id'], keep='last').assign(season_id=season_id)
+        self.cursor.execute("DELETE FROM squad_memberships WHERE season_id = ?", (season_id,))
+        self.cursor.executemany(
+            "INSERT INTO squad_memberships (season_id, team_id, player_id, position) VALUES (?, ?, ?, ?)",
+            _to_records(squads_df, ['season_id', 'team_id', 'player_id', 'position'])
+        )
+        
+        self._commit()
+        print(f"✅ {squads_df['team_id'].nunique()} takımın kadrosu yüklendi ({len(squads_df)} oyuncu)")
+    
+    def load_player_stats(self, scorers_df, season_id):
+        """Sezonun oyuncu istatistiklerini yükle (sezonun önceki istatistikleri silinir)"""
+        self.load_players(scorers_df)
+        
+        scorers_df = scorers_df.assign(season_id=season_id)
+        columns = ['season_id', 'player_id', 'team_id', 'shirt_number', 'played_matches', 'goals',
+                   'assists', 'penalties', 'goals_per_match']
+        
+        placeholders = ','.join(['?' for _ in columns])
+        self.cursor.execute("DELETE FROM player_season_stats WHERE season_id = ?", (season_id,))
+        self.cursor.executemany(
+            f"INSERT INTO player_season_stats ({','.join(columns)}) VALUES ({placeholders})",
+            _to_records(scorers_df, columns)
+        )
+        
+        self._commit()
+        print(f"✅ {len(scorers_df)} oyuncunun sezon istatistikleri yüklendi")
+    
+    def load_quarantine(self, quarantine_df):
+        """Doğrulamadan geçemeyen satırları sebepleriyle karantina tablosuna yaz"""
+        if quarantine_df.empty:
+            return
+        
+        # Aynı dosyadan daha önce karantinaya alınmış satırlar tekrar yazılmaz (idx_quarantine_key)
+        columns = ['table_name', 'record_key', 'reason', 'payload', 'source_file', 'quarantined_at']
+        inserted = self.cursor.executemany(
+            f"INSERT OR IGNORE INTO quarantine ({','.join(columns)}) VALUES ({','.join(['?' for _ in columns])})",
+            _to_records(quarantine_df, columns)
+        ).rowcount
+        
+        self._commit()
+        print(f"⚠️ {len(quarantine_df)} satır karantinada ({inserted} yeni)")
+    
+    def load_competition_season(self, standings_df, matches_df, officials_df=None, sources=None):
+        """Bir lig-sezonu doğrula; geçerli satırları yükle, hatalıları karantinaya al
+        
+        sources: {'standings': dosya, 'matches': dosya, 'officials': dosya}, karantina kayıtları için
+        """
+        validator = DataValidator()
+        sources = sources or {}
+        # Bellekten gelen tablolar zaten bildirilen tiplerdedir; diğerleri (ör. elle okunmuş CSV) dönüştürülür
+        standings_df = conform('standings', standings_df)
+        matches_df = conform('matches', matches_df) if matches_df is not None else None
+        officials_df = conform('officials', officials_df) if officials_df is not None else None
+        
+        standings_df, quarantine_df = validator.validate_standings(standings_df, sources.get('standings'))
+        self.load_quarantine(quarantine_df)
+        if standings_df.empty:
+            print("❌ Hata: Geçerli puan durumu satırı kalmadı, lig-sezon atlandı")
+            return None
+        
+        self.load_teams(standings_df)
+        season_id = self.load_season(standings_df)
+        self.load_standings(standings_df, season_id)
+        
+        if matches_df is not None:
+            # Maçlar yalnızca veritabanında bulunan takımlara referans verebilir
+            known_team_ids = [row[0] for row in self.cursor.execute("SELECT team_id FROM teams")]
+            matches_df, quarantine_df = validator.validate_matches(matches_df, known_team_ids, sources.get('matches'))
+            self.load_quarantine(quarantine_df)
+            self.load_matches(matches_df, season_id)
             
-            placeholders = ','.join(['?' for _ in columns])
-            query = f"INSERT OR REPLACE INTO matches ({','.join(columns)}) VALUES ({placeholders})"
-            self.cursor.execute(query, values)
+            if officials_df is not None:
+                # Görevliler yalnızca bu batch'te yüklenen maçlara bağlanabilir
+                officials_df, quarantine_df = validator.validate_officials(
+                    officials_df, matches_df['match_id'], sources.get('officials'))
+                self.load_quarantine(quarantine_df)
+                self.load_match_officials(officials_df, season_id)
+        return season_id
+    
+    def load_competition_players(self, season_id, squads_df=None, scorers_df=None, sources=None):
+        """Yüklenmiş bir lig-sezonun kadro ve golcü listelerini doğrula ve yükle
+        
+        Maç yüklemesinden ayrı çalışır; oyuncu verisi olmayan sezonlar etkilenmez.
+        sources: {'squads': dosya, 'scorers': dosya}, karantina kayıtları için
+        """
+        validator = DataValidator()
+        sources = sources or {}
+        known_team_ids = [row[0] for row in self.cursor.execute("SELECT team_id FROM teams")]
         
+        if squads_df is not None:
+            squads_df, quarantine_df = validator.validate_squads(conform('squads', squads_df), known_team_ids,
+                                                                 sources.get('squads'))
+            self.load_quarantine(quarantine_df)
+            self.load_squads(squads_df, season_id)
+        
+        if scorers_df is not None:
+            scorers_df, quarantine_df = validator.validate_scorers(conform('scorers', scorers_df), known_team_ids,
+                                                                   sources.get('scorers'))
+            self.load_quarantine(quarantine_df)
+            self.load_player_stats(scorers_df, season_id)
+    
+    def publish(self, snapshot_dir=SNAPSHOT_PATH):
+        """Staging veritabanını canlı dosyanın yerine koy ve snapshot'ı yayınla (snapshot_dir None ise yayınlanmaz)
+        
+        Okuyucular rename'e kadar eski sürümü, sonrasında yeni sürümü eksiksiz görür; açık
+        bağlantılar eski dosyayı okumaya devam eder ve sürüm değişince yeniden açılır.
+        """
+        if not self.staging:
+            return self.publish_snapshot(snapshot_dir) if snapshot_dir else None
+        
+        if self._deferred_indexes:
+            self.cursor.executescript('\n'.join(self._deferred_indexes))
+            self._deferred_indexes = []
         self.conn.commit()
-        print(f"✅ {len(matches_df)} maç yüklendi")
+        
+        result = self.conn.execute("PRAGMA quick_check").fetchone()[0]
+        if result != 'ok':
+            raise RuntimeError(f"Staging veritabanı bozuk, yayınlanmadı: {result}")
+        self.conn.close()
+        self.conn = None
+        
+        # Yükleme sırasında canlı dosyaya başka biri yazdıysa üzerine yazılmaz
+        if get_data_version(self.db_path) != self._base_version:
+            raise RuntimeError(f"Canlı veritabanı yükleme sırasında değişti, staging yayınlanmadı: {self.db_path}")
+        
+        os.replace(self.staging_path, self.db_path)
+        print(f"✅ Yeni veritabanı yayınlandı: {self.db_path}")
+        
+        self.conn = sqlite3.connect(self.db_path)
+        self.cursor = self.conn.cursor()
+        self.staging = False
+        return self.publish_snapshot(snapshot_dir) if snapshot_dir else None
+    
+    def publish_snapshot(self, snapshot_dir=SNAPSHOT_PATH):
+        """Yükleme sonrası dashboard için Arrow snapshot'ı yayınla"""
+        from src.loaders.snapshot import publish_snapshot
+        
+        self.conn.commit()
+        return publish_snapshot(self.db_path, snapshot_dir)
     
     def get_statistics(self):
         """Veritabanı istatistiklerini göster"""
         stats = {}
         
         # Tablo istatistikleri
-        tables = ['teams', 'seasons', 'standings', 'matches']
+        tables = ['teams', 'seasons', 'standings', 'matches', 'referees', 'match_officials',
+                  'players', 'squad_memberships', 'player_season_stats', 'quarantine', 'change_log']
         for table in tables:
             self.cursor.execute(f"SELECT COUNT(*) FROM {table}")
             stats[table] = self.cursor.fetchone()[0]
@@ -154,27 +587,100 @@ class DatabaseLoader:
         
         return stats
 
-# Test
-if __name__ == "__main__":
-    # CSV dosyalarını yükle
-    standings_df = pd.read_csv(os.path.join(PROCESSED_DATA_PATH, 'premier_league_standings.csv'))
-    matches_df = pd.read_csv(os.path.join(PROCESSED_DATA_PATH, 'premier_league_matches.csv'))
+def load_frames(loader, code, season, frames, sources=None):
+    """Bir lig-sezonun tablolarını ({tür: DataFrame}) doğrulayıp yükle; metin serileştirme gerekmez"""
+    if 'standings' not in frames:
+        print(f"⚠️ Uyarı: {code} {season} için puan durumu tablosu yok, atlandı")
+        return None
     
-    # Veritabanı işlemleri
-    loader = DatabaseLoader()
+    print(f"\n📥 Yükleniyor: {code} {season}")
+    # Lig-sezonun tabloları tek commit'le yazılır (staging'de tablo başına commit yok)
+    with loader.transaction():
+        season_id = loader.load_competition_season(frames['standings'], frames.get('matches'),
+                                                   frames.get('officials'), sources=sources)
+        
+        if season_id is not None and ('squads' in frames or 'scorers' in frames):
+            loader.load_competition_players(season_id, frames.get('squads'), frames.get('scorers'), sources=sources)
+    return season_id
+
+
+def load_processed_group(loader, code, season, files):
+    """Bir lig-sezonun işlenmiş dosyalarını (CSV ya da Parquet) oku ve yükle"""
+    frames = {kind: read_processed_file(path, kind) for kind, path in files.items()}
+    return load_frames(loader, code, season, frames, sources=files)
+
+
+def load_shard(code, groups, shard_dir=SHARD_PATH):
+    """Bir ligin tüm sezonlarını kendi shard'ına yükle ve yayınla (ayrı süreçte çalışır)
+    
+    groups: {sezon: {tür: dosya}}. Her shard kendi staging dosyasına yüklenir ve ayrı
+    yayınlanır; bir ligin yüklenmesi diğer liglerin okuyucularını etkilemez.
+    """
+    os.makedirs(shard_dir, exist_ok=True)
+    loader = DatabaseLoader(shard_path(code, shard_dir), staging=True, season_id_base=season_id_base(code))
+    try:
+        loader.connect()
+        loader.create_tables()
+        loaded = sum(load_processed_group(loader, code, season, files) is not None
+                     for season, files in sorted(groups.items()))
+        loader.publish(snapshot_dir=None)
+        return code, loaded
+    finally:
+        loader.disconnect()
+
+def load_batches(batches, db_path=DATABASE_PATH, snapshot_dir=SNAPSHOT_PATH):
+    """((lig, sezon), {tür: DataFrame}, kaynaklar) akışını tek veritabanına yükle ve yayınla
+    
+    batches: ör. FootballDataTransformer.transform_frames() (dönüştürücüden doğrudan,
+    bellekte) ya da işlenmiş dosyalardan okunan tablolar (load_all).
+    """
+    # Dashboard ve API yükleme bitene kadar önceki sürümü okur
+    loader = DatabaseLoader(db_path, staging=True)
     
     try:
         loader.connect()
         loader.create_tables()
         
-        # Verileri yükle
-        loader.load_teams(standings_df)
-        season_id = loader.load_season(standings_df)
-        loader.load_standings(standings_df, season_id)
-        loader.load_matches(matches_df, season_id)
+        for (code, season), frames, sources in batches:
+            load_frames(loader, code, season, frames, sources)
         
-        # İstatistikleri göster
-        loader.get_statistics()
+        # Yeni sürümü yayınla ve dashboard snapshot'ını güncelle
+        loader.publish(snapshot_dir=snapshot_dir)
         
+        # İstatistikleri göster
+        return loader.get_statistics()
+    
     finally:
-        loader.disconnect()
\ No newline at end of file
+        loader.disconnect()
+
+def load_all(processed_path=PROCESSED_DATA_PATH, db_path=DATABASE_PATH, snapshot_dir=SNAPSHOT_PATH):
+    """İşlenmiş tüm lig-sezon dosyalarını tek veritabanına yükle ve yayınla"""
+    # Dosyalar lig-sezon lig-sezon, yüklenirken okunur
+    batches = ((key, {kind: read_processed_file(path, kind) for kind, path in files.items()}, files)
+               for key, files in find_processed_files(processed_path).items())
+    return load_batches(batches, db_path, snapshot_dir)
+
+def load_sharded(processed_path=PROCESSED_DATA_PATH, shard_dir=SHARD_PATH, workers=None):
+    """Her ligi kendi shard'ına paralel süreçlerde yükle"""
+    by_competition = {}
+    for (code, season), files in find_processed_files(processed_path).items():
+        by_competition.setdefault(code, {})[season] = files
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(load_shard, code, groups, shard_dir) for code, groups in by_competition.items()]
+        for future in futures:
+            code, loaded = future.result()
+            print(f"✅ {code} shard'ı yayınlandı: {loaded} sezon ({shard_path(code, shard_dir)})")
+
+# Test
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="İşlenmiş lig-sezon dosyalarını veritabanına yükle")
+    parser.add_argument('--sharded', action='store_true', help="Her lig için ayrı veritabanı dosyası (paralel yükleme)")
+    parser.add_argument('--shard-dir', default=SHARD_PATH)
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Paralel yükleyen süreç sayısı (--sharded)")
+    args = parser.parse_args()
+    
+    if args.sharded:
+        load_sharded(shard_dir=args.shard_dir, workers=args.workers)
+    else:
+        load_all()
@@ -0,0 +1,126 @@
+# src/loaders/snapshot.py
+# Dashboard sorgularının tüm sezonlar için sonuçları Arrow IPC dosyalarına
+# yazılır. Satırlar sezona göre sıralıdır ve manifest her sezonun satır
+# aralığını tutar. Okuyucu dosyaları memory-map ile açar; böylece sezon
+# filtresi sıfır kopyalı bir dilimdir. Dashboard süreçleri de aynı işletim
+# sistemi sayfa cache'ini paylaşır.
+import json
+import os
+import sqlite3
+import time
+
+import pyarrow as pa
+
+from configs.config import DATABASE_PATH, SNAPSHOT_PATH
+from src.database.queries import run_query, read_query
+from src.utils.data_version import get_data_version, read_only_uri
+
+MANIFEST_FILE = 'manifest.json'
+
+# Snapshot tabloları; her biri aynı adlı dashboard sorgusunun (src/database/queries.py) sonucudur
+SNAPSHOT_TABLES = ['standings', 'matches', 'team_stats']
+
+
+def _write_table(table, path):
+    """Tabloyu sıkıştırmasız Arrow IPC dosyası olarak yaz (memory-map için)"""
+    tmp_path = f'{path}.tmp'
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def publish_snapshot(db_path=DATABASE_PATH, snapshot_dir=SNAPSHOT_PATH):
+    """Veritabanının şu anki sürümü için snapshot üret; manifest en son yazılır"""
+    start = time.perf_counter()
+    data_version = get_data_version(db_path)
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    manifest = {'data_version': data_version, 'tables': {}}
+    conn = sqlite3.connect(read_only_uri(db_path), uri=True)
+    try:
+        season_ids = [row[0] for row in run_query(conn, 'season_ids')[1]]
+
+        for name in SNAPSHOT_TABLES:
+            # Dashboard ile birebir aynı sonuç için sezon başına aynı sorgu çalıştırılır
+            tables, seasons, offset = [], {}, 0
+            for season_id in season_ids:
+                df = read_query(conn, name, season_id=season_id)
+                seasons[str(season_id)] = [offset, len(df)]
+                offset += len(df)
+                tables.append(pa.Table.from_pandas(df, preserve_index=False))
+
+            if not tables:
+                continue
+
+            # Bir sezonda tamamen boş olan kolonlar null tipindedir; ortak tipe yükseltilir
+            table = pa.concat_tables(tables, promote_options='permissive')
+            filename = f'{name}-{data_version}.arrow'
+            _write_table(table, os.path.join(snapshot_dir, filename))
+            manifest['tables'][name] = {'file': filename, 'seasons': seasons}
+    finally:
+        conn.close()
+
+    manifest_path = os.path.join(snapshot_dir, MANIFEST_FILE)
+    with open(f'{manifest_path}.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
+    os.replace(f'{manifest_path}.tmp', manifest_path)
+
+    # Eski sürümlerin dosyaları silinir; açık memory-map'ler silinen dosyayı okumaya devam eder
+    current = {info['file'] for info in manifest['tables'].values()}
+    for filename in os.listdir(snapshot_dir):
+        if filename.endswith('.arrow') and filename not in current:
+            os.remove(os.path.join(snapshot_dir, filename))
+
+    print(f"📦 Snapshot yayınlandı: {snapshot_dir} ({len(season_ids)} sezon, {time.perf_counter() - start:.2f} sn)")
+    return manifest
+
+
+class Snapshot:
+    def __init__(self, snapshot_dir, manifest):
+        self.data_version = manifest['data_version']
+        self.tables = {}
+        self.seasons = {}
+
+        for name, info in manifest['tables'].items():
+            source = pa.memory_map(os.path.join(snapshot_dir, info['file']), 'r')
+            self.tables[name] = pa.ipc.open_file(source).read_all()
+            self.seasons[name] = info['seasons']
+
+    def season_table(self, name, season_id):
+        """Sezonun satırları (sıfır kopyalı dilim)"""
+        offset, length = self.seasons[name].get(str(season_id), (0, 0))
+        return self.tables[name].slice(offset, length)
+
+    def season_frame(self, name, season_id):
+        """Sezonun satırları pandas DataFrame olarak"""
+        return self.season_table(name, season_id).to_pandas()
+
+
+def open_snapshot(snapshot_dir=SNAPSHOT_PATH, data_version=None):
+    """Snapshot'ı aç; yoksa ya da veri sürümü verilen sürümle uyuşmuyorsa None"""
+    try:
+        with open(os.path.join(snapshot_dir, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if data_version is not None and manifest['data_version'] != data_version:
+        return None
+
+    try:
+        return Snapshot(snapshot_dir, manifest)
+    except (FileNotFoundError, pa.ArrowInvalid):
+        # Manifest okunduktan sonra yeni bir yayın eski dosyaları silmiş olabilir
+        return None
+
+# Test
+if __name__ == "__main__":
+    publish_snapshot()
+
+    start = time.perf_counter()
+    snapshot = open_snapshot(data_version=get_data_version(DATABASE_PATH))
+    print(f"⏱️ Snapshot açılış süresi: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for name, table in snapshot.tables.items():
+        print(f"  - {name}: {table.num_rows} satır, {len(snapshot.seasons[name])} sezon")
@@ -0,0 +1,281 @@
+# src/models/poisson_model.py
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from scipy.stats import poisson
+
+from configs.config import DATABASE_PATH, UPCOMING_STATUSES
+
+# Zaman ağırlığı (gün başına); ~1 yıllık yarı ömür
+DEFAULT_XI = 0.0019
+
+# Skor matrisinin üst sınırı (0..MAX_GOALS gol)
+MAX_GOALS = 10
+
+
+def _dixon_coles_nll(params, home_idx, away_idx, home_goals, away_goals, weights, n_teams):
+    """Ağırlıklı Dixon-Coles negatif log-olabilirliği ve analitik gradyanı"""
+    attack = params[:n_teams]
+    defence = params[n_teams:2 * n_teams]
+    home_adv, intercept, rho = params[2 * n_teams:]
+
+    log_lam = intercept + home_adv + attack[home_idx] - defence[away_idx]
+    log_mu = intercept + attack[away_idx] - defence[home_idx]
+    lam = np.exp(log_lam)
+    mu = np.exp(log_mu)
+
+    # Poisson kısmı (log x! sabit olduğu için atlanır)
+    loglik = weights * (home_goals * log_lam - lam + away_goals * log_mu - mu)
+    g_log_lam = weights * (home_goals - lam)
+    g_log_mu = weights * (away_goals - mu)
+
+    # Düşük skor düzeltmesi (tau)
+    s00 = (home_goals == 0) & (away_goals == 0)
+    s01 = (home_goals == 0) & (away_goals == 1)
+    s10 = (home_goals == 1) & (away_goals == 0)
+    s11 = (home_goals == 1) & (away_goals == 1)
+
+    tau = np.ones_like(lam)
+    tau[s00] = 1 - lam[s00] * mu[s00] * rho
+    tau[s01] = 1 + lam[s01] * rho
+    tau[s10] = 1 + mu[s10] * rho
+    tau[s11] = 1 - rho
+    tau = np.maximum(tau, 1e-10)
+    loglik = loglik + weights * np.log(tau)
+
+    g_rho = np.zeros_like(lam)
+    g_rho[s00] = -lam[s00] * mu[s00] / tau[s00]
+    g_rho[s01] = lam[s01] / tau[s01]
+    g_rho[s10] = mu[s10] / tau[s10]
+    g_rho[s11] = -1 / tau[s11]
+
+    g_log_lam[s00] += weights[s00] * -lam[s00] * mu[s00] * rho / tau[s00]
+    g_log_mu[s00] += weights[s00] * -lam[s00] * mu[s00] * rho / tau[s00]
+    g_log_lam[s01] += weights[s01] * lam[s01] * rho / tau[s01]
+    g_log_mu[s10] += weights[s10] * mu[s10] * rho / tau[s10]
+
+    grad = np.empty_like(params)
+    grad[:n_teams] = (np.bincount(home_idx, weights=g_log_lam, minlength=n_teams)
+                      + np.bincount(away_idx, weights=g_log_mu, minlength=n_teams))
+    grad[n_teams:2 * n_teams] = -(np.bincount(away_idx, weights=g_log_lam, minlength=n_teams)
+                                  + np.bincount(home_idx, weights=g_log_mu, minlength=n_teams))
+    grad[2 * n_teams] = g_log_lam.sum()
+    grad[2 * n_teams + 1] = g_log_lam.sum() + g_log_mu.sum()
+    grad[2 * n_teams + 2] = (weights * g_rho).sum()
+
+    # Hücum katsayılarının toplamı sıfır olmalı (tanımlanabilirlik cezası)
+    attack_sum = attack.sum()
+    nll = -loglik.sum() + attack_sum ** 2
+    grad = -grad
+    grad[:n_teams] += 2 * attack_sum
+
+    return nll, grad
+
+
+class PoissonGoalModel:
+    def __init__(self, db_path=DATABASE_PATH, xi=DEFAULT_XI, max_goals=MAX_GOALS):
+        self.db_path = db_path
+        self.xi = xi
+        self.max_goals = max_goals
+        # competition_code -> {'team_ids', 'attack', 'defence', 'home_adv', 'intercept', 'rho'}
+        self.params = {}
+
+    def load_matches(self, competition_code=None):
+        """Oynanmış maçları lig kodu ile birlikte yükle"""
+        query = """
+            SELECT s.competition_code, m.match_date, m.home_team_id, m.away_team_id,
+                   m.home_score, m.away_score
+            FROM matches m
+            JOIN seasons s ON m.season_id = s.season_id
+            WHERE m.status = 'FINISHED'
+        """
+        params = ()
+        if competition_code:
+            query += " AND s.competition_code = ?"
+            params = (competition_code,)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return pd.read_sql_query(query, conn, params=params)
+        finally:
+            conn.close()
+
+    def load_fixtures(self, competition_code=None, season_id=None):
+        """Oynanmamış maçları yükle
+
+        Yalnızca SCHEDULED/TIMED maçlar alınır (ertelenen, iptal edilen maçlar hariç);
+        season_id verilmezse her ligin en güncel sezonu kullanılır.
+        """
+        placeholders = ', '.join('?' * len(UPCOMING_STATUSES))
+        query = f"""
+            SELECT m.match_id, s.competition_code, m.match_date, m.matchday,
+                   m.home_team_id, m.away_team_id
+            FROM matches m
+            JOIN seasons s ON m.season_id = s.season_id
+            WHERE m.status IN ({placeholders})
+        """
+        params = list(UPCOMING_STATUSES)
+        if season_id is not None:
+            query += " AND m.season_id = ?"
+            params.append(season_id)
+        else:
+            query += """ AND s.season_year = (SELECT MAX(latest.season_year) FROM seasons latest
+                                              WHERE latest.competition_code = s.competition_code)"""
+        if competition_code:
+            query += " AND s.competition_code = ?"
+            params.append(competition_code)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return pd.read_sql_query(query, conn, params=params)
+        finally:
+            conn.close()
+
+    def _initial_params(self, competition_code, team_ids, warm_start):
+        """Başlangıç parametreleri; warm start'ta önceki fit'ten devral"""
+        n_teams = len(team_ids)
+        x0 = np.zeros(2 * n_teams + 3)
+        x0[2 * n_teams:] = [0.25, 0.1, -0.05]
+
+        previous = self.params.get(competition_code) if warm_start else None
+        if previous is not None:
+            pos = np.searchsorted(previous['team_ids'], team_ids)
+            pos = np.clip(pos, 0, len(previous['team_ids']) - 1)
+            known = previous['team_ids'][pos] == team_ids
+            x0[:n_teams][known] = previous['attack'][pos[known]]
+            x0[n_teams:2 * n_teams][known] = previous['defence'][pos[known]]
+            x0[2 * n_teams:] = [previous['home_adv'], previous['intercept'], previous['rho']]
+
+        return x0
+
+    def fit(self, matches_df, competition_code, warm_start=True):
+        """Tek bir lig için hücum/savunma katsayılarını fit et"""
+        matches_df = matches_df.dropna(subset=['home_score', 'away_score'])
+        team_ids = np.unique(np.concatenate([matches_df['home_team_id'].to_numpy(),
+                                             matches_df['away_team_id'].to_numpy()]))
+        n_teams = len(team_ids)
+
+        home_idx = np.searchsorted(team_ids, matches_df['home_team_id'].to_numpy())
+        away_idx = np.searchsorted(team_ids, matches_df['away_team_id'].to_numpy())
+        home_goals = matches_df['home_score'].to_numpy(dtype=np.float64)
+        away_goals = matches_df['away_score'].to_numpy(dtype=np.float64)
+
+        # Yakın tarihli maçlar daha ağır basar
+        dates = pd.to_datetime(matches_df['match_date'])
+        days_ago = (dates.max() - dates).dt.days.to_numpy(dtype=np.float64)
+        weights = np.exp(-self.xi * days_ago)
+
+        x0 = self._initial_params(competition_code, team_ids, warm_start)
+        bounds = [(None, None)] * (2 * n_teams + 2) + [(-0.3, 0.3)]
+
+        result = minimize(_dixon_coles_nll, x0, jac=True, method='L-BFGS-B', bounds=bounds,
+                          args=(home_idx, away_idx, home_goals, away_goals, weights, n_teams))
+
+        if not result.success:
+            print(f"⚠️ Uyarı: {competition_code} fit'i yakınsamadı ({result.message})")
+
+        self.params[competition_code] = {
+            'team_ids': team_ids,
+            'attack': result.x[:n_teams],
+            'defence': result.x[n_teams:2 * n_teams],
+            'home_adv': result.x[2 * n_teams],
+            'intercept': result.x[2 * n_teams + 1],
+            'rho': result.x[2 * n_teams + 2],
+        }
+
+        print(f"✅ {competition_code}: {len(matches_df)} maç, {n_teams} takım fit edildi ({result.nit} iterasyon)")
+        return self.params[competition_code]
+
+    def fit_all(self, warm_start=True):
+        """Veritabanındaki tüm ligleri fit et"""
+        matches_df = self.load_matches()
+        for competition_code, league_df in matches_df.groupby('competition_code'):
+            self.fit(league_df, competition_code, warm_start=warm_start)
+        return self.params
+
+    def expected_goals(self, competition_code, home_team_ids, away_team_ids):
+        """Ev sahibi ve deplasman beklenen gol sayıları (bilinmeyen takım = ortalama)"""
+        p = self.params[competition_code]
+        team_ids = p['team_ids']
+
+        def lookup(ids, values):
+            ids = np.asarray(ids)
+            pos = np.clip(np.searchsorted(team_ids, ids), 0, len(team_ids) - 1)
+            return np.where(team_ids[pos] == ids, values[pos], 0.0)
+
+        home_att = lookup(home_team_ids, p['attack'])
+        home_def = lookup(home_team_ids, p['defence'])
+        away_att = lookup(away_team_ids, p['attack'])
+        away_def = lookup(away_team_ids, p['defence'])
+
+        lam = np.exp(p['intercept'] + p['home_adv'] + home_att - away_def)
+        mu = np.exp(p['intercept'] + away_att - home_def)
+        return lam, mu
+
+    def score_matrices(self, lam, mu, rho):
+        """Maç başına (ev golü x deplasman golü) olasılık matrisleri"""
+        goals = np.arange(self.max_goals + 1)
+        home_pmf = poisson.pmf(goals[None, :], lam[:, None])
+        away_pmf = poisson.pmf(goals[None, :], mu[:, None])
+        matrices = home_pmf[:, :, None] * away_pmf[:, None, :]
+
+        # Dixon-Coles düşük skor düzeltmesi
+        matrices[:, 0, 0] *= 1 - lam * mu * rho
+        matrices[:, 0, 1] *= 1 + lam * rho
+        matrices[:, 1, 0] *= 1 + mu * rho
+        matrices[:, 1, 1] *= 1 - rho
+
+        return matrices / matrices.sum(axis=(1, 2), keepdims=True)
+
+    def predict(self, fixtures_df):
+        """Tüm fikstürü tek seferde skorla: 1X2 olasılıkları ve skor matrisleri
+
+        Fit edilmiş modeli olmayan liglerin maçlarında olasılık kolonları ve skor
+        matrisleri NaN'dır.
+        """
+        results = []
+        matrices = np.full((len(fixtures_df), self.max_goals + 1, self.max_goals + 1), np.nan)
+        positions = np.arange(len(fixtures_df))
+
+        for competition_code, group_pos in fixtures_df.groupby('competition_code').indices.items():
+            if competition_code not in self.params:
+                print(f"⚠️ Uyarı: {competition_code} için fit edilmiş model yok")
+                continue
+
+            group = fixtures_df.iloc[group_pos]
+            lam, mu = self.expected_goals(competition_code, group['home_team_id'], group['away_team_id'])
+            group_matrices = self.score_matrices(lam, mu, self.params[competition_code]['rho'])
+            matrices[positions[group_pos]] = group_matrices
+
+            results.append(pd.DataFrame({
+                'home_xg': lam,
+                'away_xg': mu,
+                'home_win': np.tril(group_matrices, -1).sum(axis=(1, 2)),
+                'draw': np.trace(group_matrices, axis1=1, axis2=2),
+                'away_win': np.triu(group_matrices, 1).sum(axis=(1, 2)),
+            }, index=group.index))
+
+        columns = ['home_xg', 'away_xg', 'home_win', 'draw', 'away_win']
+        predictions = fixtures_df.join(pd.concat(results) if results else pd.DataFrame(columns=columns, dtype=float))
+
+        return predictions, matrices
+
+    def predict_upcoming(self, competition_code=None, season_id=None):
+        """Güncel sezonların (ya da verilen sezonun) oynanmamış maçlarını skorla"""
+        return self.predict(self.load_fixtures(competition_code, season_id))
+
+# Test
+if __name__ == "__main__":
+    model = PoissonGoalModel()
+
+    start = time.perf_counter()
+    model.fit_all()
+    print(f"⏱️ Fit süresi: {time.perf_counter() - start:.2f} sn")
+
+    predictions, _ = model.predict_upcoming()
+    print("\n🔮 Yaklaşan maç tahminleri:")
+    print(predictions[['match_date', 'home_team_id', 'away_team_id',
+                       'home_xg', 'away_xg', 'home_win', 'draw', 'away_win']].head(10))
@@ -0,0 +1,206 @@
+# src/models/season_simulator.py
+import sqlite3
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from configs.config import DATABASE_PATH
+from src.utils.data_version import get_data_version
+
+# Bir worker'ın tek seferde simüle ettiği sezon sayısı (bellek kullanımını sınırlar)
+CHUNK_SIZE = 10_000
+
+# Az maç oynamış takımların güçlerini lig ortalamasına çeken sahte maç sayısı
+PRIOR_GAMES = 5
+
+
+def _simulate_chunk(seed, n_simulations, lam_home, lam_away, home_idx, away_idx,
+                    base_points, base_gd, base_gf):
+    """Bir grup sezonu simüle et, takım x sıra sayım matrisini döndür"""
+    rng = np.random.default_rng(seed)
+    n_teams = len(base_points)
+    n_fixtures = len(home_idx)
+
+    # Maç -> takım one-hot matrisleri; puan toplama tek bir matris çarpımı olur
+    home_onehot = np.zeros((n_fixtures, n_teams), dtype=np.float32)
+    away_onehot = np.zeros((n_fixtures, n_teams), dtype=np.float32)
+    home_onehot[np.arange(n_fixtures), home_idx] = 1
+    away_onehot[np.arange(n_fixtures), away_idx] = 1
+
+    home_goals = rng.poisson(lam_home, size=(n_simulations, n_fixtures)).astype(np.float32)
+    away_goals = rng.poisson(lam_away, size=(n_simulations, n_fixtures)).astype(np.float32)
+
+    home_points = np.where(home_goals > away_goals, 3, np.where(home_goals == away_goals, 1, 0)).astype(np.float32)
+    away_points = np.where(away_goals > home_goals, 3, np.where(home_goals == away_goals, 1, 0)).astype(np.float32)
+
+    points = base_points + home_points @ home_onehot + away_points @ away_onehot
+    goal_diff = base_gd + (home_goals - away_goals) @ (home_onehot - away_onehot)
+    goals_for = base_gf + home_goals @ home_onehot + away_goals @ away_onehot
+
+    # Sıralama: puan > averaj > atılan gol > rastgele (kura)
+    sort_key = (points.astype(np.float64) * 1e6
+                + (goal_diff.astype(np.float64) + 500) * 1e3
+                + goals_for
+                + rng.random((n_simulations, n_teams)) * 0.5)
+    order = np.argsort(-sort_key, axis=1)
+
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(n_teams)[None, :], axis=1)
+
+    flat = (np.arange(n_teams)[None, :] * n_teams + ranks).ravel()
+    position_counts = np.bincount(flat, minlength=n_teams * n_teams).reshape(n_teams, n_teams)
+
+    return position_counts, points.sum(axis=0, dtype=np.float64)
+
+
+class SeasonSimulator:
+    def __init__(self, db_path=DATABASE_PATH, n_jobs=None):
+        self.db_path = db_path
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self._cache = {}
+
+    def _latest_season_id(self, conn):
+        """En son yüklenen sezonun ID'si"""
+        row = conn.execute("SELECT MAX(season_id) FROM matches").fetchone()
+        return row[0]
+
+    def load_season(self, season_id=None):
+        """Sezonun oynanmış ve kalan maçlarını yükle"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            if season_id is None:
+                season_id = self._latest_season_id(conn)
+
+            matches_df = pd.read_sql_query("""
+                SELECT match_id, home_team_id, away_team_id, home_score, away_score, status
+                FROM matches
+                WHERE season_id = ?
+            """, conn, params=(season_id,))
+
+            teams_df = pd.read_sql_query("""
+                SELECT team_id, team_name FROM teams
+                WHERE team_id IN (
+                    SELECT home_team_id FROM matches WHERE season_id = ?
+                    UNION
+                    SELECT away_team_id FROM matches WHERE season_id = ?
+                )
+            """, conn, params=(season_id, season_id))
+        finally:
+            conn.close()
+
+        return season_id, matches_df, teams_df
+
+    def _team_strengths(self, finished, team_ids):
+        """Ev/deplasman hücum ve savunma katsayılarını hesapla (vektörel)"""
+        n_teams = len(team_ids)
+        home_idx = np.searchsorted(team_ids, finished['home_team_id'].to_numpy())
+        away_idx = np.searchsorted(team_ids, finished['away_team_id'].to_numpy())
+        home_goals = finished['home_score'].to_numpy(dtype=np.float64)
+        away_goals = finished['away_score'].to_numpy(dtype=np.float64)
+
+        home_avg = home_goals.mean() if len(finished) else 1.5
+        away_avg = away_goals.mean() if len(finished) else 1.2
+
+        home_games = np.bincount(home_idx, minlength=n_teams) + PRIOR_GAMES
+        away_games = np.bincount(away_idx, minlength=n_teams) + PRIOR_GAMES
+
+        def rate(idx, goals, games, avg):
+            return (np.bincount(idx, weights=goals, minlength=n_teams) + PRIOR_GAMES * avg) / games / avg
+
+        return {
+            'home_avg': home_avg,
+            'away_avg': away_avg,
+            'attack_home': rate(home_idx, home_goals, home_games, home_avg),
+            'defence_home': rate(home_idx, away_goals, home_games, away_avg),
+            'attack_away': rate(away_idx, away_goals, away_games, away_avg),
+            'defence_away': rate(away_idx, home_goals, away_games, home_avg),
+        }
+
+    def simulate(self, season_id=None, n_simulations=100_000, seed=None, top_n=4, relegation_n=3):
+        """Kalan fikstürü simüle et ve takım bazlı olasılıkları döndür"""
+        cache_key = (get_data_version(self.db_path), season_id, n_simulations, seed, top_n, relegation_n)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        season_id, matches_df, teams_df = self.load_season(season_id)
+
+        team_ids = np.unique(np.concatenate([matches_df['home_team_id'].to_numpy(),
+                                             matches_df['away_team_id'].to_numpy()]))
+        n_teams = len(team_ids)
+
+        finished = matches_df[(matches_df['status'] == 'FINISHED')
+                              & matches_df['home_score'].notna()
+                              & matches_df['away_score'].notna()]
+        remaining = matches_df.drop(finished.index)
+
+        # Mevcut puan tablosu (oynanmış maçlardan)
+        home_idx = np.searchsorted(team_ids, finished['home_team_id'].to_numpy())
+        away_idx = np.searchsorted(team_ids, finished['away_team_id'].to_numpy())
+        home_goals = finished['home_score'].to_numpy(dtype=np.float64)
+        away_goals = finished['away_score'].to_numpy(dtype=np.float64)
+        home_pts = np.where(home_goals > away_goals, 3, np.where(home_goals == away_goals, 1, 0))
+        away_pts = np.where(away_goals > home_goals, 3, np.where(home_goals == away_goals, 1, 0))
+
+        base_points = (np.bincount(home_idx, weights=home_pts, minlength=n_teams)
+                       + np.bincount(away_idx, weights=away_pts, minlength=n_teams)).astype(np.float32)
+        base_gd = (np.bincount(home_idx, weights=home_goals - away_goals, minlength=n_teams)
+                   + np.bincount(away_idx, weights=away_goals - home_goals, minlength=n_teams)).astype(np.float32)
+        base_gf = (np.bincount(home_idx, weights=home_goals, minlength=n_teams)
+                   + np.bincount(away_idx, weights=away_goals, minlength=n_teams)).astype(np.float32)
+
+        # Kalan maçlar için beklenen gol sayıları
+        strengths = self._team_strengths(finished, team_ids)
+        rem_home = np.searchsorted(team_ids, remaining['home_team_id'].to_numpy())
+        rem_away = np.searchsorted(team_ids, remaining['away_team_id'].to_numpy())
+        lam_home = strengths['home_avg'] * strengths['attack_home'][rem_home] * strengths['defence_away'][rem_away]
+        lam_away = strengths['away_avg'] * strengths['attack_away'][rem_away] * strengths['defence_home'][rem_home]
+
+        # Simülasyonları parçalara böl; her parça bağımsız bir tohum alır
+        chunk_sizes = [CHUNK_SIZE] * (n_simulations // CHUNK_SIZE)
+        if n_simulations % CHUNK_SIZE:
+            chunk_sizes.append(n_simulations % CHUNK_SIZE)
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+        args = [(s, size, lam_home, lam_away, rem_home, rem_away, base_points, base_gd, base_gf)
+                for s, size in zip(seeds, chunk_sizes)]
+
+        if self.n_jobs > 1 and len(args) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, len(args))) as executor:
+                results = list(executor.map(_simulate_chunk, *zip(*args)))
+        else:
+            results = [_simulate_chunk(*a) for a in args]
+
+        position_counts = sum(r[0] for r in results)
+        total_points = sum(r[1] for r in results)
+
+        position_probs = position_counts / n_simulations
+        result_df = pd.DataFrame(position_probs, columns=[f'pos_{i + 1}' for i in range(n_teams)])
+        result_df.insert(0, 'team_id', team_ids)
+        result_df.insert(1, 'team_name', result_df['team_id'].map(teams_df.set_index('team_id')['team_name']))
+        result_df.insert(2, 'current_points', base_points.astype(int))
+        result_df.insert(3, 'expected_points', (total_points / n_simulations).round(2))
+        result_df.insert(4, 'title_prob', position_probs[:, 0])
+        result_df.insert(5, f'top{top_n}_prob', position_probs[:, :top_n].sum(axis=1))
+        result_df.insert(6, 'relegation_prob', position_probs[:, n_teams - relegation_n:].sum(axis=1))
+        result_df['season_id'] = season_id
+        result_df = result_df.sort_values('expected_points', ascending=False).reset_index(drop=True)
+
+        print(f"✅ {n_simulations:,} sezon simüle edildi ({len(remaining)} kalan maç, {n_teams} takım)")
+
+        self._cache[cache_key] = result_df
+        return result_df
+
+# Test
+if __name__ == "__main__":
+    import time
+
+    simulator = SeasonSimulator()
+
+    start = time.perf_counter()
+    probs = simulator.simulate(n_simulations=100_000, seed=42)
+    print(f"⏱️ Süre: {time.perf_counter() - start:.2f} sn")
+
+    print("\n🎲 Sezon sonu olasılıkları:")
+    print(probs[['team_name', 'current_points', 'expected_points', 'title_prob', 'top4_prob', 'relegation_prob']])
@@ -0,0 +1,338 @@
+# src/pipeline/backfill.py
+# Geçmiş sezonları kaldığı yerden devam edebilen şekilde doldurur.
+# Her (lig, sezon, veri türü) bir iş birimidir ve durumu checkpoint
+# veritabanında tutulur. İndirme ana thread'de sırayla yapılır; bir lig-sezonun
+# tüm birimleri indirildiğinde dönüştürme ve yükleme ayrı bir thread'de
+# başlar, bu sırada sonraki birimlerin indirilmesi devam eder.
+# requests ve pandas yalnızca backfill çalışırken yüklenir; --status ve
+# parse_seasons kullanan komutlar bunları beklemez.
+import argparse
+import os
+import queue
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from configs.config import (LEAGUES, SEASONS, DATABASE_PATH, CHECKPOINT_PATH, SNAPSHOT_PATH, REQUEST_DELAY,
+                            API_BASE_URL, ENDPOINTS, ENDPOINT_PARAMS)
+
+# Birim durumları: pending -> downloaded -> loaded; kalıcı hatalar failed olur
+PENDING, DOWNLOADED, LOADED, FAILED = 'pending', 'downloaded', 'loaded', 'failed'
+
+# Tekrar denenebilir HTTP hataları (kota aşımı ve sunucu hataları)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+MAX_RETRIES = 5
+BACKOFF_BASE = 2.0   # saniye
+BACKOFF_CAP = 300.0  # saniye
+
+CHECKPOINT_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS backfill_units (
+        competition_code VARCHAR(10) NOT NULL,
+        season INTEGER NOT NULL,
+        endpoint VARCHAR(20) NOT NULL,
+        status VARCHAR(20) NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        raw_file VARCHAR(255),
+        last_error TEXT,
+        updated_at TIMESTAMP,
+        PRIMARY KEY (competition_code, season, endpoint)
+    )
+"""
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Üstel bekleme süresi (full jitter): [0, min(cap, base * 2^attempt)]"""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def retry_after(response):
+    """Sunucunun önerdiği bekleme süresi (Retry-After ya da football-data kota sıfırlama başlığı)"""
+    if response is None:
+        return None
+    for header in ('Retry-After', 'X-RequestCounter-Reset'):
+        value = response.headers.get(header)
+        if value and value.isdigit():
+            return int(value)
+    return None
+
+
+class CheckpointStore:
+    """İş birimlerinin durumunu tutan küçük sqlite veritabanı; indirme ve yükleme thread'leri paylaşır"""
+    def __init__(self, path=CHECKPOINT_PATH):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(CHECKPOINT_SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.conn.close()
+
+    def plan(self, competitions, seasons, endpoints):
+        """Tüm birimleri ekle (mevcut birimlerin durumu korunur); planlanan birimleri sırayla döndür"""
+        units = [(code, season, endpoint) for code in competitions for season in seasons for endpoint in endpoints]
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO backfill_units (competition_code, season, endpoint) VALUES (?, ?, ?)", units)
+            self.conn.commit()
+        return units
+
+    def get(self, code, season, endpoint):
+        """Birimin (durum, deneme sayısı, ham dosya)"""
+        with self._lock:
+            return self.conn.execute("""
+                SELECT status, attempts, raw_file FROM backfill_units
+                WHERE competition_code = ? AND season = ? AND endpoint = ?
+            """, (code, season, endpoint)).fetchone()
+
+    def update(self, code, season, endpoint, status, raw_file=None, error=None, attempted=False):
+        """Birimin durumunu kaydet; her güncelleme hemen commit edilir"""
+        with self._lock:
+            self.conn.execute("""
+                UPDATE backfill_units SET
+                    status = ?,
+                    attempts = attempts + ?,
+                    raw_file = COALESCE(?, raw_file),
+                    last_error = ?,
+                    updated_at = ?
+                WHERE competition_code = ? AND season = ? AND endpoint = ?
+            """, (status, int(attempted), raw_file, error, datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                  code, season, endpoint))
+            self.conn.commit()
+
+    def summary(self):
+        """Durum başına birim sayısı"""
+        with self._lock:
+            return dict(self.conn.execute("SELECT status, COUNT(*) FROM backfill_units GROUP BY status"))
+
+    def errors(self):
+        """Hata mesajı olan birimler"""
+        with self._lock:
+            return self.conn.execute("""
+                SELECT competition_code, season, endpoint, status, attempts, last_error FROM backfill_units
+                WHERE last_error IS NOT NULL ORDER BY competition_code, season, endpoint
+            """).fetchall()
+
+
+class Backfill:
+    def __init__(self, competitions, seasons, endpoints=tuple(ENDPOINTS), db_path=DATABASE_PATH,
+                 checkpoint_path=CHECKPOINT_PATH, max_retries=MAX_RETRIES, request_delay=REQUEST_DELAY,
+                 extractor=None, snapshot_dir=SNAPSHOT_PATH):
+        self.competitions = list(competitions)
+        self.seasons = list(seasons)
+        self.endpoints = list(endpoints)
+        self.db_path = db_path
+        self.snapshot_dir = snapshot_dir
+        self.max_retries = max_retries
+        self.request_delay = request_delay
+        self.store = CheckpointStore(checkpoint_path)
+        # Farklı sunucu ya da ham veri klasörü için hazır bir extractor verilebilir (ör. mock sunucu)
+        if extractor is None:
+            from src.extractors.football_data_extractor import FootballDataExtractor
+            extractor = FootballDataExtractor()
+        self.extractor = extractor
+        self._loads = queue.Queue()
+        self._last_request = 0.0
+
+    def _wait_turn(self):
+        """İstekler arasında en az request_delay saniye bırak (kota koruması)"""
+        wait = self._last_request + self.request_delay - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request = time.monotonic()
+
+    def _download(self, code, season, endpoint):
+        """Birimi indir; geçici hatalarda üstel bekleme ile tekrar dene. Başarılıysa True"""
+        from requests.exceptions import RequestException
+
+        for attempt in range(self.max_retries + 1):
+            self._wait_turn()
+            try:
+                _, raw_file = self.extractor.fetch(code, endpoint, season, **ENDPOINT_PARAMS.get(endpoint, {}))
+            except RequestException as e:
+                response = getattr(e, 'response', None)
+                status = response.status_code if response is not None else None
+
+                if status is not None and status not in RETRYABLE_STATUS:
+                    # 4xx (ör. ücretsiz planda olmayan sezon): tekrar denemek kota harcar
+                    self.store.update(code, season, endpoint, FAILED, error=str(e), attempted=True)
+                    print(f"❌ Hata: {code} {season} {endpoint} kalıcı hata: {e}")
+                    return False
+
+                self.store.update(code, season, endpoint, PENDING, error=str(e), attempted=True)
+                if attempt == self.max_retries:
+                    break
+
+                delay = retry_after(response) or backoff_delay(attempt)
+                print(f"⚠️ Uyarı: {code} {season} {endpoint} başarısız ({e}); {delay:.1f} sn sonra tekrar denenecek")
+                time.sleep(delay)
+                continue
+
+            self.store.update(code, season, endpoint, DOWNLOADED, raw_file=raw_file, attempted=True)
+            return True
+
+        print(f"❌ Hata: {code} {season} {endpoint} {self.max_retries + 1} denemede indirilemedi; "
+              f"sonraki çalıştırmada tekrar denenecek")
+        return False
+
+    def _load_worker(self):
+        """Kuyruktaki lig-sezonları dönüştürüp staging veritabanına yükle (ayrı thread, kendi bağlantısıyla)
+        
+        Okuyucular backfill bitene kadar önceki sürümü görür. Birimler ancak yayından sonra
+        'loaded' olur; süreç yayından önce kesilirse sonraki çalıştırma bunları tekrar yükler.
+        """
+        from src.transformers.football_data_transformer import FootballDataTransformer
+        from src.loaders.database_loader import DatabaseLoader
+
+        transformer = FootballDataTransformer()
+        loader = DatabaseLoader(self.db_path, staging=True)
+        loader.connect()
+        loader.create_tables()
+
+        loaded = []
+        try:
+            while True:
+                item = self._loads.get()
+                if item is None:
+                    break
+
+                code, season, files = item
+                try:
+                    # Lig-sezon tek transaction'da yüklenir; hata olursa hiçbir tablosu staging'de kalmaz
+                    with loader.transaction():
+                        self._load_group(transformer, loader, files)
+                except Exception as e:
+                    # Birimler 'downloaded' kalır; sonraki çalıştırma yüklemeyi tekrar dener
+                    for endpoint in files:
+                        self.store.update(code, season, endpoint, DOWNLOADED, error=f"yükleme: {e}")
+                    print(f"❌ Hata: {code} {season} yüklenemedi: {e}")
+                    continue
+
+                loaded.append((code, season, files))
+                print(f"✅ {code} {season} staging'e yüklendi")
+
+            if loaded:
+                try:
+                    loader.publish(self.snapshot_dir)
+                except RuntimeError as e:
+                    print(f"❌ Hata: {e}; birimler sonraki çalıştırmada tekrar yüklenecek")
+                    return
+                for code, season, files in loaded:
+                    for endpoint in files:
+                        self.store.update(code, season, endpoint, LOADED)
+        finally:
+            loader.disconnect()
+
+    @staticmethod
+    def _load_group(transformer, loader, files):
+        """Bir lig-sezonun indirilmiş dosyalarını dönüştürüp yükle"""
+        if 'standings' not in files:
+            raise ValueError("puan durumu indirilmedi")
+
+        standings_df = transformer.transform_standings(files['standings'])
+        matches_df = officials_df = None
+        if 'matches' in files:
+            matches_df = transformer.transform_matches(files['matches'])
+            officials_df = transformer.transform_match_officials(files['matches'])
+
+        season_id = loader.load_competition_season(standings_df, matches_df, officials_df, sources=files)
+        if season_id is None:
+            raise ValueError("geçerli puan durumu satırı yok")
+
+        if 'squads' in files or 'scorers' in files:
+            squads_df = transformer.transform_squads(files['squads']) if 'squads' in files else None
+            scorers_df = transformer.transform_scorers(files['scorers']) if 'scorers' in files else None
+            loader.load_competition_players(season_id, squads_df, scorers_df, sources=files)
+
+    def run(self, retry_failed=False):
+        """Planı çalıştır; tamamlanmış birimler atlanır, lig-sezonlar indirildikçe yüklenir"""
+        units = self.store.plan(self.competitions, self.seasons, self.endpoints)
+        print(f"📋 Plan: {len(units)} birim, durum: {self.store.summary()}")
+
+        worker = threading.Thread(target=self._load_worker, name='backfill-loader')
+        worker.start()
+
+        try:
+            for code in self.competitions:
+                for season in self.seasons:
+                    files = {}
+                    for endpoint in self.endpoints:
+                        status, _, raw_file = self.store.get(code, season, endpoint)
+
+                        if status == DOWNLOADED and not (raw_file and os.path.exists(raw_file)):
+                            # Ham dosya silinmişse birim baştan indirilir
+                            status = PENDING
+                        if status in (PENDING, FAILED) and (retry_failed or status == PENDING):
+                            print(f"\n📥 İndiriliyor: {code} {season} {endpoint}")
+                            self._download(code, season, endpoint)
+                            status, _, raw_file = self.store.get(code, season, endpoint)
+
+                        if status == FAILED and endpoint == 'standings':
+                            # Puan durumu olmadan lig-sezon yüklenemez; kalan birimler kota harcamasın
+                            print(f"⚠️ Uyarı: {code} {season} puan durumu alınamadı, lig-sezon atlandı")
+                            break
+                        if status not in (DOWNLOADED, LOADED):
+                            continue
+
+                        files[endpoint] = (status, raw_file)
+
+                    # Yalnızca yeni indirilen ya da yüklemesi yarım kalmış lig-sezonlar kuyruğa girer
+                    if any(status == DOWNLOADED for status, _ in files.values()):
+                        self._loads.put((code, season, {endpoint: raw_file for endpoint, (_, raw_file) in files.items()}))
+        except KeyboardInterrupt:
+            print("\n⚠️ Uyarı: Durduruldu; indirilmiş lig-sezonlar yükleniyor. Aynı komutla kaldığı yerden devam edilir.")
+        finally:
+            self._loads.put(None)
+            worker.join()
+
+            print(f"\n📊 Backfill durumu: {self.store.summary()}")
+            self.store.close()
+
+
+def print_status(checkpoint_path=CHECKPOINT_PATH):
+    """Checkpoint'teki birimlerin durum sayılarını ve hataları göster"""
+    store = CheckpointStore(checkpoint_path)
+    print(f"📊 Backfill durumu: {store.summary()}")
+    for row in store.errors():
+        print("  - " + " | ".join(str(v) for v in row))
+    store.close()
+
+
+def parse_seasons(values):
+    """'2014-2023' ya da '2019 2020' biçimindeki sezonları listeye çevir"""
+    seasons = []
+    for value in values:
+        if '-' in value:
+            first, last = value.split('-')
+            seasons.extend(range(int(first), int(last) + 1))
+        else:
+            seasons.append(int(value))
+    return seasons
+
+# Backfill'i başlat
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Geçmiş sezonları kaldığı yerden devam ederek indir ve yükle")
+    parser.add_argument('--competitions', nargs='+', default=list(LEAGUES), choices=list(LEAGUES))
+    parser.add_argument('--seasons', nargs='+', default=[str(s) for s in SEASONS],
+                        help="Sezon başlangıç yılları ya da aralık (ör. 2014-2023)")
+    parser.add_argument('--endpoints', nargs='+', default=list(ENDPOINTS), choices=list(ENDPOINTS))
+    parser.add_argument('--db', default=DATABASE_PATH)
+    parser.add_argument('--checkpoint', default=CHECKPOINT_PATH)
+    parser.add_argument('--max-retries', type=int, default=MAX_RETRIES)
+    parser.add_argument('--base-url', default=API_BASE_URL,
+                        help="API adresi (ör. src/extractors/mock_server.py için http://127.0.0.1:8090/v4)")
+    parser.add_argument('--retry-failed', action='store_true', help="Kalıcı hata almış birimleri de tekrar dene")
+    parser.add_argument('--status', action='store_true', help="Yalnızca checkpoint durumunu göster")
+    args = parser.parse_args()
+
+    if args.status:
+        print_status(args.checkpoint)
+    else:
+        from src.extractors.football_data_extractor import FootballDataExtractor
+
+        Backfill(args.competitions, parse_seasons(args.seasons), args.endpoints, db_path=args.db,
+                 checkpoint_path=args.checkpoint, max_retries=args.max_retries,
+                 extractor=FootballDataExtractor(base_url=args.base_url)).run(retry_failed=args.retry_failed)
@@ -0,0 +1,279 @@
+# src/transformers/engines.py
+# Dönüştürücünün DataFrame motorları. Ham JSON'dan çıkarılan satırlar (kayıt
+# listesi) motora verilir; tablo kurma, tip dönüşümleri, hesaplanan kolonlar ve
+# CSV/Parquet yazma motorda yapılır. PandasEngine tek thread'de eager çalışır,
+# PolarsEngine her lig-sezon için lazy plan kurar ve planları birlikte, tüm
+# çekirdeklerde çalıştırır. İki motor da SCHEMAS'a uyar ve aynı dosyaları yazar
+# (tests/test_transformer_engines.py). Motor configs/config.py'deki
+# TRANSFORM_ENGINE ile seçilir.
+from datetime import date, time
+
+import pandas as pd
+
+# Ham kolonlar (sıra çıktı sırasıdır): int -> nullable tamsayı (sayı olmayan /
+# küsuratlı değerler boş kalır), str -> olduğu gibi
+SCHEMAS = {
+    'standings': {
+        'position': 'int', 'team_id': 'int', 'team_name': 'str', 'team_short_name': 'str', 'team_tla': 'str',
+        'crest_url': 'str', 'played_games': 'int', 'won': 'int', 'draw': 'int', 'lost': 'int', 'points': 'int',
+        'goals_for': 'int', 'goals_against': 'int', 'goal_difference': 'int', 'form': 'str',
+        'competition_name': 'str', 'competition_code': 'str', 'season_year': 'int', 'season_start': 'str',
+        'season_end': 'str', 'last_updated': 'str',
+    },
+    'matches': {
+        'match_id': 'int', 'competition_name': 'str', 'competition_code': 'str', 'season': 'str',
+        'utc_date': 'str', 'status': 'str', 'matchday': 'int', 'stage': 'str', 'home_team_id': 'int',
+        'home_team_name': 'str', 'home_team_short': 'str', 'away_team_id': 'int', 'away_team_name': 'str',
+        'away_team_short': 'str', 'home_score': 'int', 'away_score': 'int', 'home_score_ht': 'int',
+        'away_score_ht': 'int', 'duration': 'str', 'winner': 'str', 'referees': 'str',
+    },
+    'officials': {
+        'match_id': 'int', 'referee_id': 'int', 'referee_name': 'str', 'role': 'str', 'nationality': 'str',
+    },
+    'squads': {
+        'player_id': 'int', 'player_name': 'str', 'position': 'str', 'date_of_birth': 'str', 'nationality': 'str',
+        'team_id': 'int', 'team_name': 'str', 'competition_code': 'str', 'season_year': 'int',
+    },
+    'scorers': {
+        'player_id': 'int', 'player_name': 'str', 'first_name': 'str', 'last_name': 'str', 'position': 'str',
+        'date_of_birth': 'str', 'nationality': 'str', 'shirt_number': 'int', 'team_id': 'int', 'team_name': 'str',
+        'played_matches': 'int', 'goals': 'int', 'assists': 'int', 'penalties': 'int', 'competition_code': 'str',
+        'season_year': 'int',
+    },
+}
+
+# Hesaplanan kolonlar (ham kolonun tipini değiştirenler dahil)
+DERIVED = {
+    'standings': {
+        'win_percentage': 'float', 'points_per_game': 'float', 'goals_per_game': 'float',
+        'goals_conceded_per_game': 'float', 'form_points': 'int',
+    },
+    'matches': {
+        'utc_date': 'datetime', 'match_date': 'date', 'match_time': 'time', 'match_month': 'int',
+        'match_day_of_week': 'str', 'total_goals': 'int', 'is_draw': 'int', 'is_home_win': 'int',
+        'is_away_win': 'int', 'goal_difference': 'int',
+    },
+    'officials': {},
+    'squads': {},
+    'scorers': {'goals_per_match': 'float'},
+}
+
+# CSV'de tarih/saat biçimi (pandas'ın to_csv çıktısıyla aynı: mikrosaniye yalnızca sıfır değilse yazılır)
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S%:z'
+DATETIME_US_FORMAT = '%Y-%m-%d %H:%M:%S%.6f%:z'
+TIME_FORMAT = '%H:%M:%S'
+TIME_US_FORMAT = '%H:%M:%S%.6f'
+
+
+def _to_int64(values):
+    """Kolonu nullable tamsayıya çevir (sayı olmayan / küsuratlı değerler boş kalır)"""
+    numeric = pd.to_numeric(values, errors='coerce')
+    return numeric.where(numeric % 1 == 0).astype('Int64')
+
+
+def conform(kind, df):
+    """Diskten okunan tabloyu (CSV / Parquet) motorların bellekte verdiği tiplere getir (SCHEMAS + DERIVED)"""
+    types = {**SCHEMAS[kind], **DERIVED[kind]}
+    for col in df.columns:
+        dtype, values = types.get(col), df[col]
+        non_null = values.dropna()
+        if dtype == 'int' and values.dtype != 'Int64':
+            df[col] = _to_int64(values)
+        elif dtype == 'float' and values.dtype != 'float64':
+            df[col] = pd.to_numeric(values, errors='coerce').astype('float64')
+        elif dtype == 'datetime' and not isinstance(values.dtype, pd.DatetimeTZDtype):
+            df[col] = pd.to_datetime(values, errors='coerce', format='ISO8601', utc=True)
+        elif dtype in ('date', 'time') and len(non_null) and isinstance(non_null.iloc[0], str):
+            parse = date.fromisoformat if dtype == 'date' else time.fromisoformat
+            df[col] = values.map(lambda v: parse(v) if isinstance(v, str) else pd.NaT).astype(object)
+        elif dtype == 'str' and non_null.empty and values.dtype != object:
+            # Motorlar tamamen boş metin kolonunu object (None) olarak verir
+            df[col] = pd.Series([None] * len(df), index=df.index, dtype=object)
+    return df
+
+
+class PandasEngine:
+    """Tek thread, eager; her lig-sezon ayrı işlenir"""
+    name = 'pandas'
+
+    def transform(self, kind, records):
+        """Kayıtlardan tabloyu kur ve hesaplanan kolonları ekle"""
+        return next(iter(self.transform_many([(kind, records)])))
+
+    def transform_many(self, jobs):
+        """(tür, kayıtlar) akışı -> tablolar (sırayla); her tablo istendiğinde kurulur"""
+        for kind, records in jobs:
+            df = pd.DataFrame(records, columns=list(SCHEMAS[kind]))
+            for col, dtype in SCHEMAS[kind].items():
+                if dtype == 'int':
+                    df[col] = _to_int64(df[col])
+            yield getattr(self, f"_derive_{kind}", lambda frame: frame)(df)
+
+    @staticmethod
+    def _derive_standings(df):
+        played = df['played_games'].astype('float64')
+        df['win_percentage'] = (df['won'] / played * 100).round(2).astype('float64')
+        df['points_per_game'] = (df['points'] / played).round(2).astype('float64')
+        df['goals_per_game'] = (df['goals_for'] / played).round(2).astype('float64')
+        df['goals_conceded_per_game'] = (df['goals_against'] / played).round(2).astype('float64')
+
+        # Form analizi (son 5 maç); API formu vermiyorsa kolon eklenmez
+        if df['form'].notna().any():
+            df['form_points'] = df['form'].apply(
+                lambda x: sum([3 if c == 'W' else 1 if c == 'D' else 0 for c in str(x)]) if x else 0
+            ).astype('Int64')
+        return df
+
+    @staticmethod
+    def _derive_matches(df):
+        df['utc_date'] = pd.to_datetime(df['utc_date'], errors='coerce', format='ISO8601', utc=True)
+        df['match_date'] = df['utc_date'].dt.date
+        df['match_time'] = df['utc_date'].dt.time
+        df['match_month'] = df['utc_date'].dt.month.astype('Int64')
+        df['match_day_of_week'] = df['utc_date'].dt.day_name()
+
+        # Oynanmamış maçlar da tutulur (sezon simülasyonu kalan fikstüre ihtiyaç duyar);
+        # hesaplanan metrikler yalnızca oynanan maçlar için doldurulur
+        played = df['status'] == 'FINISHED'
+        home_score = df['home_score']
+        away_score = df['away_score']
+        df['total_goals'] = (home_score + away_score).where(played)
+        df['is_draw'] = (home_score == away_score).astype('Int64').where(played)
+        df['is_home_win'] = (home_score > away_score).astype('Int64').where(played)
+        df['is_away_win'] = (home_score < away_score).astype('Int64').where(played)
+        df['goal_difference'] = (home_score - away_score).abs().where(played)
+        return df
+
+    @staticmethod
+    def _derive_scorers(df):
+        played = df['played_matches']
+        df['goals_per_match'] = (df['goals'] / played.where(played > 0)).round(2).astype('float64')
+        return df
+
+    def to_pandas(self, kind, df):
+        return df
+
+    def write_csv(self, df, path):
+        df.to_csv(path, index=False, encoding='utf-8')
+
+    def write_parquet(self, df, path):
+        df.to_parquet(path, index=False)
+
+
+class PolarsEngine:
+    """Lazy plan + çok çekirdek: lig-sezonların planları tek collect_all ile paralel çalışır"""
+    name = 'polars'
+
+    def __init__(self):
+        import polars as pl
+        self.pl = pl
+
+    def transform(self, kind, records):
+        return next(iter(self.transform_many([(kind, records)])))
+
+    def transform_many(self, jobs):
+        """Tüm planları kur, tek collect_all ile birlikte çalıştır (kayıtlar plan kurulunca bırakılır)"""
+        pl = self.pl
+        kinds, plans = [], []
+        for kind, records in jobs:
+            kinds.append(kind)
+            plans.append(getattr(self, f"_derive_{kind}", lambda frame: frame)(self._frame(kind, records)))
+        frames = pl.collect_all(plans)
+
+        # pandas motoruyla aynı: API formu vermiyorsa form_points kolonu yok
+        return [df.drop('form_points') if kind == 'standings' and df['form'].null_count() == len(df) else df
+                for kind, df in zip(kinds, frames)]
+
+    def _frame(self, kind, records):
+        """Kayıtlardan LazyFrame; tipine uymayan değer varsa kolonlar metinden dönüştürülür"""
+        pl = self.pl
+        schema = SCHEMAS[kind]
+        types = {col: pl.Int64 if dtype == 'int' else pl.String for col, dtype in schema.items()}
+        try:
+            return pl.from_dicts(records, schema=types).lazy()
+        except (TypeError, pl.exceptions.PolarsError):
+            frame = pl.from_dicts(records, schema={col: pl.String for col in schema}, strict=False).lazy()
+            numeric = [pl.col(col).cast(pl.Float64, strict=False) for col, dtype in schema.items() if dtype == 'int']
+            frame = frame.with_columns(numeric)
+            return frame.with_columns(pl.when(pl.col(col) % 1 == 0).then(pl.col(col)).cast(pl.Int64)
+                                      for col, dtype in schema.items() if dtype == 'int')
+
+    def _derive_standings(self, lf):
+        pl = self.pl
+        played = pl.col('played_games')
+        return lf.with_columns(
+            (pl.col('won') / played * 100).round(2).fill_nan(None).alias('win_percentage'),
+            (pl.col('points') / played).round(2).fill_nan(None).alias('points_per_game'),
+            (pl.col('goals_for') / played).round(2).fill_nan(None).alias('goals_per_game'),
+            (pl.col('goals_against') / played).round(2).fill_nan(None).alias('goals_conceded_per_game'),
+            (pl.col('form').str.count_matches('W') * 3 + pl.col('form').str.count_matches('D'))
+            .fill_null(0).cast(pl.Int64).alias('form_points'),
+        )
+
+    def _derive_matches(self, lf):
+        pl = self.pl
+        utc_date = pl.col('utc_date')
+        played = pl.col('status') == 'FINISHED'
+        home_score, away_score = pl.col('home_score'), pl.col('away_score')
+        return lf.with_columns(
+            utc_date.str.to_datetime(strict=False, time_zone='UTC', time_unit='us')
+        ).with_columns(
+            utc_date.dt.date().alias('match_date'),
+            utc_date.dt.time().alias('match_time'),
+            utc_date.dt.month().cast(pl.Int64).alias('match_month'),
+            utc_date.dt.strftime('%A').alias('match_day_of_week'),
+            pl.when(played).then(home_score + away_score).alias('total_goals'),
+            pl.when(played).then((home_score == away_score).cast(pl.Int64)).alias('is_draw'),
+            pl.when(played).then((home_score > away_score).cast(pl.Int64)).alias('is_home_win'),
+            pl.when(played).then((home_score < away_score).cast(pl.Int64)).alias('is_away_win'),
+            pl.when(played).then((home_score - away_score).abs()).alias('goal_difference'),
+        )
+
+    def _derive_scorers(self, lf):
+        pl = self.pl
+        played = pl.col('played_matches')
+        return lf.with_columns(
+            (pl.col('goals') / pl.when(played > 0).then(played)).round(2).alias('goals_per_match')
+        )
+
+    def to_pandas(self, kind, df):
+        """pandas motorunun döndürdüğü tiplerle aynı DataFrame (yükleyici ve doğrulayıcı için)"""
+        pdf = df.to_pandas()
+        types = {**SCHEMAS[kind], **DERIVED[kind]}
+        for col in pdf.columns:
+            dtype = types.get(col)
+            if dtype == 'int':
+                pdf[col] = pdf[col].astype('Int64')
+            elif dtype == 'date':
+                pdf[col] = pdf[col].dt.date
+            elif dtype == 'time':
+                pdf[col] = pdf[col].where(pdf[col].notna(), pd.NaT)
+            elif dtype == 'str' and df[col].null_count() == len(df):
+                # pandas tamamen boş metin kolonunu object (None) olarak kurar
+                pdf[col] = pd.Series([None] * len(pdf), index=pdf.index, dtype=object)
+        return pdf
+
+    def write_csv(self, df, path):
+        pl = self.pl
+        formatted = [
+            pl.when(pl.col(col).dt.microsecond() == 0)
+            .then(pl.col(col).dt.strftime(DATETIME_FORMAT if dtype == pl.Datetime else TIME_FORMAT))
+            .otherwise(pl.col(col).dt.strftime(DATETIME_US_FORMAT if dtype == pl.Datetime else TIME_US_FORMAT))
+            .alias(col)
+            for col, dtype in df.schema.items() if dtype in (pl.Datetime, pl.Time)
+        ]
+        # pandas boş metni de boş hücre olarak yazar
+        df.with_columns(formatted).with_columns(pl.col(pl.String).replace('', None)).write_csv(path)
+
+    def write_parquet(self, df, path):
+        df.write_parquet(path)
+
+
+ENGINES = {'pandas': PandasEngine, 'polars': PolarsEngine}
+
+
+def get_engine(name):
+    """Adıyla motor oluştur ('pandas' | 'polars')"""
+    if name not in ENGINES:
+        raise ValueError(f"Bilinmeyen dönüştürme motoru: {name} (seçenekler: {', '.join(ENGINES)})")
+    return ENGINES[name]()
@@ -1,27 +1,51 @@
 # src/transformers/football_data_transformer.py
-import pandas as pd
 import json
 import os
+import re
 from datetime import datetime
-import sys
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from configs.config import RAW_DATA_PATH, PROCESSED_DATA_PATH
+from configs.config import RAW_DATA_PATH, PROCESSED_DATA_PATH, TRANSFORM_ENGINE
+
+# Ham dosya adı: {lig}_{standings|matches|squads|scorers}_{sezon}_{YYYYmmdd_HHMMSS}.json
+RAW_FILE_PATTERN = re.compile(r'^(?P<code>[A-Z0-9]+)_(?P<kind>standings|matches|squads|scorers)_(?P<season>\d{4})_(?P<timestamp>\d{8}_\d{6})\.json$')
+
+# İşlenmiş dosya türü -> kaynak ham dosya türü (maç görevlileri maç dosyasından çıkarılır)
+OUTPUT_SOURCES = {'standings': 'standings', 'matches': 'matches', 'officials': 'matches',
+                  'squads': 'squads', 'scorers': 'scorers'}
+
+
+def find_latest_raw_files(raw_path=RAW_DATA_PATH):
+    """Her (lig, sezon) için en son çekilen ham dosyaları türüne göre bul"""
+    groups = {}
+    for filename in sorted(os.listdir(raw_path)):
+        match = RAW_FILE_PATTERN.match(filename)
+        if match:
+            # sorted() zaman damgasına göre sıraladığı için son dosya en güncelidir
+            key = (match['code'], int(match['season']))
+            groups.setdefault(key, {})[match['kind']] = os.path.join(raw_path, filename)
+    return groups
+
+def _load_json(json_file):
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 class FootballDataTransformer:
-    def __init__(self):
+    def __init__(self, engine=TRANSFORM_ENGINE, processed_path=PROCESSED_DATA_PATH):
+        """engine: DataFrame motoru, 'pandas' ya da 'polars' (src/transformers/engines.py)"""
+        # pandas motorla birlikte yüklenir; find_latest_raw_files / RAW_FILE_PATTERN
+        # kullanan modüller (mock sunucu, arşiv incelemesi) pandas'a ihtiyaç duymaz
+        from src.transformers.engines import get_engine
+        
         self.raw_path = RAW_DATA_PATH
-        self.processed_path = PROCESSED_DATA_PATH
+        self.processed_path = processed_path
+        self.engine = get_engine(engine)
         os.makedirs(self.processed_path, exist_ok=True)
     
     
-    def transform_standings(self, json_file):
-        """Puan durumu verilerini DataFrame'e dönüştür"""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    
+    def _standings_records(self, data):
+        """Puan durumu JSON'ını satırlara ayır (yalnızca toplam puan tablosu)"""
         standings_list = []
-    
+        
         # Standings verilerini parse et
         for standing in data['standings']:
             if standing['type'] == 'TOTAL':  # Sadece toplam puanları al
@@ -44,90 +68,234 @@ class FootballDataTransformer:
                         'form': team.get('form', ''),
                         'competition_name': data['competition']['name'],
                         'competition_code': data['competition']['code'],
+                        'season_year': int(data['season']['startDate'][:4]),
                         'season_start': data['season']['startDate'],
                         'season_end': data['season']['endDate'],
                         'last_updated': data.get('lastUpdated', datetime.now().isoformat())  # Güvenli erişim
                     })
-    
-        df_standings = pd.DataFrame(standings_list)
-    
-        # Boş DataFrame kontrolü
-        if df_standings.empty:
-            print("⚠️ Uyarı: Standings verisi boş!")
-            return df_standings
         
-            # Hesaplanan metrikleri ekle
-        df_standings['win_percentage'] = (df_standings['won'] / df_standings['played_games'] * 100).round(2)
-        df_standings['points_per_game'] = (df_standings['points'] / df_standings['played_games']).round(2)
-        df_standings['goals_per_game'] = (df_standings['goals_for'] / df_standings['played_games']).round(2)
-        df_standings['goals_conceded_per_game'] = (df_standings['goals_against'] / df_standings['played_games']).round(2)
-    
-        # Form analizini ekle (son 5 maç)
-        if 'form' in df_standings.columns and df_standings['form'].notna().any():
-            df_standings['form_points'] = df_standings['form'].apply(
-                lambda x: sum([3 if c == 'W' else 1 if c == 'D' else 0 for c in str(x)]) if x else 0
-            )
-    
-        print(f"✅ {len(df_standings)} takımın puan durumu işlendi")
+        return standings_list
     
-        return df_standings
-    
-    
-    
-    def transform_matches(self, json_file):
-        """Maç verilerini DataFrame'e dönüştür"""
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+    def _matches_records(self, data):
+        """Maç JSON'ını maç başına bir satıra ayır"""
         matches_list = []
         
         for match in data['matches']:
+            # Eksik alanlar hata vermez, boş (None) kalır; bozuk satırlar
+            # yüklemeden önce doğrulama aşamasında karantinaya alınır
+            home_team = match.get('homeTeam') or {}
+            away_team = match.get('awayTeam') or {}
+            score = match.get('score') or {}
+            full_time = score.get('fullTime') or {}
+            half_time = score.get('halfTime') or {}
+            
             matches_list.append({
-                'match_id': match['id'],
+                'match_id': match.get('id'),
                 'competition_name': data['competition']['name'],
                 'competition_code': data['competition']['code'],
-                'season': match['season']['startDate'][:4],
-                'utc_date': match['utcDate'],
-                'status': match['status'],
+                'season': ((match.get('season') or {}).get('startDate') or '')[:4] or None,
+                'utc_date': match.get('utcDate'),
+                'status': match.get('status'),
                 'matchday': match.get('matchday'),
                 'stage': match.get('stage'),
-                'home_team_id': match['homeTeam']['id'],
-                'home_team_name': match['homeTeam']['name'],
-                'home_team_short': match['homeTeam']['shortName'],
-                'away_team_id': match['awayTeam']['id'],
-                'away_team_name': match['awayTeam']['name'],
-                'away_team_short': match['awayTeam']['shortName'],
-                'home_score': match['score']['fullTime']['home'],
-                'away_score': match['score']['fullTime']['away'],
-                'home_score_ht': match['score']['halfTime']['home'],
-                'away_score_ht': match['score']['halfTime']['away'],
-                'duration': match['score'].get('duration', 'REGULAR'),
-                'winner': match['score'].get('winner'),
+                'home_team_id': home_team.get('id'),
+                'home_team_name': home_team.get('name'),
+                'home_team_short': home_team.get('shortName', home_team.get('name')),
+                'away_team_id': away_team.get('id'),
+                'away_team_name': away_team.get('name'),
+                'away_team_short': away_team.get('shortName', away_team.get('name')),
+                'home_score': full_time.get('home'),
+                'away_score': full_time.get('away'),
+                'home_score_ht': half_time.get('home'),
+                'away_score_ht': half_time.get('away'),
+                'duration': score.get('duration', 'REGULAR'),
+                'winner': score.get('winner'),
                 'referees': ', '.join([ref.get('name', '') for ref in match.get('referees', [])])
             })
         
-        df_matches = pd.DataFrame(matches_list)
+        return matches_list
+    
+    def _officials_records(self, data):
+        """Maç görevlilerini (hakem ID, rol) maç başına bir satır olacak şekilde çıkar"""
+        officials_list = []
+        
+        for match in data['matches']:
+            for referee in match.get('referees') or []:
+                officials_list.append({
+                    'match_id': match.get('id'),
+                    'referee_id': referee.get('id'),
+                    'referee_name': referee.get('name'),
+                    'role': referee.get('type') or 'REFEREE',
+                    'nationality': referee.get('nationality')
+                })
+        
+        return officials_list
+    
+    def _squads_records(self, data):
+        """Takım kadrolarını oyuncu-takım başına bir satır olacak şekilde çıkar"""
+        competition_code = data['competition']['code']
+        season_year = int(data['season']['startDate'][:4])
+        squads_list = []
+        
+        for team in data['teams']:
+            for player in team.get('squad') or []:
+                squads_list.append({
+                    'player_id': player.get('id'),
+                    'player_name': player.get('name'),
+                    'position': player.get('position'),
+                    'date_of_birth': player.get('dateOfBirth'),
+                    'nationality': player.get('nationality'),
+                    'team_id': team.get('id'),
+                    'team_name': team.get('name'),
+                    'competition_code': competition_code,
+                    'season_year': season_year
+                })
+        
+        return squads_list
+    
+    def _scorers_records(self, data):
+        """Gol krallığı listesini oyuncu sezon istatistiklerine dönüştür"""
+        competition_code = data['competition']['code']
+        season_year = int(data['season']['startDate'][:4])
+        scorers_list = []
+        
+        for scorer in data['scorers']:
+            player = scorer.get('player') or {}
+            team = scorer.get('team') or {}
+            
+            scorers_list.append({
+                'player_id': player.get('id'),
+                'player_name': player.get('name'),
+                'first_name': player.get('firstName'),
+                'last_name': player.get('lastName'),
+                'position': player.get('position') or player.get('section'),
+                'date_of_birth': player.get('dateOfBirth'),
+                'nationality': player.get('nationality'),
+                'shirt_number': player.get('shirtNumber'),
+                'team_id': team.get('id'),
+                'team_name': team.get('name'),
+                'played_matches': scorer.get('playedMatches'),
+                'goals': scorer.get('goals'),
+                'assists': scorer.get('assists'),
+                'penalties': scorer.get('penalties'),
+                'competition_code': competition_code,
+                'season_year': season_year
+            })
+        
+        return scorers_list
+    
+    def _transform(self, kind, records):
+        """Kayıtları seçili motorla dönüştür; yükleyici ve doğrulayıcı için pandas DataFrame döndür"""
+        return self.engine.to_pandas(kind, self.engine.transform(kind, records))
+    
+    def transform_standings(self, json_file):
+        """Puan durumu verilerini DataFrame'e dönüştür"""
+        df_standings = self._transform('standings', self._standings_records(_load_json(json_file)))
         
-        # Tarih sütununu datetime'a çevir
-        df_matches['utc_date'] = pd.to_datetime(df_matches['utc_date'])
-        df_matches['match_date'] = df_matches['utc_date'].dt.date
-        df_matches['match_time'] = df_matches['utc_date'].dt.time
-        df_matches['match_month'] = df_matches['utc_date'].dt.month
-        df_matches['match_day_of_week'] = df_matches['utc_date'].dt.day_name()
+        if df_standings.empty:
+            print("⚠️ Uyarı: Standings verisi boş!")
+        else:
+            print(f"✅ {len(df_standings)} takımın puan durumu işlendi")
         
-        # Sadece oynanan maçları filtrele
-        df_matches_played = df_matches[df_matches['status'] == 'FINISHED'].copy()
+        return df_standings
+    
+    def transform_matches(self, json_file):
+        """Maç verilerini DataFrame'e dönüştür"""
+        df_matches = self._transform('matches', self._matches_records(_load_json(json_file)))
+        
+        print(f"✅ {len(df_matches)} maç işlendi ({(df_matches['status'] == 'FINISHED').sum()} FINISHED)")
         
-        # Hesaplanan metrikleri ekle
-        df_matches_played['total_goals'] = df_matches_played['home_score'] + df_matches_played['away_score']
-        df_matches_played['is_draw'] = (df_matches_played['home_score'] == df_matches_played['away_score']).astype(int)
-        df_matches_played['is_home_win'] = (df_matches_played['home_score'] > df_matches_played['away_score']).astype(int)
-        df_matches_played['is_away_win'] = (df_matches_played['home_score'] < df_matches_played['away_score']).astype(int)
-        df_matches_played['goal_difference'] = abs(df_matches_played['home_score'] - df_matches_played['away_score'])
+        return df_matches
+    
+    def transform_match_officials(self, json_file):
+        """Maç görevlilerini DataFrame'e dönüştür"""
+        df_officials = self._transform('officials', self._officials_records(_load_json(json_file)))
+        
+        print(f"✅ {len(df_officials)} maç görevlisi kaydı işlendi ({df_officials['referee_id'].nunique()} hakem)")
+        
+        return df_officials
+    
+    def transform_squads(self, json_file):
+        """Takım kadrolarını DataFrame'e dönüştür"""
+        data = _load_json(json_file)
+        df_squads = self._transform('squads', self._squads_records(data))
         
-        print(f"✅ {len(df_matches)} maçtan {len(df_matches_played)} tanesi işlendi (FINISHED)")
+        print(f"✅ {len(data['teams'])} takımın kadrosu işlendi ({len(df_squads)} oyuncu)")
         
-        return df_matches_played
+        return df_squads
+    
+    def transform_scorers(self, json_file):
+        """Gol krallığını DataFrame'e dönüştür"""
+        df_scorers = self._transform('scorers', self._scorers_records(_load_json(json_file)))
+        
+        print(f"✅ {len(df_scorers)} golcü işlendi")
+        
+        return df_scorers
+    
+    def _jobs(self, groups, keys):
+        """Lig-sezonların (tür, kayıtlar) işleri; her işin (lig, sezon, tür) anahtarı keys'e eklenir"""
+        # Ham dosyalar sırayla okunur; kayıtlar motor tabloyu kurunca bırakılır
+        for (code, season), files in groups.items():
+            loaded = {}
+            for kind, source in OUTPUT_SOURCES.items():
+                if source not in files:
+                    continue
+                if source not in loaded:
+                    loaded[source] = _load_json(files[source])
+                keys.append((code, season, kind))
+                yield kind, getattr(self, f"_{kind}_records")(loaded[source])
+    
+    def transform_batch(self, groups, output_path=None, fmt='csv'):
+        """Lig-sezonları tek seferde dönüştürüp {lig}_{sezon}_{tür}.{csv|parquet} dosyalarına yaz
+        
+        groups: find_latest_raw_files() çıktısı. Tablolar motorun kendi tipinde kalır
+        (pandas'a çevrilmez); Polars motorunda tüm lig-sezonların planları birlikte,
+        çok çekirdekte çalışır. Yazılan dosyaların yollarını döndürür.
+        """
+        output_path = output_path or self.processed_path
+        os.makedirs(output_path, exist_ok=True)
+        
+        keys = []
+        paths = []
+        write = getattr(self.engine, f"write_{fmt}")
+        for i, df in enumerate(self.engine.transform_many(self._jobs(groups, keys))):
+            code, season, kind = keys[i]
+            paths.append(os.path.join(output_path, f"{code}_{season}_{kind}.{fmt}"))
+            write(df, paths[-1])
+        
+        print(f"✅ {len(groups)} lig-sezon dönüştürüldü: {len(paths)} dosya ({self.engine.name})")
+        return paths
+    
+    def transform_frames(self, groups, checkpoint_path=None):
+        """Lig-sezonları dönüştürüp yükleyiciye bellekte ver: ((lig, sezon), {tür: DataFrame}, kaynaklar) akışı
+        
+        Tablolar metne yazılıp geri okunmaz; engines.py'deki SCHEMAS / DERIVED tipleriyle
+        pandas DataFrame olarak gelir. checkpoint_path verilirse her tablo ayrıca
+        {lig}_{sezon}_{tür}.parquet olarak yazılır (yükleyici sonradan bu dosyalardan da
+        yükleyebilir); kaynaklar bu durumda Parquet dosyaları, değilse ham JSON'lardır.
+        
+        Motor her lig-sezon için ayrı çağrılır: Polars'ın collect_all'u yalnızca o
+        lig-sezonun tablolarını çalıştırır, bellekte aynı anda tek lig-sezon tutulur.
+        """
+        if checkpoint_path:
+            os.makedirs(checkpoint_path, exist_ok=True)
+        
+        for (code, season), files in groups.items():
+            keys = []
+            frames, sources = {}, {}
+            for i, df in enumerate(self.engine.transform_many(self._jobs({(code, season): files}, keys))):
+                kind = keys[i][2]
+                if checkpoint_path:
+                    sources[kind] = os.path.join(checkpoint_path, f"{code}_{season}_{kind}.parquet")
+                    self.engine.write_parquet(df, sources[kind])
+                else:
+                    sources[kind] = files[OUTPUT_SOURCES[kind]]
+                frames[kind] = self.engine.to_pandas(kind, df)
+            
+            if frames:
+                yield (code, season), frames, sources
+        print(f"✅ {len(groups)} lig-sezon bellekte dönüştürüldü ({self.engine.name}"
+              f"{', Parquet checkpoint: ' + checkpoint_path if checkpoint_path else ''})")
     
     def save_to_csv(self, df, filename):
         """DataFrame'i CSV olarak kaydet"""
@@ -145,37 +313,20 @@ class FootballDataTransformer:
 
 # Test
 if __name__ == "__main__":
-    transformer = FootballDataTransformer()
-    
-    # En son çekilen dosyaları bul
-    files = os.listdir(RAW_DATA_PATH)
-    
-    # Standings dosyasını işle
-    standings_files = [f for f in files if 'standings' in f and f.endswith('.json')]
-    if standings_files:
-        latest_standings = os.path.join(RAW_DATA_PATH, sorted(standings_files)[-1])
-        print(f"\n📊 İşleniyor: {latest_standings}")
-        
-        df_standings = transformer.transform_standings(latest_standings)
-        transformer.save_to_csv(df_standings, 'premier_league_standings')
-        
-        # İlk 5 takımı göster
-        print("\n🏆 İlk 5 takım:")
-        print(df_standings[['position', 'team_name', 'played_games', 'points', 'goal_difference']].head())
-    
-    # Matches dosyasını işle
-    matches_files = [f for f in files if 'matches' in f and f.endswith('.json')]
-    if matches_files:
-        latest_matches = os.path.join(RAW_DATA_PATH, sorted(matches_files)[-1])
-        print(f"\n📊 İşleniyor: {latest_matches}")
-        
-        df_matches = transformer.transform_matches(latest_matches)
-        transformer.save_to_csv(df_matches, 'premier_league_matches')
-        
-        # Özet istatistikler
-        print("\n📈 Maç İstatistikleri:")
-        print(f"Toplam gol: {df_matches['total_goals'].sum()}")
-        print(f"Maç başına ortalama gol: {df_matches['total_goals'].mean():.2f}")
-        print(f"Ev sahibi galibiyeti: {df_matches['is_home_win'].sum()} ({df_matches['is_home_win'].mean()*100:.1f}%)")
-        print(f"Beraberlik: {df_matches['is_draw'].sum()} ({df_matches['is_draw'].mean()*100:.1f}%)")
-        print(f"Deplasman galibiyeti: {df_matches['is_away_win'].sum()} ({df_matches['is_away_win'].mean()*100:.1f}%)")
\ No newline at end of file
+    import argparse
+    import time
+    
+    parser = argparse.ArgumentParser(description="Ham JSON dosyalarını işlenmiş tablolara dönüştür")
+    parser.add_argument('--engine', default=TRANSFORM_ENGINE, help="DataFrame motoru: pandas | polars")
+    parser.add_argument('--format', default='csv', choices=['csv', 'parquet'])
+    args = parser.parse_args()
+    
+    transformer = FootballDataTransformer(engine=args.engine)
+    
+    # Her lig-sezon için en son çekilen dosyaları işle
+    groups = find_latest_raw_files()
+    print(f"📊 İşleniyor: {len(groups)} lig-sezon ({transformer.engine.name})")
+    
+    start = time.perf_counter()
+    paths = transformer.transform_batch(groups, fmt=args.format)
+    print(f"⏱️ {time.perf_counter() - start:.2f} sn, 📁 {transformer.processed_path}")
@@ -1,50 +1,415 @@
 # src/utils/data_inspector.py
+# Ham JSON arşivinin şema profili. Her dosyadaki tüm alanlar (liste
+# elemanları dahil) gezilir; alan yolu başına tip, null/eksik sayısı, sayısal
+# aralık ve az sayıda farklı değeri olan metinlerin değerleri toplanır.
+# Profiller dosya hash'ine göre cache'lenir; yeniden çalıştırmada yalnızca
+# yeni/değişen dosyalar (paralel olarak) incelenir. Her kaynağın son çekimi
+# önceki çekimleriyle karşılaştırılarak şema kayması, son çekimler de
+# dönüştürücünün okuduğu alanlara karşı kontrol edilerek kırılma riski
+# raporlanır.
+import argparse
+import hashlib
 import json
 import os
-import sys
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-from configs.config import RAW_DATA_PATH
-
-def inspect_json_structure(json_file):
-    """JSON dosyasının yapısını incele"""
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    print(f"📋 Dosya: {os.path.basename(json_file)}")
-    print(f"\n🔑 Ana anahtarlar: {list(data.keys())}")
-    
-    # Competition bilgileri
-    if 'competition' in data:
-        print(f"\n🏆 Competition anahtarları: {list(data['competition'].keys())}")
-        print(f"Competition: {data['competition'].get('name', 'N/A')}")
-    
-    # Season bilgileri
-    if 'season' in data:
-        print(f"\n📅 Season anahtarları: {list(data['season'].keys())}")
-    
-    # Standings yapısı
-    if 'standings' in data and data['standings']:
-        print(f"\n📊 Standings sayısı: {len(data['standings'])}")
-        if data['standings'][0]:
-            print(f"Standings[0] anahtarları: {list(data['standings'][0].keys())}")
-            if 'table' in data['standings'][0] and data['standings'][0]['table']:
-                print(f"\n👥 İlk takım bilgileri:")
-                print(f"Takım anahtarları: {list(data['standings'][0]['table'][0].keys())}")
-    
-    # Matches yapısı
-    if 'matches' in data and data['matches']:
-        print(f"\n⚽ Maç sayısı: {len(data['matches'])}")
-        if data['matches'][0]:
-            print(f"İlk maç anahtarları: {list(data['matches'][0].keys())}")
-    
-    return data
+import sqlite3
+import time
+from collections import Counter
+
+from configs.config import RAW_DATA_PATH, INSPECTOR_CACHE_PATH, MATCH_STATUSES
+from src.transformers.football_data_transformer import RAW_FILE_PATTERN
+
+# Bundan fazla farklı değeri olan metin alanlarının değerleri tutulmaz
+MAX_VALUES = 20
+
+# Daha az dosya için süreç havuzu açmak, incelemenin kendisinden pahalıdır
+PARALLEL_MIN_FILES = 8
+
+# Dönüştürücünün okuduğu alanlar: yol -> (beklenen tipler, null/eksik olabilir mi, izin verilen değerler)
+TRANSFORMER_FIELDS = {
+    'standings': {
+        'competition.name': ({'str'}, False, None),
+        'competition.code': ({'str'}, False, None),
+        'season.startDate': ({'str'}, False, None),
+        'season.endDate': ({'str'}, False, None),
+        'standings[].type': ({'str'}, False, None),
+        'standings[].table[].position': ({'int'}, False, None),
+        'standings[].table[].team.id': ({'int'}, False, None),
+        'standings[].table[].team.name': ({'str'}, False, None),
+        'standings[].table[].playedGames': ({'int'}, False, None),
+        'standings[].table[].won': ({'int'}, False, None),
+        'standings[].table[].draw': ({'int'}, False, None),
+        'standings[].table[].lost': ({'int'}, False, None),
+        'standings[].table[].points': ({'int'}, False, None),
+        'standings[].table[].goalsFor': ({'int'}, False, None),
+        'standings[].table[].goalsAgainst': ({'int'}, False, None),
+        'standings[].table[].goalDifference': ({'int'}, False, None),
+    },
+    'matches': {
+        'competition.name': ({'str'}, False, None),
+        'competition.code': ({'str'}, False, None),
+        'matches[].id': ({'int'}, False, None),
+        'matches[].utcDate': ({'str'}, False, None),
+        'matches[].status': ({'str'}, False, MATCH_STATUSES),
+        'matches[].matchday': ({'int'}, True, None),
+        'matches[].homeTeam.id': ({'int'}, False, None),
+        'matches[].awayTeam.id': ({'int'}, False, None),
+        'matches[].score.fullTime.home': ({'int'}, True, None),
+        'matches[].score.fullTime.away': ({'int'}, True, None),
+        'matches[].score.halfTime.home': ({'int'}, True, None),
+        'matches[].score.halfTime.away': ({'int'}, True, None),
+        'matches[].referees[].id': ({'int'}, False, None),
+        'matches[].referees[].name': ({'str'}, False, None),
+    },
+    'squads': {
+        'competition.code': ({'str'}, False, None),
+        'season.startDate': ({'str'}, False, None),
+        'teams[].id': ({'int'}, False, None),
+        'teams[].squad[].id': ({'int'}, False, None),
+        'teams[].squad[].name': ({'str'}, False, None),
+        'teams[].squad[].dateOfBirth': ({'str'}, True, None),
+    },
+    'scorers': {
+        'competition.code': ({'str'}, False, None),
+        'season.startDate': ({'str'}, False, None),
+        'scorers[].player.id': ({'int'}, False, None),
+        'scorers[].player.name': ({'str'}, False, None),
+        'scorers[].team.id': ({'int'}, False, None),
+        'scorers[].playedMatches': ({'int'}, True, None),
+        'scorers[].goals': ({'int'}, False, None),
+        'scorers[].assists': ({'int'}, True, None),
+        'scorers[].penalties': ({'int'}, True, None),
+    },
+}
+
+CACHE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS files (
+        path VARCHAR(255) PRIMARY KEY,
+        size INTEGER NOT NULL,
+        mtime_ns INTEGER NOT NULL,
+        file_hash VARCHAR(64) NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS profiles (
+        file_hash VARCHAR(64) PRIMARY KEY,
+        profile TEXT NOT NULL
+    );
+"""
+
+TYPE_NAMES = {type(None): 'null', bool: 'bool', int: 'int', float: 'float', str: 'str', dict: 'object', list: 'array'}
+
+
+def _walk(values, path, stats):
+    """Bir yoldaki tüm değerleri (tüm liste elemanları birlikte) kolon olarak işle
+
+    Aynı yoldaki değerler tek listede toplandığı için sayma, min/max ve değer
+    frekansları Counter/min/max ile C seviyesinde yapılır; özyineleme değer başına
+    değil, alan başına bir kezdir.
+    """
+    type_counts = Counter(map(type, values))
+    types = {TYPE_NAMES.get(t, 'str'): count for t, count in type_counts.items()}
+    field = stats[path] = {'count': len(values), 'types': types, 'min': None, 'max': None, 'values': {}}
+
+    # Çoğu alan tek tiplidir; o durumda filtrelemeden doğrudan işlenir
+    single = len(type_counts) == 1
+
+    if int in type_counts or float in type_counts:
+        numbers = values if single else [v for v in values if type(v) is int or type(v) is float]
+        field['min'], field['max'] = min(numbers), max(numbers)
+
+    if str in type_counts:
+        counts = Counter(values if single else [v for v in values if type(v) is str])
+        field['values'] = dict(counts) if len(counts) <= MAX_VALUES else None
+
+    if dict in type_counts:
+        objects = values if single else [v for v in values if type(v) is dict]
+        prefix = f'{path}.' if path else ''
+        for key in set().union(*objects):
+            _walk([obj[key] for obj in objects if key in obj], prefix + key, stats)
+
+    if list in type_counts:
+        items = [item for v in (values if single else [v for v in values if type(v) is list]) for item in v]
+        if items:
+            _walk(items, f'{path}[]', stats)
+
+
+def profile_payload(data):
+    """JSON verisinin şema profili: {yol: {'count', 'types', 'min', 'max', 'values'}}
+
+    values, metin değerlerinin sayısıdır; MAX_VALUES'tan fazla farklı değer varsa None.
+    """
+    stats = {}
+    _walk([data], '', stats)
+    return stats
+
+
+def profile_file(path):
+    """Dosyayı oku ve profilini çıkar (süreç havuzunda çalışır)"""
+    with open(path, 'rb') as f:
+        return profile_payload(json.loads(f.read()))
+
+
+def file_hash(path):
+    """Dosya içeriğinin blake2b hash'i"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def merge_profiles(profiles):
+    """Profilleri tek şemada birleştir (sayılar toplanır, aralıklar genişletilir)"""
+    merged = {}
+    for profile in profiles:
+        for path, field in profile.items():
+            target = merged.get(path)
+            if target is None:
+                merged[path] = {'count': field['count'], 'types': dict(field['types']), 'min': field['min'],
+                                'max': field['max'], 'values': None if field['values'] is None else dict(field['values']),
+                                'files': 1}
+                continue
+
+            target['count'] += field['count']
+            target['files'] += 1
+            for type_name, count in field['types'].items():
+                target['types'][type_name] = target['types'].get(type_name, 0) + count
+            if field['min'] is not None and (target['min'] is None or field['min'] < target['min']):
+                target['min'] = field['min']
+            if field['max'] is not None and (target['max'] is None or field['max'] > target['max']):
+                target['max'] = field['max']
+
+            if target['values'] is not None and field['values'] is not None:
+                for value, count in field['values'].items():
+                    target['values'][value] = target['values'].get(value, 0) + count
+                if len(target['values']) > MAX_VALUES:
+                    target['values'] = None
+            else:
+                target['values'] = None
+    return merged
+
+
+def _parent(path):
+    """Alanın bağlı olduğu nesnenin yolu; liste elemanları için None"""
+    if path.endswith('[]'):
+        return None
+    return path.rsplit('.', 1)[0] if '.' in path else ''
+
+
+def missing_count(schema, path):
+    """Alanın ait olduğu nesnelerde kaç kez hiç bulunmadığı"""
+    parent = _parent(path)
+    if parent is None or parent not in schema:
+        return 0
+    return schema[parent]['types'].get('object', 0) - schema[path]['count']
+
+
+def _non_null_types(field):
+    return {t for t in field['types'] if t != 'null'}
+
+
+def detect_drift(baseline, current):
+    """İki şema arasındaki farklar: [(tür, yol, açıklama)]"""
+    drift = []
+
+    for path in sorted(current.keys() - baseline.keys()):
+        drift.append(('yeni', path, '|'.join(sorted(current[path]['types']))))
+
+    for path in sorted(baseline.keys() - current.keys()):
+        drift.append(('kaldırıldı', path, '|'.join(sorted(baseline[path]['types']))))
+
+    for path in sorted(current.keys() & baseline.keys()):
+        old, new = baseline[path], current[path]
+        old_types, new_types = _non_null_types(old), _non_null_types(new)
+        if new_types - old_types:
+            drift.append(('tip değişti', path, f"{'|'.join(sorted(old_types)) or 'null'} -> {'|'.join(sorted(new_types))}"))
+        # Yeni değerler yalnızca tekrar eden (enum benzeri) alanlar için anlamlıdır; zaman damgası gibi
+        # her çekimde değişen alanlar atlanır
+        if old['values'] and new['values'] is not None and len(old['values']) * 2 <= old['count']:
+            added = sorted(new['values'].keys() - old['values'].keys())
+            if added:
+                drift.append(('yeni değer', path, ', '.join(added)))
+
+    return drift
+
+
+def check_transformer_fields(kind, schema):
+    """Dönüştürücünün okuduğu alanları şemaya karşı kontrol et: [(yol, sorun)]"""
+    problems = []
+    for path, (expected, nullable, allowed) in TRANSFORMER_FIELDS.get(kind, {}).items():
+        field = schema.get(path)
+        if field is None:
+            problems.append((path, "alan yok"))
+            continue
+
+        unexpected = _non_null_types(field) - expected
+        if unexpected:
+            problems.append((path, f"tip {'|'.join(sorted(unexpected))} (beklenen {'|'.join(sorted(expected))})"))
+        if not nullable:
+            empty = field['types'].get('null', 0) + missing_count(schema, path)
+            if empty:
+                problems.append((path, f"{empty} kayıtta boş/eksik"))
+        if allowed is not None and field['values'] is not None:
+            unknown = sorted(field['values'].keys() - set(allowed))
+            if unknown:
+                problems.append((path, f"bilinmeyen değer: {', '.join(unknown)}"))
+    return problems
+
+
+class ArchiveInspector:
+    def __init__(self, raw_path=RAW_DATA_PATH, cache_path=INSPECTOR_CACHE_PATH, workers=None):
+        self.raw_path = raw_path
+        self.workers = workers
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        self.cache = sqlite3.connect(cache_path)
+        self.cache.executescript(CACHE_SCHEMA)
+
+    def close(self):
+        self.cache.close()
+
+    def list_files(self):
+        """Ham dosyalar: [(kaynak, tür, zaman damgası, yol)]; kaynak '{lig} {sezon}' biçimindedir"""
+        files = []
+        for filename in sorted(os.listdir(self.raw_path)):
+            match = RAW_FILE_PATTERN.match(filename)
+            if match:
+                files.append((f"{match['code']} {match['season']}", match['kind'], match['timestamp'],
+                              os.path.join(self.raw_path, filename)))
+        return files
+
+    def _hashes(self, paths):
+        """Dosya hash'leri; boyutu ve değişiklik zamanı aynı olan dosyalar yeniden okunmaz"""
+        known = {path: (size, mtime_ns, digest) for path, size, mtime_ns, digest
+                 in self.cache.execute("SELECT path, size, mtime_ns, file_hash FROM files")}
+        hashes, updates = {}, []
+        for path in paths:
+            stat = os.stat(path)
+            cached = known.get(path)
+            if cached and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+                hashes[path] = cached[2]
+            else:
+                hashes[path] = file_hash(path)
+                updates.append((path, stat.st_size, stat.st_mtime_ns, hashes[path]))
+
+        self.cache.executemany("INSERT OR REPLACE INTO files (path, size, mtime_ns, file_hash) VALUES (?, ?, ?, ?)",
+                               updates)
+        self.cache.commit()
+        return hashes
+
+    def profiles(self, paths):
+        """Dosya yolu -> profil; cache'te olmayan hash'ler paralel incelenir. (profiller, incelenen dosya sayısı)"""
+        hashes = self._hashes(paths)
+        cached = {}
+        unique = sorted(set(hashes.values()))
+        for start in range(0, len(unique), 500):
+            chunk = unique[start:start + 500]
+            cached.update(self.cache.execute(
+                f"SELECT file_hash, profile FROM profiles WHERE file_hash IN ({','.join('?' for _ in chunk)})", chunk))
+
+        # Aynı içerikli dosyalar bir kez incelenir
+        todo = {}
+        for path, digest in hashes.items():
+            if digest not in cached and digest not in todo:
+                todo[digest] = path
+
+        if todo:
+            if len(todo) >= PARALLEL_MIN_FILES and self.workers != 1:
+                # Süreç havuzu modülü yalnızca gerektiğinde yüklenir (cache'ten okuma hızlı açılsın)
+                from concurrent.futures import ProcessPoolExecutor
+                with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                    results = list(pool.map(profile_file, todo.values(), chunksize=4))
+            else:
+                results = [profile_file(path) for path in todo.values()]
+
+            fresh = dict(zip(todo, results))
+            self.cache.executemany("INSERT OR REPLACE INTO profiles (file_hash, profile) VALUES (?, ?)",
+                                   [(digest, json.dumps(profile, ensure_ascii=False)) for digest, profile in fresh.items()])
+            self.cache.commit()
+
+        # Cache'ten gelen profiller hash başına bir kez çözülür
+        decoded = {digest: json.loads(profile) for digest, profile in cached.items()}
+        if todo:
+            decoded.update(fresh)
+        return {path: decoded[digest] for path, digest in hashes.items()}, len(todo)
+
+    def inspect(self):
+        """Arşivi incele; tür başına birleşik şema, kayma ve dönüştürücü uyarılarını döndür
+
+        Kayma, aynı kaynağın (lig, sezon, tür) son çekimi ile önceki çekimleri arasında
+        aranır; farklı lig ya da sezonların farklı değerleri kayma sayılmaz.
+        """
+        files = self.list_files()
+        profiles, inspected = self.profiles([path for _, _, _, path in files])
+
+        report = {'files': len(files), 'inspected': inspected, 'kinds': {}}
+        for kind in sorted({kind for _, kind, _, _ in files}):
+            snapshots = {}
+            for resource, k, timestamp, path in files:
+                if k == kind:
+                    snapshots.setdefault(resource, []).append((timestamp, path))
+
+            drift, latest = {}, []
+            for resource, versions in snapshots.items():
+                versions.sort()
+                latest.append(profiles[versions[-1][1]])
+                if len(versions) > 1:
+                    previous = merge_profiles(profiles[path] for _, path in versions[:-1])
+                    for item in detect_drift(previous, profiles[versions[-1][1]]):
+                        drift.setdefault(item, []).append(resource)
+
+            report['kinds'][kind] = {
+                'files': sum(len(versions) for versions in snapshots.values()),
+                'resources': len(snapshots),
+                'schema': merge_profiles(profiles[path] for versions in snapshots.values() for _, path in versions),
+                'drift': drift,
+                'problems': check_transformer_fields(kind, merge_profiles(latest)),
+            }
+        return report
+
+
+def print_schema(schema, kind):
+    print(f"\n📋 {kind} şeması ({len(schema)} alan):")
+    for path, field in sorted(schema.items()):
+        if not path:
+            continue
+        total = sum(field['types'].values())
+        nulls = field['types'].get('null', 0)
+        missing = missing_count(schema, path)
+        details = []
+        if field['min'] is not None:
+            details.append(f"[{field['min']}, {field['max']}]")
+        if field['values']:
+            details.append('{' + ', '.join(sorted(field['values'])[:8]) + (', ...' if len(field['values']) > 8 else '') + '}')
+        print(f"  {path:55s} {'|'.join(sorted(field['types'])):18s} null %{100 * nulls / total:5.1f}  "
+              f"eksik {missing:6d}  {' '.join(details)}")
+
+
+def print_report(report, only=None, schema=False):
+    """inspect() raporunu tür tür yazdır; only verilirse yalnızca o tür, schema ile birleşik şema da"""
+    for kind, result in report['kinds'].items():
+        if only and kind != only:
+            continue
+        print(f"\n📊 {kind}: {result['files']} dosya, {result['resources']} lig-sezon, {len(result['schema'])} alan")
+        if schema:
+            print_schema(result['schema'], kind)
+        for (change, path, detail), resources in result['drift'].items():
+            shown = ', '.join(resources[:3]) + (', ...' if len(resources) > 3 else '')
+            print(f"  ⚠️ Şema kayması [{change}] {path}: {detail} ({len(resources)} lig-sezon: {shown})")
+        for path, problem in result['problems']:
+            print(f"  ❌ Dönüştürücü uyarısı: {path} {problem}")
+        if not result['drift'] and not result['problems']:
+            print("  ✅ Şema kayması yok")
+
 
 if __name__ == "__main__":
-    # En son çekilen standings dosyasını bul
-    files = os.listdir(RAW_DATA_PATH)
-    standings_files = [f for f in files if 'standings' in f and f.endswith('.json')]
-    
-    if standings_files:
-        latest_file = os.path.join(RAW_DATA_PATH, sorted(standings_files)[-1])
-        inspect_json_structure(latest_file)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Ham JSON arşivinin şemasını çıkar ve şema kaymasını raporla")
+    parser.add_argument('--raw', default=RAW_DATA_PATH)
+    parser.add_argument('--cache', default=INSPECTOR_CACHE_PATH)
+    parser.add_argument('--workers', type=int, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument('--kind', choices=list(TRANSFORMER_FIELDS), help="Yalnızca bu veri türü")
+    parser.add_argument('--schema', action='store_true', help="Birleşik şemayı alan alan göster")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    inspector = ArchiveInspector(args.raw, args.cache, args.workers)
+    report = inspector.inspect()
+    inspector.close()
+    print(f"📋 {report['files']} dosya ({report['inspected']} yeni incelendi, diğerleri cache'ten) "
+          f"{time.perf_counter() - start:.2f} sn")
+
+    print_report(report, args.kind, args.schema)
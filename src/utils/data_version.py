@@ -0,0 +1,25 @@
+# src/utils/data_version.py
+import os
+import pathlib
+
+
+def get_data_version(db_path):
+    """Veritabanı dosyasının sürüm anahtarını döndür
+
+    Anahtar dosyanın inode, değişiklik zamanı ve boyutundan üretilir; her commit
+    dosyayı değiştirdiği için yeni bir yükleme yeni bir sürüm anlamına gelir.
+    Cache'ler bu anahtarı kullanarak eski sonuçları geçersiz kılar.
+    """
+    if not os.path.exists(db_path):
+        return None
+
+    stat = os.stat(db_path)
+    return f"{stat.st_ino:x}-{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def read_only_uri(db_path):
+    """Veritabanını salt-okunur açan SQLite URI'si (sqlite3.connect(..., uri=True) ve ATTACH için)
+
+    Yol kaçışlanır: '?', '#', '%' ya da boşluk içeren klasör adları URI'yi bozmaz.
+    """
+    return pathlib.Path(os.path.abspath(db_path)).as_uri() + '?mode=ro'
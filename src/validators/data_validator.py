@@ -0,0 +1,274 @@
+# src/validators/data_validator.py
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from configs.config import MATCH_STATUSES
+
+# Kolon kısıtları: type (int | datetime | str), required (boş olamaz),
+# min / max (aralık), allowed (izin verilen değerler), unique (batch içinde tekil)
+STANDINGS_SCHEMA = {
+    'team_id': {'type': 'int', 'required': True, 'unique': True},
+    'team_name': {'type': 'str', 'required': True},
+    'position': {'type': 'int', 'required': True, 'min': 1, 'max': 40},
+    'played_games': {'type': 'int', 'required': True, 'min': 0, 'max': 60},
+    'won': {'type': 'int', 'required': True, 'min': 0, 'max': 60},
+    'draw': {'type': 'int', 'required': True, 'min': 0, 'max': 60},
+    'lost': {'type': 'int', 'required': True, 'min': 0, 'max': 60},
+    # Puan silme cezaları nedeniyle puan negatif olabilir
+    'points': {'type': 'int', 'required': True, 'min': -50, 'max': 180},
+    'goals_for': {'type': 'int', 'required': True, 'min': 0},
+    'goals_against': {'type': 'int', 'required': True, 'min': 0},
+    'goal_difference': {'type': 'int', 'required': True},
+    'competition_code': {'type': 'str', 'required': True},
+    'season_year': {'type': 'int', 'required': True, 'min': 1900, 'max': 2100},
+}
+
+# Henüz oynanmamış maçlar skor taşımamalı
+UNPLAYED_STATUSES = ['SCHEDULED', 'TIMED', 'POSTPONED', 'CANCELLED']
+
+MATCHES_SCHEMA = {
+    'match_id': {'type': 'int', 'required': True, 'unique': True},
+    'utc_date': {'type': 'datetime', 'required': True},
+    'status': {'type': 'str', 'required': True, 'allowed': MATCH_STATUSES},
+    'matchday': {'type': 'int', 'min': 1, 'max': 60},
+    'home_team_id': {'type': 'int', 'required': True},
+    'away_team_id': {'type': 'int', 'required': True},
+    'home_score': {'type': 'int', 'min': 0, 'max': 99},
+    'away_score': {'type': 'int', 'min': 0, 'max': 99},
+    'home_score_ht': {'type': 'int', 'min': 0, 'max': 99},
+    'away_score_ht': {'type': 'int', 'min': 0, 'max': 99},
+}
+
+OFFICIALS_SCHEMA = {
+    'match_id': {'type': 'int', 'required': True},
+    'referee_id': {'type': 'int', 'required': True},
+    'referee_name': {'type': 'str', 'required': True},
+    'role': {'type': 'str', 'required': True},
+}
+
+SQUADS_SCHEMA = {
+    'player_id': {'type': 'int', 'required': True},
+    'player_name': {'type': 'str', 'required': True},
+    'team_id': {'type': 'int', 'required': True},
+    'date_of_birth': {'type': 'datetime'},
+}
+
+SCORERS_SCHEMA = {
+    'player_id': {'type': 'int', 'required': True, 'unique': True},
+    'player_name': {'type': 'str', 'required': True},
+    'team_id': {'type': 'int', 'required': True},
+    'date_of_birth': {'type': 'datetime'},
+    'played_matches': {'type': 'int', 'min': 0, 'max': 60},
+    'goals': {'type': 'int', 'required': True, 'min': 0, 'max': 100},
+    'assists': {'type': 'int', 'min': 0, 'max': 100},
+    'penalties': {'type': 'int', 'min': 0, 'max': 100},
+}
+
+
+def _as_float(values):
+    """Kolonu float numpy dizisine çevir (geçersiz/boş -> NaN; NaN karşılaştırmaları False döner)"""
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+class DataValidator:
+    def _column_checks(self, df, schema):
+        """Kolon kısıtlarını tüm kolon üzerinde tek seferde kontrol et: [(sebep, maske), ...]"""
+        checks = []
+
+        for column, rules in schema.items():
+            if column not in df.columns:
+                if rules.get('required'):
+                    checks.append((f"{column}: kolon yok", np.ones(len(df), dtype=bool)))
+                continue
+
+            values = df[column]
+            present = values.notna().to_numpy()
+            # pandas 3'te metin kolonları object değil str tipinde gelir
+            if pd.api.types.is_string_dtype(values) or values.dtype == object:
+                present = present & (values.astype(str).str.strip() != '').to_numpy(dtype=bool, na_value=False)
+
+            if rules.get('required'):
+                checks.append((f"{column}: boş", ~present))
+
+            if rules['type'] == 'int':
+                numeric = _as_float(values)
+                typed = ~np.isnan(numeric) & (np.mod(numeric, 1) == 0)
+                checks.append((f"{column}: tamsayı değil", present & ~typed))
+                if 'min' in rules:
+                    checks.append((f"{column}: {rules['min']} altında", typed & (numeric < rules['min'])))
+                if 'max' in rules:
+                    checks.append((f"{column}: {rules['max']} üstünde", typed & (numeric > rules['max'])))
+            elif rules['type'] == 'datetime':
+                parsed = pd.to_datetime(values, errors='coerce', utc=True)
+                checks.append((f"{column}: geçersiz tarih", present & parsed.isna().to_numpy()))
+
+            if 'allowed' in rules:
+                checks.append((f"{column}: geçersiz değer", present & ~values.isin(rules['allowed']).to_numpy()))
+
+            if rules.get('unique'):
+                checks.append((f"{column}: tekrar eden anahtar", present & values.duplicated(keep='first').to_numpy()))
+
+        return checks
+
+    def _split(self, df, checks, table_name, key_column, source):
+        """Hatalı satırları sebepleriyle ayır: (geçerli DataFrame, karantina DataFrame)"""
+        bad = np.zeros(len(df), dtype=bool)
+        for _, mask in checks:
+            bad |= mask
+
+        if not bad.any():
+            return df, self.empty_quarantine()
+
+        # Sebep metinleri yalnızca hatalı satırlar için oluşturulur
+        reasons = np.full(bad.sum(), '', dtype=object)
+        for reason, mask in checks:
+            hit = mask[bad]
+            if hit.any():
+                reasons[hit] = reasons[hit] + reason + '; '
+
+        bad_rows = df[bad]
+        payloads = bad_rows.to_json(orient='records', lines=True, date_format='iso', force_ascii=False)
+
+        quarantine = pd.DataFrame({
+            'table_name': table_name,
+            'record_key': bad_rows[key_column].astype(str).to_numpy() if key_column in df.columns else None,
+            'reason': [r.rstrip('; ') for r in reasons],
+            'payload': payloads.splitlines(),
+            'source_file': source,
+            'quarantined_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        })
+
+        print(f"⚠️ Uyarı: {table_name} için {len(quarantine)} satır karantinaya alındı")
+        return df[~bad], quarantine
+
+    @staticmethod
+    def empty_quarantine():
+        return pd.DataFrame(columns=['table_name', 'record_key', 'reason', 'payload', 'source_file', 'quarantined_at'])
+
+    def validate_standings(self, df, source=None):
+        """Puan durumu satırlarını doğrula; source karantina kaydına yazılan kaynak dosyadır"""
+        checks = self._column_checks(df, STANDINGS_SCHEMA)
+
+        # Tutarlılık: G + B + M = O ve averaj = AG - YG
+        columns = ['played_games', 'won', 'draw', 'lost', 'goals_for', 'goals_against', 'goal_difference']
+        if all(c in df.columns for c in columns):
+            n = {c: _as_float(df[c]) for c in columns}
+            games = n['won'] + n['draw'] + n['lost']
+            checks.append(("maç sayısı tutarsız (G+B+M != O)", ~np.isnan(games + n['played_games'])
+                           & (games != n['played_games'])))
+            diff = n['goals_for'] - n['goals_against']
+            checks.append(("averaj tutarsız (AG-YG != Av)", ~np.isnan(diff + n['goal_difference'])
+                           & (diff != n['goal_difference'])))
+
+        return self._split(df, checks, 'standings', 'team_id', source)
+
+    def validate_matches(self, df, known_team_ids=None, source=None):
+        """Maç satırlarını doğrula; known_team_ids verilirse takım referanslarını da kontrol et"""
+        checks = self._column_checks(df, MATCHES_SCHEMA)
+        columns = set(df.columns)
+
+        if {'home_team_id', 'away_team_id'} <= columns:
+            home = _as_float(df['home_team_id'])
+            away = _as_float(df['away_team_id'])
+            checks.append(("takım kendisiyle eşleşmiş", home == away))
+
+            if known_team_ids is not None:
+                known = np.fromiter(known_team_ids, dtype=np.float64)
+                checks.append(("home_team_id: bilinmeyen takım", ~np.isnan(home) & ~np.isin(home, known)))
+                checks.append(("away_team_id: bilinmeyen takım", ~np.isnan(away) & ~np.isin(away, known)))
+
+        if {'status', 'home_score', 'away_score'} <= columns:
+            home_score = _as_float(df['home_score'])
+            away_score = _as_float(df['away_score'])
+            finished = (df['status'] == 'FINISHED').to_numpy()
+
+            checks.append(("biten maçta skor eksik", finished & (np.isnan(home_score) | np.isnan(away_score))))
+            checks.append(("oynanmamış maçta skor var", df['status'].isin(UNPLAYED_STATUSES).to_numpy()
+                           & (~np.isnan(home_score) | ~np.isnan(away_score))))
+
+            if {'home_score_ht', 'away_score_ht'} <= columns:
+                checks.append(("ilk yarı skoru maç sonucundan büyük",
+                               (_as_float(df['home_score_ht']) > home_score)
+                               | (_as_float(df['away_score_ht']) > away_score)))
+
+            if 'winner' in columns:
+                expected = np.select([home_score > away_score, home_score < away_score, home_score == away_score],
+                                     ['HOME_TEAM', 'AWAY_TEAM', 'DRAW'], default='')
+                winner = df['winner'].to_numpy(dtype=object)
+                # Uzatma/penaltı ile biten maçlarda kazanan normal skordan farklı olabilir
+                regular = (df['duration'] == 'REGULAR').to_numpy() if 'duration' in columns else True
+                checks.append(("kazanan skorla tutarsız", finished & regular & pd.notna(winner)
+                               & (expected != '') & (winner != expected)))
+
+        return self._split(df, checks, 'matches', 'match_id', source)
+
+    def validate_officials(self, df, known_match_ids=None, source=None):
+        """Maç görevlisi satırlarını doğrula; known_match_ids verilirse maç referanslarını da kontrol et"""
+        checks = self._column_checks(df, OFFICIALS_SCHEMA)
+
+        if known_match_ids is not None and 'match_id' in df.columns:
+            match_ids = _as_float(df['match_id'])
+            known = np.fromiter(known_match_ids, dtype=np.float64)
+            checks.append(("match_id: bilinmeyen maç", ~np.isnan(match_ids) & ~np.isin(match_ids, known)))
+
+        return self._split(df, checks, 'match_officials', 'match_id', source)
+    
+    def _team_reference_checks(self, df, known_team_ids):
+        """team_id kolonunun bilinen takımlara referans verdiğini kontrol et"""
+        if known_team_ids is None or 'team_id' not in df.columns:
+            return []
+        team_ids = _as_float(df['team_id'])
+        known = np.fromiter(known_team_ids, dtype=np.float64)
+        return [("team_id: bilinmeyen takım", ~np.isnan(team_ids) & ~np.isin(team_ids, known))]
+    
+    def validate_squads(self, df, known_team_ids=None, source=None):
+        """Kadro satırlarını doğrula; known_team_ids verilirse takım referanslarını da kontrol et"""
+        checks = self._column_checks(df, SQUADS_SCHEMA) + self._team_reference_checks(df, known_team_ids)
+        return self._split(df, checks, 'squad_memberships', 'player_id', source)
+    
+    def validate_scorers(self, df, known_team_ids=None, source=None):
+        """Gol krallığı satırlarını doğrula; penaltı golleri toplam golden fazla olamaz"""
+        checks = self._column_checks(df, SCORERS_SCHEMA) + self._team_reference_checks(df, known_team_ids)
+        
+        if {'goals', 'penalties'} <= set(df.columns):
+            checks.append(("penaltı golü toplam golden fazla", _as_float(df['penalties']) > _as_float(df['goals'])))
+        
+        return self._split(df, checks, 'player_season_stats', 'player_id', source)
+
+# Test
+if __name__ == "__main__":
+    # Bir milyon satırlık sentetik maç batch'i ile doğrulama süresini ölç
+    n = 1_000_000
+    rng = np.random.default_rng(0)
+    status = rng.choice(['FINISHED', 'SCHEDULED', 'POSTPONED'], n, p=[0.8, 0.15, 0.05])
+    played = status == 'FINISHED'
+    home_score = pd.array(np.where(played, rng.poisson(1.5, n), 0), dtype='Int64')
+    away_score = pd.array(np.where(played, rng.poisson(1.2, n), 0), dtype='Int64')
+    home_score[~played] = pd.NA
+    away_score[~played] = pd.NA
+
+    matches_df = pd.DataFrame({
+        'match_id': np.arange(n),
+        'utc_date': pd.Timestamp('2023-08-01', tz='UTC') + pd.to_timedelta(rng.integers(0, 300, n), unit='D'),
+        'status': status,
+        'matchday': rng.integers(1, 39, n),
+        'home_team_id': rng.integers(0, 20, n),
+        'away_team_id': rng.integers(20, 40, n),
+        'home_score': home_score,
+        'away_score': away_score,
+        'home_score_ht': home_score,
+        'away_score_ht': away_score,
+    })
+    # Bozuk satırlar: sonuçsuz biten maç, negatif skor, bilinmeyen takım
+    matches_df.loc[0, 'home_score'] = pd.NA
+    matches_df.loc[1, 'status'] = 'FINISHED'
+    matches_df.loc[2, 'away_score'] = -1
+    matches_df.loc[3, 'home_team_id'] = 999
+
+    start = time.perf_counter()
+    valid_df, quarantine_df = DataValidator().validate_matches(matches_df, known_team_ids=range(40))
+    print(f"⏱️ {n:,} satır {time.perf_counter() - start:.2f} sn'de doğrulandı")
+    print(quarantine_df[['record_key', 'reason']].head(10))
@@ -1,9 +1,6 @@
 # test_api.py
 import requests
-import sys
-import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from configs.config import FOOTBALL_DATA_API_KEY
 
 # API anahtarını kontrol et
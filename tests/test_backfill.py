@@ -0,0 +1,69 @@
+# tests/test_backfill.py
+# Backfill'in mock sunucudan (src/extractors/mock_server.py) indirdiği ham
+# dosyaları kontrol eder: her uç nokta extractor'ın extract_* metotlarıyla
+# aynı parametrelerle istenmeli (ör. gol krallığında limit, API varsayılanı 10).
+# Yüklemesi hata veren lig-sezonun hiçbir tablosu yayınlanmamalı.
+import json
+import sqlite3
+
+import requests
+
+from configs.config import ENDPOINT_PARAMS
+from src.extractors.football_data_extractor import FootballDataExtractor
+from src.extractors.mock_server import DEFAULT_SCORERS_LIMIT, MockFootballDataServer
+from src.loaders.database_loader import DatabaseLoader
+from src.pipeline.backfill import Backfill, CheckpointStore, DOWNLOADED, LOADED
+
+
+def test_mock_applies_default_scorers_limit():
+    with MockFootballDataServer(quota_per_minute=None) as server:
+        url = f"{server.base_url}/competitions/PL/scorers"
+        assert len(requests.get(url, params={'season': 2023}).json()['scorers']) == DEFAULT_SCORERS_LIMIT
+        assert len(requests.get(url, params={'season': 2023, 'limit': 50}).json()['scorers']) == 50
+
+
+def test_backfill_requests_endpoint_params(tmp_path):
+    with MockFootballDataServer(quota_per_minute=None) as server:
+        extractor = FootballDataExtractor(base_url=server.base_url, api_key='test', raw_path=str(tmp_path / 'raw'),
+                                          request_delay=0)
+        backfill = Backfill(['PL'], [2023], endpoints=['standings', 'scorers'],
+                            db_path=str(tmp_path / 'football_data.db'),
+                            checkpoint_path=str(tmp_path / 'checkpoint.db'), request_delay=0,
+                            extractor=extractor, snapshot_dir=None)
+        backfill.run()
+
+    _, _, raw_file = CheckpointStore(str(tmp_path / 'checkpoint.db')).get('PL', 2023, 'scorers')
+    with open(raw_file, encoding='utf-8') as f:
+        scorers = json.load(f)['scorers']
+    assert len(scorers) == ENDPOINT_PARAMS['scorers']['limit']
+
+
+def test_failed_league_season_is_not_published(tmp_path, monkeypatch):
+    # SA'nın maç yüklemesi hata verir: puan durumu da dahil hiçbir tablosu yayınlanmamalı
+    load_matches = DatabaseLoader.load_matches
+
+    def failing_load_matches(self, matches_df, season_id):
+        code, = self.cursor.execute("SELECT competition_code FROM seasons WHERE season_id = ?", (season_id,)).fetchone()
+        if code == 'SA':
+            raise RuntimeError("maç yüklemesi başarısız")
+        return load_matches(self, matches_df, season_id)
+
+    monkeypatch.setattr(DatabaseLoader, 'load_matches', failing_load_matches)
+    db_path = str(tmp_path / 'football_data.db')
+    with MockFootballDataServer(quota_per_minute=None) as server:
+        extractor = FootballDataExtractor(base_url=server.base_url, api_key='test', raw_path=str(tmp_path / 'raw'),
+                                          request_delay=0)
+        Backfill(['PL', 'SA'], [2023], endpoints=['standings', 'matches'], db_path=db_path,
+                 checkpoint_path=str(tmp_path / 'checkpoint.db'), request_delay=0,
+                 extractor=extractor, snapshot_dir=None).run()
+
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("SELECT competition_code, season_year FROM seasons").fetchall() == [('PL', 2023)]
+    assert conn.execute("SELECT COUNT(DISTINCT season_id) FROM standings").fetchone()[0] == 1
+    assert conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0] > 0
+    conn.close()
+
+    store = CheckpointStore(str(tmp_path / 'checkpoint.db'))
+    for endpoint in ('standings', 'matches'):
+        assert store.get('PL', 2023, endpoint)[0] == LOADED
+        assert store.get('SA', 2023, endpoint)[0] == DOWNLOADED
@@ -0,0 +1,22 @@
+# tests/test_data_validator.py
+# Zorunlu metin alanları boş ya da yalnızca boşluksa satır karantinaya
+# alınmalı; kolon tipi object, str (pandas 3 varsayılanı) ya da string olabilir.
+import pandas as pd
+import pytest
+
+from src.validators.data_validator import DataValidator
+
+
+@pytest.mark.parametrize('dtype', [object, 'str', 'string'])
+def test_blank_required_text_is_quarantined(dtype):
+    df = pd.DataFrame({
+        'match_id': [1, 2, 3, 4],
+        'referee_id': [10, 11, 12, 13],
+        'referee_name': pd.Series(['Michael Oliver', '  ', '', None], dtype=dtype),
+        'role': ['REFEREE'] * 4,
+    })
+    valid, quarantine = DataValidator().validate_officials(df)
+
+    assert valid['match_id'].tolist() == [1]
+    assert quarantine['record_key'].tolist() == ['2', '3', '4']
+    assert set(quarantine['reason']) == {'referee_name: boş'}
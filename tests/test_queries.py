@@ -0,0 +1,131 @@
+# tests/test_queries.py
+# src/database/queries.py'deki adlandırılmış sorguların planlarını büyük bir
+# sentetik veritabanında (schema.sql indeksleriyle, ~80.000 maç) kontrol eder:
+# planlar EXPECTED_PLANS ile aynı olmalı ve hiçbir sorgu matches tablosunu
+# tamamen taramamalı. Ayrıca sorguların gecikme histogramına yazıldığını test eder.
+import random
+import re
+import sqlite3
+
+import pytest
+
+from src.database.queries import (QUERIES, EXPECTED_PLANS, PARAM_PATTERN, explain, run_query, read_query,
+                                  latency_histograms, reset_latencies)
+from src.loaders.database_loader import SCHEMA_PATH
+
+COMPETITIONS = ['PL', 'PD', 'SA', 'BL1', 'FL1']
+SEASONS = range(1984, 2024)
+N_TEAMS = 20
+
+# FROM/JOIN matches [AS] takma_ad
+MATCHES_ALIAS_PATTERN = re.compile(
+    r'\b(?:FROM|JOIN)\s+matches\b(?:\s+(?:AS\s+)?(?!WHERE\b|JOIN\b|ON\b|GROUP\b|ORDER\b|LIMIT\b|UNION\b)(\w+))?',
+    re.IGNORECASE)
+
+
+def _synthetic_rows(rng):
+    """Her lig-sezonda 20 takımlı çift devreli fikstür; son sezonlar yarıda kalır"""
+    seasons, standings, matches, referee_stats = [], [], [], []
+    match_id = 0
+    for c, code in enumerate(COMPETITIONS):
+        pool = list(range(c * 100 + 1, c * 100 + 41))
+        for year in SEASONS:
+            season_id = len(seasons) + 1
+            seasons.append((season_id, code, f'{code} League', year))
+            teams = rng.sample(pool, N_TEAMS)
+            for position, team_id in enumerate(teams, 1):
+                points = rng.randint(20, 95)
+                standings.append((season_id, team_id, position, 38, points, rng.randint(20, 100),
+                                  rng.randint(20, 100), points / 38))
+            fixtures = [(h, a) for h in teams for a in teams if h != a]
+            for matchday, (home, away) in enumerate(fixtures):
+                match_id += 1
+                played = year < 2023 or matchday < len(fixtures) // 2
+                home_score, away_score = (rng.randint(0, 4), rng.randint(0, 4)) if played else (None, None)
+                matches.append((match_id, season_id, f'{year}-08-01', matchday // 10 + 1, home, away,
+                                home_score, away_score, 'FINISHED' if played else 'SCHEDULED',
+                                None if not played else home_score + away_score,
+                                None if not played else int(home_score > away_score),
+                                None if not played else int(home_score < away_score)))
+            for referee_id in rng.sample(range(1, 301), 20):
+                referee_stats.append((season_id, referee_id, 19, 8, 5, 6, 50, 42.1, 2.63))
+    return seasons, standings, matches, referee_stats
+
+
+@pytest.fixture(scope='module')
+def conn(tmp_path_factory):
+    db_path = tmp_path_factory.mktemp('queries') / 'football_data.db'
+    conn = sqlite3.connect(db_path)
+    with open(SCHEMA_PATH, encoding='utf-8') as f:
+        conn.executescript(f.read())
+
+    seasons, standings, matches, referee_stats = _synthetic_rows(random.Random(0))
+    conn.executemany("INSERT INTO teams (team_id, team_name) VALUES (?, ?)",
+                     [(team_id, f'Takım {team_id}') for team_id in {row[1] for row in standings}])
+    conn.executemany("INSERT INTO referees (referee_id, referee_name) VALUES (?, ?)",
+                     [(i, f'Hakem {i}') for i in range(1, 301)])
+    conn.executemany("INSERT INTO seasons (season_id, competition_code, competition_name, season_year) "
+                     "VALUES (?, ?, ?, ?)", seasons)
+    conn.executemany("INSERT INTO standings (season_id, team_id, position, played_games, points, goals_for, "
+                     "goals_against, points_per_game) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", standings)
+    conn.executemany("INSERT INTO matches (match_id, season_id, match_date, matchday, home_team_id, away_team_id, "
+                     "home_score, away_score, status, total_goals, is_home_win, is_away_win) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", matches)
+    conn.executemany("INSERT INTO referee_season_stats VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", referee_stats)
+    conn.commit()
+    assert conn.execute("SELECT COUNT(*) FROM matches").fetchone()[0] >= 75_000
+
+    yield conn
+    conn.close()
+
+
+def _params(conn, query):
+    """Sorgunun istediği parametreler için veritabanından gerçek değerler"""
+    season_id, home, away = conn.execute(
+        "SELECT season_id, home_team_id, away_team_id FROM matches WHERE match_id = 1").fetchone()
+    values = {'season_id': season_id, 'team_a': home, 'team_b': away, 'team_name': f'Takım {home}'}
+    return {name: values[name] for name in PARAM_PATTERN.findall(query)}
+
+
+def full_matches_scans(query, plan):
+    """Planda matches tablosunu (takma adıyla da) tamamen tarayan adımlar"""
+    names = {'matches'} | {alias for alias in MATCHES_ALIAS_PATTERN.findall(query) if alias}
+    return [line for line in plan if line.split()[:1] == ['SCAN'] and line.split()[1] in names]
+
+
+def test_every_query_has_recorded_plan():
+    assert set(QUERIES) == set(EXPECTED_PLANS)
+
+
+@pytest.mark.parametrize('name', list(QUERIES))
+def test_plan_matches_recorded(conn, name):
+    assert explain(conn, name) == EXPECTED_PLANS[name], \
+        f"{name} planı değişti; `python src/database/queries.py` ile kontrol edip EXPECTED_PLANS'ı güncelleyin"
+
+
+@pytest.mark.parametrize('name', list(QUERIES))
+def test_no_full_scan_of_matches(conn, name):
+    assert full_matches_scans(QUERIES[name], explain(conn, name)) == []
+
+
+def test_full_scan_is_detected(conn, monkeypatch):
+    # Eski test_queries.py'deki gibi sezon filtresiz sıralama tüm tabloyu tarar
+    query = "SELECT m.match_id FROM matches m ORDER BY m.total_goals DESC LIMIT 10"
+    monkeypatch.setitem(QUERIES, 'all_time_goals', query)
+    assert full_matches_scans(query, explain(conn, 'all_time_goals')) == ['SCAN m']
+
+
+def test_latency_histograms(conn):
+    reset_latencies()
+    for name, query in QUERIES.items():
+        for _ in range(3):
+            run_query(conn, name, **_params(conn, query))
+    df = read_query(conn, 'standings', **_params(conn, QUERIES['standings']))
+    assert len(df) == N_TEAMS
+
+    histograms = latency_histograms()
+    assert set(histograms) == set(QUERIES)
+    assert histograms['standings']['count'] == 4
+    for h in histograms.values():
+        assert sum(count for _, count in h['buckets']) == h['count']
+        assert 0 < h['p50_ms'] <= h['p95_ms'] <= h['p99_ms'] <= h['max_ms']
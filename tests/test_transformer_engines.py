@@ -0,0 +1,112 @@
+# tests/test_transformer_engines.py
+# pandas ve Polars dönüştürme motorlarının aynı çıktıyı ürettiğini kontrol eder:
+# yükleyiciye verilen DataFrame'ler, CSV dosyaları (bayt bayt) ve Parquet içeriği.
+# Girdiler mock sunucunun sentetik verileri ve elle bozulmuş bir lig-sezondur.
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from src.extractors.mock_server import synthetic_payloads
+from src.transformers.engines import ENGINES, get_engine
+from src.transformers.football_data_transformer import FootballDataTransformer, find_latest_raw_files
+
+pl = pytest.importorskip('polars')
+
+TRANSFORMS = ['transform_standings', 'transform_matches', 'transform_match_officials',
+              'transform_squads', 'transform_scorers']
+SOURCES = {'transform_standings': 'standings', 'transform_matches': 'matches',
+           'transform_match_officials': 'matches', 'transform_squads': 'squads', 'transform_scorers': 'scorers'}
+
+
+def _messy_payloads():
+    """Eksik, boş ve tipine uymayan alanlar içeren lig-sezon"""
+    payloads = synthetic_payloads('FL1', 2022, n_teams=6, played_rounds=4, seed=3)
+
+    table = payloads['standings']['standings'][0]['table']
+    for i, row in enumerate(table):
+        row['form'] = ['W,D,L', '', None, 'L,L,W,D,W', 'D', None][i]
+    table[0]['team'].pop('shortName')
+
+    matches = payloads['matches']['matches']
+    matches[0]['score']['fullTime'] = {'home': '2', 'away': 1.5}
+    matches[1]['score']['halfTime'] = {'home': 'x', 'away': None}
+    matches[2]['utcDate'] = matches[2]['utcDate'].replace('Z', '.250Z')
+    matches[3]['utcDate'] = 'tarih yok'
+    matches[4]['homeTeam'] = None
+    matches[5]['matchday'] = None
+    matches[6]['status'] = None
+    matches[7]['referees'] = [{'id': 99, 'name': 'Yedek Hakem', 'type': None, 'nationality': 'France'}]
+
+    scorers = payloads['scorers']['scorers']
+    scorers[0]['playedMatches'] = 0
+    scorers[1]['penalties'] = None
+    scorers[2]['player']['shirtNumber'] = 'on'
+    return payloads
+
+
+@pytest.fixture(scope='module')
+def raw_groups(tmp_path_factory):
+    raw_path = tmp_path_factory.mktemp('raw')
+    seasons = {('PL', 2021): synthetic_payloads('PL', 2021, seed=1),
+               ('PD', 2023): synthetic_payloads('PD', 2023, played_rounds=10, seed=2),
+               ('SA', 2024): synthetic_payloads('SA', 2024, played_rounds=0, seed=4),
+               ('FL1', 2022): _messy_payloads()}
+    for (code, season), payloads in seasons.items():
+        # Yoksa dönüştürücü şimdiki zamanı yazar; iki motorun çıktısı karşılaştırılabilsin
+        payloads['standings']['lastUpdated'] = '2024-01-01T00:00:00Z'
+        for kind, data in payloads.items():
+            with open(raw_path / f"{code}_{kind}_{season}_20240101_000000.json", 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+    return find_latest_raw_files(str(raw_path))
+
+
+@pytest.fixture(scope='module')
+def transformers():
+    return {name: FootballDataTransformer(engine=name) for name in ENGINES}
+
+
+@pytest.mark.parametrize('method', TRANSFORMS)
+def test_dataframes_identical(raw_groups, transformers, method):
+    for files in raw_groups.values():
+        frames = [getattr(transformer, method)(files[SOURCES[method]]) for transformer in transformers.values()]
+        pd.testing.assert_frame_equal(frames[0], frames[1])
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'parquet'])
+def test_batch_files_identical(raw_groups, transformers, tmp_path, fmt):
+    outputs = {name: transformer.transform_batch(raw_groups, output_path=str(tmp_path / name), fmt=fmt)
+               for name, transformer in transformers.items()}
+    assert [os.path.basename(p) for p in outputs['pandas']] == [os.path.basename(p) for p in outputs['polars']]
+    assert len(outputs['pandas']) == 5 * len(raw_groups)
+
+    for pandas_path, polars_path in zip(outputs['pandas'], outputs['polars']):
+        if fmt == 'csv':
+            with open(pandas_path, 'rb') as a, open(polars_path, 'rb') as b:
+                assert a.read() == b.read(), os.path.basename(pandas_path)
+        else:
+            assert pl.read_parquet(pandas_path).equals(pl.read_parquet(polars_path)), os.path.basename(pandas_path)
+
+
+def test_messy_values(raw_groups, transformers):
+    """Tipine uymayan skorlar boş kalır, formu olmayan takım 0 form puanı alır"""
+    files = raw_groups[('FL1', 2022)]
+    matches = transformers['polars'].transform_matches(files['matches'])
+    assert matches.loc[0, 'home_score'] == 2 and pd.isna(matches.loc[0, 'away_score'])
+    assert pd.isna(matches.loc[3, 'utc_date']) and matches.loc[2, 'utc_date'].microsecond == 250000
+
+    standings = transformers['polars'].transform_standings(files['standings'])
+    assert standings['form_points'].tolist() == [4, 0, 0, 7, 1, 0]
+
+
+def test_preseason_without_form(raw_groups, transformers):
+    """Hiç maç oynanmamış sezon: oranlar boş, form kolonu yoksa form_points eklenmez"""
+    standings = transformers['polars'].transform_standings(raw_groups[('SA', 2024)]['standings'])
+    assert standings['win_percentage'].isna().all()
+    assert 'form_points' not in standings.columns
+
+
+def test_unknown_engine():
+    with pytest.raises(ValueError):
+        get_engine('spark')